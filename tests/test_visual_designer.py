@@ -0,0 +1,43 @@
+"""Tests for the matplotlib visual designer's property editing"""
+
+import unittest
+from unittest import mock
+
+from tools import visual_designer
+from tools.visual_designer import VisualDesigner, _EDIT_SPECS
+
+
+def _keep_initial(title, prompt, initialvalue=None, parent=None):
+    """simpledialog.askstring stand-in that presses OK on the prefilled value"""
+    return initialvalue
+
+
+class ListEditTest(unittest.TestCase):
+    def setUp(self):
+        # The edit path needs no figure, so skip __init__ and its Tk window
+        self.designer = VisualDesigner.__new__(VisualDesigner)
+        self.designer.unsaved = False
+
+    def _edit(self, elem, prop_name, answer):
+        with mock.patch.object(visual_designer.simpledialog, 'askstring', answer):
+            return self.designer._ask_by_spec(_EDIT_SPECS[prop_name], elem, prop_name, None)
+
+    def test_unchanged_list_stays_saved(self):
+        for prop_name, value in (('items', ['One', 'Two']),
+                                 ('before_weights', [0.5, 0.3, 0.8]),
+                                 ('steps', [{'label': 'Load'}, {'label': 'Split'}])):
+            with self.subTest(prop_name=prop_name):
+                elem = {'type': 'checklist', prop_name: value}
+                self.assertFalse(self._edit(elem, prop_name, _keep_initial))
+                self.assertEqual(elem[prop_name], value)
+                self.assertFalse(self.designer.unsaved)
+
+    def test_changed_list_marks_unsaved(self):
+        elem = {'type': 'checklist', 'items': ['One', 'Two']}
+        self.assertTrue(self._edit(elem, 'items', lambda *a, **k: 'One\nThree'))
+        self.assertEqual(elem['items'], ['One', 'Three'])
+        self.assertTrue(self.designer.unsaved)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -4,22 +4,549 @@ Visual Presentation Designer v7
 Element thumbnails, full preview with animations, undo/redo support
 """
 
+import hashlib
+import logging
+import math
+import re
 import sys
+import time
+from bisect import bisect_right
+from collections import namedtuple
+from contextlib import contextmanager
+from dataclasses import dataclass
+from functools import lru_cache
+from itertools import accumulate
 from pathlib import Path
+from types import MappingProxyType
 import matplotlib
 matplotlib.use('TkAgg')
 import matplotlib.pyplot as plt
-from matplotlib.patches import FancyBboxPatch, Circle, Rectangle, Wedge
+from matplotlib.patches import FancyArrowPatch, FancyBboxPatch, Circle, Rectangle, Wedge
+from matplotlib.collections import EllipseCollection, PatchCollection, PolyCollection
+from matplotlib.colors import to_rgba
+from matplotlib.text import Text
+from matplotlib.transforms import Bbox
 import numpy as np
-from tkinter import Tk, filedialog, simpledialog, messagebox
-import copy
-import json
+from tkinter import Tk, TclError, filedialog, simpledialog, messagebox
 
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from tools.schema import PresentationSchema, Step, LandingPage, SORTED_ELEMENTS
+from tools.generator import PresentationGenerator
 from core import PresentationStyle
 
+log = logging.getLogger(__name__)
+
+
+# Empty (N, 4) hit-region array: rows are [y_min, y_max, x_min, x_max]
+_NO_HITBOXES = np.empty((0, 4), dtype=np.float32)
+
+
+def _band_index(groups):
+    """Sort the regions of priority-ordered (name, bboxes) groups into bisectable bands
+
+    Returns (y_mins, reach, entries): entries are (y_min, y_max, x_min, x_max,
+    priority, name, index) sorted by y_min, and reach[k] is the highest y_max
+    among entries[:k + 1], which bounds how far back a lookup has to look.
+    """
+    entries = sorted((y0, y1, x0, x1, priority, name, i)
+                     for priority, (name, bboxes) in enumerate(groups)
+                     for i, (y0, y1, x0, x1) in enumerate(bboxes.tolist()))
+    y_mins = [entry[0] for entry in entries]
+    reach = list(accumulate((entry[1] for entry in entries), max))
+    return y_mins, reach, entries
+
+
+def _band_lookup(index, x, y):
+    """(name, index) of the highest-priority region containing (x, y), or None"""
+    y_mins, reach, entries = index
+    best = None
+    k = bisect_right(y_mins, y) - 1
+    while k >= 0 and reach[k] >= y:
+        y0, y1, x0, x1, priority, name, i = entries[k]
+        if y <= y1 and x0 <= x <= x1 and (best is None or (priority, i) < best[:2]):
+            best = (priority, i, name)
+        k -= 1
+    return (best[2], best[1]) if best else None
+
+
+_NO_BANDS = _band_index([])
+
+
+# Viridis resolved once to an RGBA table; index with _viridis()
+_VIRIDIS_LUT = plt.cm.viridis(np.linspace(0, 1, 256))
+
+
+def _viridis(intensity):
+    """RGBA viridis color for an intensity in [0, 1], read straight from the LUT"""
+    return tuple(_VIRIDIS_LUT[min(int(intensity * 256), 255)])
+
+
+@lru_cache(maxsize=1024)
+def _trunc(s, n):
+    """Truncate a display string to n characters, reusing results across redraws"""
+    return s[:n]
+
+
+def _parse_numbers(text, dtype=float):
+    """Comma-separated numbers as a list, converted in one NumPy call
+
+    Blank entries are skipped; None if any entry is malformed or out of range.
+    """
+    try:
+        return np.array(text.replace(',', ' ').split(), dtype=dtype).tolist()
+    except (ValueError, OverflowError):
+        return None
+
+
+# Entry separators of the list editors, swallowing the whitespace around them
+_LINES_RE = re.compile(r'\s*\n\s*')
+_CSV_RE = re.compile(r'\s*,\s*')
+
+
+def _split_entries(text, sep):
+    """Whitespace-trimmed, non-empty entries of text split on the sep regex"""
+    return [part for part in sep.split(text.strip()) if part]
+
+
+def _clone(value):
+    """Copy a JSON-shaped value (nested dicts and lists of primitives)
+
+    Elements hold nothing else, so this skips deepcopy's memo and dispatch.
+    """
+    kind = type(value)
+    if kind is dict:
+        return {key: _clone(item) for key, item in value.items()}
+    if kind is list:
+        return [_clone(item) for item in value]
+    return value
+
+
+@lru_cache(maxsize=256)
+def _words(s, n):
+    """First n whitespace-separated words of a display string, reused across redraws"""
+    return tuple(s.split()[:n])
+
+
+def _ease_linear(t):
+    return t
+
+
+def _ease_elastic_out(t):
+    if t == 0 or t == 1:
+        return t
+    return math.pow(2, -10 * t) * math.sin((t - 0.075) * (2 * math.pi) / 0.3) + 1
+
+
+def _ease_bounce_out(t):
+    if t < 1/2.75:
+        return 7.5625 * t * t
+    elif t < 2/2.75:
+        t -= 1.5/2.75
+        return 7.5625 * t * t + 0.75
+    elif t < 2.5/2.75:
+        t -= 2.25/2.75
+        return 7.5625 * t * t + 0.9375
+    else:
+        t -= 2.625/2.75
+        return 7.5625 * t * t + 0.984375
+
+
+# Easing name -> function of normalized time t (0-1); unknown names fall back to linear
+_EASINGS = {
+    'linear': _ease_linear,
+    'ease_in': lambda t: t * t,
+    'ease_out': lambda t: 1 - (1 - t) ** 2,
+    'ease_in_out': lambda t: 3 * t * t - 2 * t * t * t,
+    'ease_in_cubic': lambda t: t * t * t,
+    'ease_out_cubic': lambda t: 1 - (1 - t) ** 3,
+    'elastic_out': _ease_elastic_out,
+    'bounce_out': _ease_bounce_out,
+}
+
+
+def _ease_elastic_out_array(t):
+    return np.where((t == 0) | (t == 1), t,
+                    np.power(2.0, -10 * t) * np.sin((t - 0.075) * (2 * np.pi) / 0.3) + 1)
+
+
+def _ease_bounce_out_array(t):
+    return np.select(
+        [t < 1/2.75, t < 2/2.75, t < 2.5/2.75],
+        [7.5625 * t * t,
+         7.5625 * (t - 1.5/2.75) ** 2 + 0.75,
+         7.5625 * (t - 2.25/2.75) ** 2 + 0.9375],
+        7.5625 * (t - 2.625/2.75) ** 2 + 0.984375)
+
+
+@dataclass
+class ElementView:
+    """Slotted snapshot of the element fields the preview reads every frame"""
+    __slots__ = ('type', 'x', 'y', 'speed')
+    type: str
+    x: float
+    y: float
+    speed: float
+
+
+# Preview timing window of each animation phase, as fractions of step progress
+_PHASE_RANGES = {
+    'immediate': (0.0, 0.2),
+    'early': (0.2, 0.4),
+    'middle': (0.4, 0.6),
+    'late': (0.6, 0.8),
+    'final': (0.8, 1.0)
+}
+_EARLY_RANGE = _PHASE_RANGES['early']
+
+# Shared read-only defaults for elements without a position or start/end
+# point; stores into an element always use fresh dicts
+_DEFAULT_POS = MappingProxyType({'x': 50, 'y': 50})
+_DEFAULT_START = MappingProxyType({'x': 30, 'y': 50})
+_DEFAULT_END = MappingProxyType({'x': 70, 'y': 50})
+
+
+def _endpoints(elem, x, y, half):
+    """(sx, sy, ex, ey) of an arrow-like element; missing points sit half to either side of (x, y)"""
+    start, end = elem.get('start'), elem.get('end')
+    sx, sy = (x - half, y) if start is None else (start['x'], start['y'])
+    ex, ey = (x + half, y) if end is None else (end['x'], end['y'])
+    return sx, sy, ex, ey
+
+
+def _rect_verts(x0, y0, w, h):
+    """(N, 4, 2) corners of axis-aligned rectangles from lower-left corners, for PolyCollection"""
+    x0, y0, w, h = np.broadcast_arrays(x0, y0, w, h)
+    return np.stack([np.column_stack([x0, y0]), np.column_stack([x0 + w, y0]),
+                     np.column_stack([x0 + w, y0 + h]), np.column_stack([x0, y0 + h])], axis=1)
+
+
+@lru_cache(maxsize=256)
+def _neuron_layout(layers):
+    """(fx, fy, layer) arrays of neuron centers for a tuple of layer sizes
+
+    fx and fy are fractions of the element box: layers are spaced evenly across
+    its width and each layer's neurons evenly down its height.
+    """
+    sizes = np.maximum(np.asarray(layers, dtype=int), 0)
+    layer = np.repeat(np.arange(len(sizes)), sizes)
+    index = np.arange(len(layer)) - np.repeat(np.cumsum(sizes) - sizes, sizes)
+    fx = (layer + 1) / (len(sizes) + 1)
+    fy = (index + 1) / (sizes[layer] + 1)
+    for arr in (fx, fy, layer):
+        arr.flags.writeable = False  # shared between callers through the cache
+    return fx, fy, layer
+
+
+@lru_cache(maxsize=64)
+def _particle_phases(n):
+    """(phase, jitter) of an n-particle flow: stagger along the path and vertical sine offset"""
+    i = np.arange(n)
+    phase, jitter = i / n, np.sin(i * 1.5)
+    phase.flags.writeable = jitter.flags.writeable = False
+    return phase, jitter
+
+
+@lru_cache(maxsize=16)
+def _heatmap_cells(n):
+    """(row, col, weight) of the n*n heatmap cells in row-major order"""
+    i, j = np.divmod(np.arange(n * n), n)
+    # Fixed demo weights
+    weight = 0.3 + 0.7 * ((i + j) % 3) / 2
+    for arr in (i, j, weight):
+        arr.flags.writeable = False
+    return i, j, weight
+
+
+# Element type and property groups tested on every draw, hit test and edit
+_TEXT_TYPES = frozenset({'text', 'typewriter_text'})
+_ARROW_TYPES = frozenset({'arrow', 'arc_arrow'})
+_ENDPOINT_TYPES = _ARROW_TYPES | {'particle_flow'}
+_SPEED_TYPES = frozenset({'particle_flow', 'typewriter_text', 'token_flow', 'neural_network'})
+_WEIGHT_PROPS = frozenset({'before_weights', 'after_weights'})
+
+# Palette keys cycled through for vector_3d vectors without their own color
+_VECTOR_COLORS = ('primary', 'secondary', 'accent', 'warning', 'success')
+
+# Isometric projections of (x, y, z) onto preview offsets (dx, dy); vector_3d
+# also scales its components by (3, 1.5, 3)
+_SCATTER_PROJ = np.array([[2, -0.5, 0], [0, 0.3, 2]])
+_VECTOR_PROJ = np.array([[3, -0.45, 0], [0, 0.3, 3]])
+
+
+def _xyz(items, default):
+    """(N, 3) array of the x/y/z fields of point or vector dicts"""
+    return np.array([[item.get('x', default), item.get('y', default), item.get('z', default)]
+                     for item in items], dtype=float).reshape(-1, 3)
+
+
+# Array versions of _EASINGS, indexed by easing id (position in _EASING_NAMES)
+_EASING_NAMES = tuple(_EASINGS)
+_ARRAY_EASINGS = tuple({**_EASINGS, 'elastic_out': _ease_elastic_out_array,
+                        'bounce_out': _ease_bounce_out_array}[name] for name in _EASING_NAMES)
+_EASING_IDS = {name: i for i, name in enumerate(_EASING_NAMES)}
+
+# Easing curves sampled once on a fixed grid (row per easing id); linear
+# interpolation between samples stays within 5e-4 of the exact curves
+_EASING_LUT_SIZE = 1024
+_EASING_LUT = np.array([ease(np.linspace(0.0, 1.0, _EASING_LUT_SIZE))
+                        for ease in _ARRAY_EASINGS]).ravel()
+
+
+def _eased(t, easing_ids):
+    """Look up eased values of normalized times t (0-1) in the easing LUT"""
+    idx = t * (_EASING_LUT_SIZE - 1)
+    i0 = np.minimum(idx.astype(int), _EASING_LUT_SIZE - 2)
+    flat = easing_ids * _EASING_LUT_SIZE + i0
+    lo = _EASING_LUT[flat]
+    return lo + (idx - i0) * (_EASING_LUT[flat + 1] - lo)
+
+
+def _vectorized_alpha(progress, starts, ends, easing_ids):
+    """Eased alpha of every element of a step at one animation progress"""
+    started = progress >= starts
+    alphas = (started & (progress >= ends)).astype(float)
+    # Only elements mid-transition need the easing lookup
+    active = np.flatnonzero(started & (progress < ends))
+    if active.size:
+        s = starts[active]
+        alphas[active] = _eased((progress - s) / (ends[active] - s), easing_ids[active])
+    return alphas
+
+
+# Editable property spec: element key read with default, optional display
+# caster, and the editor kind used by the properties panel
+PropSpec = namedtuple('PropSpec', 'name key default caster kind')
+
+
+def _sshort(value, n=15):
+    """Display string of at most n characters; short strings are returned as-is"""
+    if type(value) is not str:
+        value = str(value)
+    return value if len(value) <= n else _trunc(value, n)
+
+
+def _label(n):
+    """Caster showing a value as a display string of at most n characters"""
+    return lambda value: _sshort(value, n)
+
+
+def _count(unit):
+    """Caster summarizing a list value by its length"""
+    return lambda value: f'{len(value)} {unit}'
+
+
+def _coord(axis):
+    """Caster reading one integer coordinate of a point dict"""
+    return lambda point: int(point[axis])
+
+
+# Arrow-like elements are placed by start/end points; each adds its own
+# specs after the shared endpoint ones
+_ENDPOINT_SPECS = (
+    PropSpec('start_x', 'start', _DEFAULT_START, _coord('x'), 'start'),
+    PropSpec('start_y', 'start', _DEFAULT_START, _coord('y'), 'start'),
+    PropSpec('end_x', 'end', _DEFAULT_END, _coord('x'), 'end'),
+    PropSpec('end_y', 'end', _DEFAULT_END, _coord('y'), 'end'),
+)
+_EXTRA_ARROW_PROPS = {
+    'arrow': (),
+    'arc_arrow': (
+        PropSpec('arc_height', 'arc_height', 15, int, 'num'),
+        PropSpec('direction', 'direction', 'up', None, 'choice'),
+    ),
+    'particle_flow': (
+        PropSpec('num_particles', 'num_particles', 30, None, 'num'),
+        PropSpec('particle_size', 'particle_size', 30, None, 'num'),
+        PropSpec('spread', 'spread', 0.5, None, 'float'),
+    ),
+}
+
+# Element type -> editable property specs, built once and shared by all calls
+_PROP_SCHEMA = {
+    'text': (
+        PropSpec('content', 'content', '', _label(15), 'str'),
+    ),
+    'typewriter_text': (
+        PropSpec('content', 'content', '', _label(15), 'str'),
+        PropSpec('show_cursor', 'show_cursor', True, None, 'bool'),
+        PropSpec('cursor_blink_rate', 'cursor_blink_rate', 2.0, None, 'float'),
+    ),
+    'code_block': (
+        PropSpec('code', 'code', '', _label(15), 'str'),
+        PropSpec('language', 'language', 'python', None, 'str'),
+        PropSpec('width', 'width', 60, int, 'num'),
+        PropSpec('height', 'height', 25, int, 'num'),
+    ),
+    'code_execution': (
+        PropSpec('code', 'code', '', _label(15), 'str'),
+        PropSpec('output', 'output', '', _label(15), 'str'),
+        PropSpec('language', 'language', 'python', None, 'str'),
+        PropSpec('width', 'width', 70, int, 'num'),
+    ),
+    'box': (
+        PropSpec('title', 'title', '', _label(15), 'str'),
+        PropSpec('content', 'content', '', _label(15), 'str'),
+        PropSpec('width', 'width', 60, int, 'num'),
+        PropSpec('height', 'height', 20, int, 'num'),
+    ),
+    'comparison': (
+        PropSpec('left_title', 'left_title', 'Before', _label(12), 'str'),
+        PropSpec('right_title', 'right_title', 'After', _label(12), 'str'),
+        PropSpec('width', 'width', 80, int, 'num'),
+        PropSpec('height', 'height', 30, int, 'num'),
+    ),
+    'conversation': (
+        PropSpec('messages', 'messages', (), _count('msgs'), 'list'),
+        PropSpec('width', 'width', 70, int, 'num'),
+        PropSpec('stagger', 'stagger', True, None, 'bool'),
+    ),
+    'bullet_list': (
+        PropSpec('items', 'items', (), _count('items'), 'list'),
+        PropSpec('bullet_char', 'bullet_char', '*', None, 'str'),
+        PropSpec('spacing', 'spacing', 6.0, None, 'float'),
+        PropSpec('stagger', 'stagger', True, None, 'bool'),
+    ),
+    'checklist': (
+        PropSpec('items', 'items', (), _count('items'), 'list'),
+        PropSpec('spacing', 'spacing', 6.5, None, 'float'),
+        PropSpec('fontsize', 'fontsize', 18, None, 'num'),
+    ),
+    'timeline': (
+        PropSpec('events', 'events', (), _count('events'), 'list'),
+        PropSpec('orientation', 'orientation', 'horizontal', None, 'choice'),
+        PropSpec('width', 'width', 80, int, 'num'),
+        PropSpec('height', 'height', 25, int, 'num'),
+    ),
+    'flow': (
+        PropSpec('steps', 'steps', (), _count('steps'), 'list'),
+        PropSpec('width', 'width', 80, int, 'num'),
+        PropSpec('stagger', 'stagger', True, None, 'bool'),
+    ),
+    'grid': (
+        PropSpec('items', 'items', (), _count('items'), 'list'),
+        PropSpec('columns', 'columns', 2, None, 'num'),
+        PropSpec('rows', 'rows', 2, None, 'num'),
+        PropSpec('cell_width', 'cell_width', 30, int, 'num'),
+        PropSpec('cell_height', 'cell_height', 18, int, 'num'),
+    ),
+    'stacked_boxes': (
+        PropSpec('items', 'items', (), _count('items'), 'list'),
+        PropSpec('base_width', 'base_width', 70, int, 'num'),
+        PropSpec('box_height', 'box_height', 12, int, 'num'),
+    ),
+    'neural_network': (
+        PropSpec('layers', 'layers', [3, 5, 5, 2], str, 'layers'),
+        PropSpec('width', 'width', 70, int, 'num'),
+        PropSpec('height', 'height', 50, int, 'num'),
+        PropSpec('show_connections', 'show_connections', True, None, 'bool'),
+    ),
+    'attention_heatmap': (
+        PropSpec('title', 'title', 'Attention', _label(15), 'str'),
+        PropSpec('tokens_x', 'tokens_x', (), _count('tokens'), 'list'),
+        PropSpec('width', 'width', 50, int, 'num'),
+        PropSpec('height', 'height', 50, int, 'num'),
+        PropSpec('show_values', 'show_values', True, None, 'bool'),
+    ),
+    'token_flow': (
+        PropSpec('input_text', 'input_text', '', _label(15), 'str'),
+        PropSpec('width', 'width', 80, int, 'num'),
+        PropSpec('height', 'height', 40, int, 'num'),
+        PropSpec('show_embeddings', 'show_embeddings', True, None, 'bool'),
+    ),
+    'model_comparison': (
+        PropSpec('models', 'models', (), _count('models'), 'list'),
+        PropSpec('width', 'width', 85, int, 'num'),
+        PropSpec('height', 'height', 50, int, 'num'),
+    ),
+    'similarity_meter': (
+        PropSpec('score', 'score', 75, int, 'num'),
+        PropSpec('radius', 'radius', 8, int, 'num'),
+        PropSpec('label', 'label', 'Similarity', _label(15), 'str'),
+    ),
+    'progress_bar': (
+        PropSpec('current', 'current', 5, None, 'num'),
+        PropSpec('total', 'total', 10, None, 'num'),
+        PropSpec('width', 'width', 30, int, 'num'),
+        PropSpec('label', 'label', 'Progress', _label(15), 'str'),
+    ),
+    'weight_comparison': (
+        PropSpec('before_weights', 'before_weights', (), _count('vals'), 'list'),
+        PropSpec('after_weights', 'after_weights', (), _count('vals'), 'list'),
+    ),
+    'parameter_slider': (
+        PropSpec('label', 'label', 'Parameter', _label(15), 'str'),
+        PropSpec('current_value', 'current_value', 0.5, None, 'float'),
+        PropSpec('min_value', 'min_value', 0.0, None, 'float'),
+        PropSpec('max_value', 'max_value', 1.0, None, 'float'),
+        PropSpec('width', 'width', 40, int, 'num'),
+    ),
+    'scatter_3d': (
+        PropSpec('points', 'points', (), _count('pts'), 'list'),
+        PropSpec('camera_elev', 'camera_elev', 20.0, None, 'float'),
+        PropSpec('camera_azim', 'camera_azim', 45.0, None, 'float'),
+        PropSpec('rotate_camera', 'rotate_camera', False, None, 'bool'),
+    ),
+    'vector_3d': (
+        PropSpec('vectors', 'vectors', (), _count('vecs'), 'list'),
+        PropSpec('camera_elev', 'camera_elev', 20.0, None, 'float'),
+        PropSpec('camera_azim', 'camera_azim', 45.0, None, 'float'),
+        PropSpec('rotate_camera', 'rotate_camera', False, None, 'bool'),
+    ),
+}
+_PROP_SCHEMA.update((elem_type, _ENDPOINT_SPECS + extra)
+                    for elem_type, extra in _EXTRA_ARROW_PROPS.items())
+
+# Property edit dialog spec: value read from elem[key], or elem[container][key] for
+# point properties; bounds are (min, max) for numbers, the two options for a choice;
+# prompts is the dialog's (title, label), formatted once when the table is built
+EditSpec = namedtuple('EditSpec', 'kind container key default bounds prompts')
+
+
+def _dialog_prompts(kind, name, bounds):
+    """Title and label of the dialog editing property name"""
+    if kind == 'int':
+        return f"Edit {name}", f"{name} ({bounds[0]}-{bounds[1]}):"
+    return f"Edit {name}", f"{name}:"
+
+
+def _edit_specs(kind, names, default=None, bounds=None):
+    """Edit specs sharing a kind, default and bounds, one per top-level key"""
+    return {name: EditSpec(kind, None, name, default, bounds,
+                           _dialog_prompts(kind, name, bounds))
+            for name in names}
+
+
+# Property name -> edit dialog spec, dispatched by _edit_property
+_EDIT_SPECS = {
+    **{axis: EditSpec('int', 'position', axis, _DEFAULT_POS, (0, 100),
+                      _dialog_prompts('int', axis, (0, 100)))
+       for axis in 'xy'},
+    **{f'{container}_{axis}': EditSpec('int', container, axis, default, (0, 100),
+                                       _dialog_prompts('int', f'{container}_{axis}', (0, 100)))
+       for container, default in (('start', _DEFAULT_START), ('end', _DEFAULT_END))
+       for axis in 'xy'},
+    **_edit_specs('int', ('width', 'height', 'radius'), 20, (1, 100)),
+    **_edit_specs('int', ('score',), 75, (0, 100)),
+    **_edit_specs('int', ('num_particles',), 15, (5, 100)),
+    **_edit_specs('int', ('arc_height',), 10, (1, 50)),
+    **_edit_specs('int', ('current', 'total'), 10, (0, 1000)),
+    **_edit_specs('int', ('columns', 'rows', 'cell_width', 'cell_height',
+                          'fontsize', 'base_width', 'box_height', 'particle_size'), 10, (1, 200)),
+    **_edit_specs('float', ('current_value', 'min_value', 'max_value', 'spacing',
+                            'cursor_blink_rate', 'spread', 'camera_elev', 'camera_azim'), 0.5),
+    **_edit_specs('str', ('content', 'title', 'code', 'input_text', 'label', 'output',
+                          'left_title', 'right_title', 'language', 'bullet_char'), ''),
+    **_edit_specs('toggle', ('show_cursor', 'stagger', 'show_connections', 'show_values',
+                             'show_embeddings', 'rotate_camera'), True),
+    **_edit_specs('choice', ('orientation',), 'horizontal', ('horizontal', 'vertical')),
+    **_edit_specs('choice', ('direction',), 'up', ('up', 'down')),
+    **_edit_specs('list', ('items', 'steps', 'events', 'messages', 'models',
+                           'tokens_x', 'before_weights', 'after_weights',
+                           'points', 'vectors', 'comparison_rows')),
+    **_edit_specs('layers', ('layers',), (3, 5, 5, 2)),
+}
+
 
 class VisualDesigner:
     """Visual presentation designer with thumbnails, preview, and undo/redo"""
@@ -34,27 +561,80 @@ class VisualDesigner:
     PANEL_BORDER = '#2a2a3a'
     CANVAS_BG = '#0a0a0f'
 
+    # Canvas hit box half-extents by element type:
+    # (w_key, w_default, w_div, w_pad, h_key, h_default, h_div, h_pad), where
+    # half-width = elem[w_key] / w_div + w_pad (a None key uses the default as-is)
+    HITBOX_SPECS = {
+        'comparison': ('width', 50, 2, 3, 'height', 18, 2, 3),
+        'flow': ('width', 50, 2, 3, 'height', 18, 2, 3),
+        'grid': ('width', 50, 2, 3, 'height', 18, 2, 3),
+        'neural_network': ('width', 35, 2, 3, 'height', 22, 2, 3),
+        'bullet_list': (None, 18, 1, 0, None, 12, 1, 0),
+        'checklist': (None, 18, 1, 0, None, 12, 1, 0),
+    }
+    DEFAULT_HITBOX_SPEC = ('width', 18, 2, 5, 'height', 10, 2, 5)
+    # Canvas units an element may draw past its hit box (labels, badges); elements
+    # whose padded box misses the view are skipped
+    CULL_MARGIN = 10
+
+    # Redraw coalescing window (~one 60 Hz frame)
+    REDRAW_INTERVAL_MS = 16
+
+    # Preview playback: progress steps through PREVIEW_FRAMES whole frames, one per
+    # PREVIEW_FRAME_MS of wall time
+    PREVIEW_FRAME_MS = 33
+    PREVIEW_FRAMES = 50
+    # Pixel budget for blitted preview frames kept for replay; a frame of the default
+    # window is about 3.6 MB, so this holds roughly a third of a loop
+    PREVIEW_FRAME_CACHE_BYTES = 64 * 2**20
+    # Quiet time after the last designer edit before an open preview re-renders
+    PREVIEW_REFRESH_MS = 100
+
+    # Editor shortcuts: key -> (method name, save undo state first)
+    KEY_BINDINGS = {
+        'ctrl+z': ('_undo', False),
+        'ctrl+shift+z': ('_redo', False),
+        'ctrl+Z': ('_redo', False),  # Shift makes Z uppercase
+        'escape': ('_clear_selection', False),
+        'delete': ('_delete_selected', True),
+        'backspace': ('_delete_selected', True),
+        'd': ('_duplicate_selected', True),
+        'e': ('_edit_selected', True),
+        's': ('_save', False),
+        'o': ('_open_file', False),
+        'n': ('_new_file', False),
+        'g': ('_generate', False),
+        'p': ('_open_preview_window', False),
+        'left': ('_prev_step', False),
+        'right': ('_next_step', False),
+        'q': ('_quit', False),
+    }
+
     def __init__(self, schema_path: str = None):
         self.colors = PresentationStyle.COLORS
+        # Palette pre-parsed to RGBA so draws skip the hex conversion
+        self._rgba = {name: to_rgba(value) for name, value in self.colors.items()}
 
         # State
         self.current_step = 0
-        self.selected_element = None
+        # Selected element index and its dict, kept in step by the selected_element
+        # property and _sync_current_elements()
+        self._selected_idx = None
+        self._selected_elem = None
         self.dragging = False
         self.drag_offset = (0, 0)
         self.placing_element = None
         self.scroll_offset = 0
         self.unsaved = False
 
-        # UI button regions (initialized here, populated in draw functions)
+        # UI button regions (initialized here, populated in draw functions).
+        # Each clickable group keeps its regions in an (N, 4) array for
+        # vectorized hit tests, with the button payloads in a parallel list.
         self.elem_boxes = []
-        self.prop_buttons = []
-        self.phase_buttons = []
-        self.easing_buttons = []
-        self.effect_buttons = []
-        self.slider_buttons = []
-        self.nav_buttons = []
-        self.tab_buttons = []
+        self._reset_panel_buttons()
+        self.nav_bboxes, self.nav_vals = _NO_HITBOXES, []
+        # Bisectable click indexes over the regions above, rebuilt after each panel draw
+        self._left_click_index = self._right_click_index = self._nav_click_index = _NO_BANDS
 
         # Properties panel tab state: 'props' or 'anim'
         self.props_tab = 'props'
@@ -70,14 +650,110 @@ class VisualDesigner:
         self.scaling = False
         self.scale_start = None
 
+        # Hidden Tk root shared by all dialogs, created on first use
+        self._dialog_root = None
+
         # Preview state
         self.preview_fig = None
         self.preview_ax = None
+        # False once the preview window is closed, so pending animation ticks bail out
+        self._preview_alive = False
+        # Designer edits mark the preview dirty; its debounce timer re-renders it once
+        self._preview_dirty = False
+        self._preview_timer = None
         self.animation_progress = 0.0
         self.animation_playing = False
         self.animation_loop = False
         self.frame_time = 0.0  # Continuous time for effects
         self.particle_seeds = {}  # Store random seeds for consistent particle rendering
+        # Property edit asker per EditSpec kind, bound once
+        self._edit_askers = {
+            'int': self._ask_int,
+            'float': self._ask_float,
+            'str': self._ask_string,
+            'toggle': self._toggle_bool,
+            'choice': self._cycle_choice,
+            'layers': self._ask_layers,
+        }
+        # Preview renderer per element type, bound once
+        self._preview_renderers = {
+            'text': self._preview_text,
+            'typewriter_text': self._preview_typewriter_text,
+            'box': self._preview_box,
+            'bullet_list': self._preview_bullet_list,
+            'comparison': self._preview_comparison,
+            'arrow': self._preview_arrow,
+            'arc_arrow': self._preview_arc_arrow,
+            'similarity_meter': self._preview_similarity_meter,
+            'progress_bar': self._preview_progress_bar,
+            'neural_network': self._preview_neural_network,
+            'particle_flow': self._preview_particle_flow,
+            'code_block': self._preview_code_block,
+            'code_execution': self._preview_code_execution,
+            'checklist': self._preview_checklist,
+            'flow': self._preview_flow,
+            'grid': self._preview_grid,
+            'scatter_3d': self._preview_scatter_3d,
+            'vector_3d': self._preview_vector_3d,
+            'attention_heatmap': self._preview_attention_heatmap,
+            'parameter_slider': self._preview_parameter_slider,
+            'token_flow': self._preview_token_flow,
+        }
+        # Preview patches reused across frames: (id(elem), role) -> Patch
+        self._preview_artists = {}
+        # Blitted playback: artists still fading in are drawn over a cached background
+        # of everything else, recaptured when the set of settled elements changes
+        self._preview_moving = []
+        self._preview_static_key = None
+        self._preview_bg = None
+        self._preview_bg_key = None
+        # Replayable blitted frames of one (id(step), edit rev, canvas size):
+        # frame index -> (background key, region bbox, region pixels, bytes)
+        self._preview_frames = {}
+        self._preview_frames_for = None
+        self._preview_frames_bytes = 0
+        # Figure region the last blitted frame changed; the next blit repaints it too
+        self._preview_blit_bbox = None
+        # Controls that change with playback state (play, fill, percent, loop), and
+        # the artists a blitted frame redraws for them, in drawing order
+        self._preview_controls = None
+        self._preview_control_artists = ()
+
+        # Canvas label artists reused across redraws: (id(elem), role) -> Text
+        self._canvas_labels = {}
+        self._canvas_arrows = {}
+        # Cull mask _draw_canvas last drew with, one flag per current element
+        self._canvas_visible = None
+
+        # Current step's element list; every change of schema, step list or
+        # current_step re-binds it through _sync_current_elements()
+        self._cur_elements = []
+
+        # Edit revision, bumped on every scheduled redraw; derived caches store the
+        # revision they were built at and rebuild once it moves on
+        self._edit_rev = 0
+
+        # Element hit regions of the current step: (edit_rev, hitboxes)
+        self._elem_hitboxes = None
+
+        # Preview timing of one step: (edit_rev, step, (starts, ends, easing_ids, views))
+        self._preview_timing_cache = None
+
+        # Canvas axes styling and grid are set up once, on first draw
+        self._canvas_styled = False
+
+        # Dirty-region redraw: callbacks mark only the panels they changed
+        self._dirty = set()
+        self._redraw_pending = False
+        self._last_redraw = 0.0  # time.monotonic() of the last flush
+        self._last_drag_pos = None  # Drag position of the last redraw, in half canvas units
+        # Nesting depth of _batched() blocks; redraws wait until it drops to zero
+        self._update_depth = 0
+
+        # (path, digest) of the JSON last written by _save
+        self._saved_digest = None
+        # Schema directories already created (or found) by _save
+        self._ensured_dirs = set()
 
         # Load schema
         if schema_path and Path(schema_path).exists():
@@ -89,6 +765,7 @@ class VisualDesigner:
 
         if not self.schema.steps:
             self.schema.steps.append(Step(name="Step 1", title="New Step", elements=[]))
+        self._sync_current_elements()
 
         self._setup_ui()
 
@@ -103,8 +780,8 @@ class VisualDesigner:
         """Save current state to undo stack"""
         step = self._get_current_step()
         if step:
-            # Deep copy elements as JSON to ensure full copy
-            snapshot = json.loads(json.dumps([e for e in step.elements]))
+            # Deep copy elements to ensure full copy
+            snapshot = _clone(step.elements)
             self.undo_stack.append((self.current_step, snapshot))
             if len(self.undo_stack) > self.max_history:
                 self.undo_stack.pop(0)
@@ -114,13 +791,13 @@ class VisualDesigner:
     def _undo(self):
         """Undo last action"""
         if not self.undo_stack:
-            print("Nothing to undo")
+            log.info("Nothing to undo")
             return
 
         # Save current state to redo
         step = self._get_current_step()
         if step:
-            snapshot = json.loads(json.dumps([e for e in step.elements]))
+            snapshot = _clone(step.elements)
             self.redo_stack.append((self.current_step, snapshot))
 
         # Restore previous state
@@ -128,21 +805,22 @@ class VisualDesigner:
         if step_idx < len(self.schema.steps):
             self.current_step = step_idx
             self.schema.steps[step_idx].elements = elements
+            self._sync_current_elements()
             self.selected_element = None
             self.unsaved = True
             self._refresh_all()
-            print(f"Undo: restored {len(elements)} elements")
+            log.info("Undo: restored %d elements", len(elements))
 
     def _redo(self):
         """Redo last undone action"""
         if not self.redo_stack:
-            print("Nothing to redo")
+            log.info("Nothing to redo")
             return
 
         # Save current state to undo
         step = self._get_current_step()
         if step:
-            snapshot = json.loads(json.dumps([e for e in step.elements]))
+            snapshot = _clone(step.elements)
             self.undo_stack.append((self.current_step, snapshot))
 
         # Restore redo state
@@ -150,10 +828,11 @@ class VisualDesigner:
         if step_idx < len(self.schema.steps):
             self.current_step = step_idx
             self.schema.steps[step_idx].elements = elements
+            self._sync_current_elements()
             self.selected_element = None
             self.unsaved = True
             self._refresh_all()
-            print(f"Redo: restored {len(elements)} elements")
+            log.info("Redo: restored %d elements", len(elements))
 
     def _setup_ui(self):
         """Setup the UI with clear panel boundaries"""
@@ -198,14 +877,15 @@ class VisualDesigner:
         # Canvas special styling
         self.ax_canvas.set_facecolor(self.CANVAS_BG)
         for spine in self.ax_canvas.spines.values():
-            spine.set_color(self.colors['primary'])
+            spine.set_color(self._rgba['primary'])
             spine.set_linewidth(2)
 
         # Draw static content
         self._draw_top_bar()
         self._draw_left_panel()
         self._draw_right_panel()
-        self._draw_bottom_bar()
+        self._build_bottom_bar_once()
+        self._update_bottom_bar()
         self._draw_canvas()
 
         # Connect events
@@ -214,6 +894,19 @@ class VisualDesigner:
         self.fig.canvas.mpl_connect('motion_notify_event', self._on_motion)
         self.fig.canvas.mpl_connect('key_press_event', self._on_key)
         self.fig.canvas.mpl_connect('scroll_event', self._on_scroll)
+        self.fig.canvas.mpl_connect('draw_event', self._on_draw)
+
+        # Side panel axes by dirty region; opaque and non-overlapping, so each can be
+        # repainted over the last full draw on its own
+        self._panel_axes = {'top': self.ax_top, 'left': self.ax_left,
+                            'right': self.ax_right, 'bottom': self.ax_bottom}
+        self._fig_drawn = False
+
+        # One-shot timer that flushes dirty panels at most once per frame, so a
+        # burst of motion events during a drag collapses into a single redraw
+        self._redraw_timer = self.fig.canvas.new_timer(interval=self.REDRAW_INTERVAL_MS)
+        self._redraw_timer.single_shot = True
+        self._redraw_timer.add_callback(self._do_redraw)
 
     def _draw_top_bar(self):
         """Draw top menu bar"""
@@ -226,22 +919,22 @@ class VisualDesigner:
 
         # Title
         ax.text(1, 50, 'PRESENTATION DESIGNER', fontsize=12, fontweight='bold',
-                ha='left', va='center', color=self.colors['primary'])
+                ha='left', va='center', color=self._rgba['primary'])
 
         # Menu items - added Ctrl+Z hint
         menu = '[N]ew  [O]pen  [S]ave  [G]en  [P]review  |  Ctrl+Z Undo  Ctrl+Shift+Z Redo'
         ax.text(28, 50, menu, fontsize=9, ha='left', va='center',
-                color=self.colors['text'], family='monospace')
+                color=self._rgba['text'], family='monospace')
 
         # Presentation name
-        ax.text(99, 50, self.schema.title[:30], fontsize=11, ha='right',
-                va='center', color=self.colors['accent'])
+        ax.text(99, 50, _trunc(self.schema.title, 30), fontsize=11, ha='right',
+                va='center', color=self._rgba['accent'])
 
     def _draw_element_thumbnail(self, ax, elem_type, x, y, w, h, is_active=False):
         """Draw a small thumbnail representation of an element type"""
         # Background
-        bg_color = self.colors['accent'] if is_active else '#1a1a24'
-        border_color = self.colors['accent'] if is_active else '#2a2a3a'
+        bg_color = self._rgba['accent'] if is_active else '#1a1a24'
+        border_color = self._rgba['accent'] if is_active else '#2a2a3a'
 
         thumb_bg = Rectangle((x, y), w, h, facecolor=bg_color,
                              edgecolor=border_color, linewidth=1.5 if is_active else 1,
@@ -251,8 +944,8 @@ class VisualDesigner:
         # Center of thumbnail in axes coords
         cx, cy = x + w/2, y + h/2
 
-        icon_color = 'white' if is_active else self.colors['accent']
-        dim_color = 'white' if is_active else self.colors['dim']
+        icon_color = 'white' if is_active else self._rgba['accent']
+        dim_color = 'white' if is_active else self._rgba['dim']
 
         if elem_type == 'text':
             ax.text(cx, cy, 'Aa', fontsize=9, fontweight='bold',
@@ -262,7 +955,7 @@ class VisualDesigner:
             ax.text(cx - 0.02, cy, 'Ty', fontsize=8, fontweight='bold',
                    ha='center', va='center', color=icon_color, transform=ax.transAxes)
             ax.text(cx + 0.03, cy, '|', fontsize=10, fontweight='bold',
-                   ha='center', va='center', color=self.colors['warning'], transform=ax.transAxes)
+                   ha='center', va='center', color=self._rgba['warning'], transform=ax.transAxes)
 
         elif elem_type == 'box':
             box = Rectangle((cx - 0.03, cy - 0.015), 0.06, 0.03,
@@ -289,10 +982,10 @@ class VisualDesigner:
 
         elif elem_type == 'comparison':
             box1 = Rectangle((cx - 0.035, cy - 0.012), 0.03, 0.024,
-                            facecolor='none', edgecolor=self.colors['warning'], linewidth=1,
+                            facecolor='none', edgecolor=self._rgba['warning'], linewidth=1,
                             transform=ax.transAxes)
             box2 = Rectangle((cx + 0.005, cy - 0.012), 0.03, 0.024,
-                            facecolor='none', edgecolor=self.colors['success'], linewidth=1,
+                            facecolor='none', edgecolor=self._rgba['success'], linewidth=1,
                             transform=ax.transAxes)
             ax.add_patch(box1)
             ax.add_patch(box2)
@@ -310,7 +1003,7 @@ class VisualDesigner:
                            transform=ax.transAxes)
             ax.add_patch(box)
             ax.text(cx, cy, '</>', fontsize=6, ha='center', va='center',
-                   color=self.colors['success'], transform=ax.transAxes, family='monospace')
+                   color=self._rgba['success'], transform=ax.transAxes, family='monospace')
 
         elif elem_type == 'grid':
             for r in range(2):
@@ -351,7 +1044,7 @@ class VisualDesigner:
                               transform=ax.transAxes)
             ax.add_patch(bar_bg)
             bar_fill = Rectangle((cx - 0.035, cy - 0.005), 0.045, 0.01,
-                                facecolor=self.colors['success'], edgecolor='none',
+                                facecolor=self._rgba['success'], edgecolor='none',
                                 transform=ax.transAxes)
             ax.add_patch(bar_fill)
 
@@ -379,21 +1072,21 @@ class VisualDesigner:
                             facecolor='#0a0a12', edgecolor=icon_color, linewidth=0.8,
                             transform=ax.transAxes)
             box2 = Rectangle((cx - 0.03, cy - 0.018), 0.06, 0.015,
-                            facecolor='#1a2e1a', edgecolor=self.colors['success'], linewidth=0.8,
+                            facecolor='#1a2e1a', edgecolor=self._rgba['success'], linewidth=0.8,
                             transform=ax.transAxes)
             ax.add_patch(box1)
             ax.add_patch(box2)
             ax.annotate('', xy=(cx, cy - 0.005), xytext=(cx, cy),
-                       arrowprops=dict(arrowstyle='->', color=self.colors['accent'], lw=0.8),
+                       arrowprops=dict(arrowstyle='->', color=self._rgba['accent'], lw=0.8),
                        xycoords=ax.transAxes, textcoords=ax.transAxes)
 
         elif elem_type == 'conversation':
             # Chat bubbles
             b1 = Rectangle((cx - 0.03, cy + 0.005), 0.025, 0.012,
-                          facecolor='#1a1a24', edgecolor=self.colors['primary'], linewidth=0.8,
+                          facecolor='#1a1a24', edgecolor=self._rgba['primary'], linewidth=0.8,
                           transform=ax.transAxes)
             b2 = Rectangle((cx + 0.005, cy - 0.015), 0.025, 0.012,
-                          facecolor='#1a1a24', edgecolor=self.colors['secondary'], linewidth=0.8,
+                          facecolor='#1a1a24', edgecolor=self._rgba['secondary'], linewidth=0.8,
                           transform=ax.transAxes)
             ax.add_patch(b1)
             ax.add_patch(b2)
@@ -420,7 +1113,7 @@ class VisualDesigner:
                     gx = cx - 0.015 + c * 0.015
                     gy = cy - 0.015 + r * 0.015
                     cell = Rectangle((gx, gy), 0.013, 0.013,
-                                    facecolor=plt.cm.viridis(intensity), edgecolor='#333', linewidth=0.3,
+                                    facecolor=_viridis(intensity), edgecolor='#333', linewidth=0.3,
                                     transform=ax.transAxes)
                     ax.add_patch(cell)
 
@@ -428,18 +1121,18 @@ class VisualDesigner:
             ax.text(cx, cy + 0.01, 'T', fontsize=6, ha='center', va='center',
                    color=icon_color, transform=ax.transAxes)
             ax.annotate('', xy=(cx, cy - 0.005), xytext=(cx, cy + 0.003),
-                       arrowprops=dict(arrowstyle='->', color=self.colors['accent'], lw=0.8),
+                       arrowprops=dict(arrowstyle='->', color=self._rgba['accent'], lw=0.8),
                        xycoords=ax.transAxes, textcoords=ax.transAxes)
             ax.text(cx, cy - 0.012, 'E', fontsize=6, ha='center', va='center',
-                   color=self.colors['secondary'], transform=ax.transAxes)
+                   color=self._rgba['secondary'], transform=ax.transAxes)
 
         elif elem_type == 'model_comparison':
             ax.text(cx - 0.015, cy, 'A', fontsize=7, fontweight='bold',
-                   ha='center', va='center', color=self.colors['primary'], transform=ax.transAxes)
+                   ha='center', va='center', color=self._rgba['primary'], transform=ax.transAxes)
             ax.plot([cx, cx], [cy - 0.015, cy + 0.015], '-',
                    linewidth=1, color=dim_color, transform=ax.transAxes)
             ax.text(cx + 0.015, cy, 'B', fontsize=7, fontweight='bold',
-                   ha='center', va='center', color=self.colors['secondary'], transform=ax.transAxes)
+                   ha='center', va='center', color=self._rgba['secondary'], transform=ax.transAxes)
 
         elif elem_type == 'parameter_slider':
             # Slider track
@@ -454,16 +1147,16 @@ class VisualDesigner:
 
         elif elem_type == 'weight_comparison':
             ax.add_patch(Rectangle((cx - 0.03, cy + 0.003), 0.02, 0.008,
-                                  facecolor=self.colors['warning'], edgecolor='none',
+                                  facecolor=self._rgba['warning'], edgecolor='none',
                                   transform=ax.transAxes))
             ax.add_patch(Rectangle((cx + 0.01, cy + 0.003), 0.025, 0.008,
-                                  facecolor=self.colors['success'], edgecolor='none',
+                                  facecolor=self._rgba['success'], edgecolor='none',
                                   transform=ax.transAxes))
             ax.add_patch(Rectangle((cx - 0.03, cy - 0.01), 0.015, 0.008,
-                                  facecolor=self.colors['warning'], edgecolor='none',
+                                  facecolor=self._rgba['warning'], edgecolor='none',
                                   transform=ax.transAxes))
             ax.add_patch(Rectangle((cx + 0.01, cy - 0.01), 0.03, 0.008,
-                                  facecolor=self.colors['success'], edgecolor='none',
+                                  facecolor=self._rgba['success'], edgecolor='none',
                                   transform=ax.transAxes))
 
         else:
@@ -485,12 +1178,12 @@ class VisualDesigner:
                                 facecolor=self.PANEL_HEADER, edgecolor='none')
         ax.add_patch(header)
         ax.text(50, 95, 'ELEMENTS', fontsize=10, fontweight='bold',
-                ha='center', va='center', color=self.colors['accent'])
+                ha='center', va='center', color=self._rgba['accent'])
 
         # Scroll indicator
         if self.scroll_offset > 0:
             ax.text(50, 87, '^ scroll up', fontsize=7, ha='center',
-                    color=self.colors['dim'])
+                    color=self._rgba['dim'])
 
         # Element buttons with thumbnails
         visible = 8
@@ -514,25 +1207,38 @@ class VisualDesigner:
             self._draw_element_thumbnail(ax, elem_type, thumb_x, thumb_y, thumb_w, thumb_h, is_active)
 
             # Label
-            text_color = 'white' if is_active else self.colors['text']
+            text_color = 'white' if is_active else self._rgba['text']
             ax.text(75, y - btn_h/2 + 0.5, label, fontsize=8,
                     ha='center', va='center', color=text_color)
 
             self.elem_boxes.append((y - btn_h + 1, y, elem_type))
             y -= btn_h + 0.8
 
+        # Element rows span the full panel width
+        self._left_click_index = _band_index([('elem', np.array(
+            [(y_min, y_max, -np.inf, np.inf) for y_min, y_max, _ in self.elem_boxes]).reshape(-1, 4))])
+
         # Scroll down indicator
         if end < len(self.ELEMENTS):
             ax.text(50, y - 3, 'v scroll down', fontsize=7, ha='center',
-                    color=self.colors['dim'])
+                    color=self._rgba['dim'])
 
         # Instructions at bottom
         ax.text(50, 3, 'Click element, then\nclick on canvas', fontsize=7,
-                ha='center', va='bottom', color=self.colors['dim'],
+                ha='center', va='bottom', color=self._rgba['dim'],
                 linespacing=1.4, style='italic')
 
         ax.axis('off')
 
+    def _reset_panel_buttons(self):
+        """Clear the properties panel button regions before redrawing it"""
+        self.tab_bboxes, self.tab_vals = _NO_HITBOXES, []
+        self.prop_bboxes, self.prop_vals = _NO_HITBOXES, []
+        self.phase_bboxes, self.phase_vals = _NO_HITBOXES, []
+        self.easing_bboxes, self.easing_vals = _NO_HITBOXES, []
+        self.effect_bboxes, self.effect_vals = _NO_HITBOXES, []
+        self.slider_bboxes, self.slider_vals = _NO_HITBOXES, []
+
     def _draw_right_panel(self):
         """Draw properties panel with tabbed interface - optimized for readability"""
         ax = self.ax_right
@@ -541,72 +1247,67 @@ class VisualDesigner:
         ax.set_xlim(0, 100)
         ax.set_ylim(0, 100)
 
-        # Reset button lists
-        self.prop_buttons = []
-        self.phase_buttons = []
-        self.easing_buttons = []
-        self.effect_buttons = []
-        self.slider_buttons = []
-        self.tab_buttons = []
+        # Reset button regions
+        self._reset_panel_buttons()
 
         M = 3  # Margin
 
         # === HEADER (92-100) ===
         ax.add_patch(Rectangle((0, 92), 100, 8, facecolor=self.PANEL_HEADER, edgecolor='none'))
         ax.text(50, 96, 'PROPERTIES', fontsize=11, fontweight='bold',
-                ha='center', va='center', color=self.colors['accent'])
+                ha='center', va='center', color=self._rgba['accent'])
 
-        if self.selected_element is not None:
-            elements = self._get_current_elements()
-            if self.selected_element < len(elements):
-                elem = elements[self.selected_element]
-                elem_type = elem.get('type', 'unknown')
+        elem = self._selected_elem
+        if elem is not None:
+            elem_type = elem.get('type', 'unknown')
 
-                # === ELEMENT TYPE BADGE (84-90) ===
-                ax.add_patch(FancyBboxPatch((M, 84), 100 - 2*M, 7,
-                                           boxstyle="round,pad=0.02",
-                                           facecolor=self.colors['primary'],
-                                           edgecolor='none', alpha=0.3))
-                ax.text(50, 87.5, elem_type.replace('_', ' ').upper(), fontsize=10,
-                        fontweight='bold', ha='center', va='center',
-                        color=self.colors['primary'])
-
-                # === TAB BUTTONS (75-82) ===
-                tab_w = 45
-                tabs = [('props', 'Content'), ('anim', 'Animation')]
-                for i, (tab_id, tab_label) in enumerate(tabs):
-                    is_active = self.props_tab == tab_id
-                    tx = M + 1 + i * (tab_w + 3)
-                    ty = 76
-
-                    bg_color = '#1a1a2e' if is_active else '#0a0a0f'
-                    border_color = self.colors['accent'] if is_active else '#3a3a4a'
-
-                    ax.add_patch(FancyBboxPatch((tx, ty), tab_w, 7,
-                                               boxstyle="round,pad=0.02",
-                                               facecolor=bg_color,
-                                               edgecolor=border_color,
-                                               linewidth=2 if is_active else 1))
-                    ax.text(tx + tab_w/2, ty + 3.5, tab_label, fontsize=9,
-                            fontweight='bold',
-                            ha='center', va='center',
-                            color='white' if is_active else '#888888')
-                    self.tab_buttons.append((ty, ty + 7, tx, tx + tab_w, tab_id))
-
-                # === TAB CONTENT AREA (15-74) ===
-                ax.add_patch(FancyBboxPatch((M, 15), 100 - 2*M, 59,
+            # === ELEMENT TYPE BADGE (84-90) ===
+            ax.add_patch(FancyBboxPatch((M, 84), 100 - 2*M, 7,
+                                       boxstyle="round,pad=0.02",
+                                       facecolor=self._rgba['primary'],
+                                       edgecolor='none', alpha=0.3))
+            ax.text(50, 87.5, elem_type.replace('_', ' ').upper(), fontsize=10,
+                    fontweight='bold', ha='center', va='center',
+                    color=self._rgba['primary'])
+
+            # === TAB BUTTONS (75-82) ===
+            tab_w = 45
+            tabs = [('props', 'Content'), ('anim', 'Animation')]
+            self.tab_bboxes = np.empty((len(tabs), 4), dtype=np.float32)
+            for i, (tab_id, tab_label) in enumerate(tabs):
+                is_active = self.props_tab == tab_id
+                tx = M + 1 + i * (tab_w + 3)
+                ty = 76
+
+                bg_color = '#1a1a2e' if is_active else '#0a0a0f'
+                border_color = self._rgba['accent'] if is_active else '#3a3a4a'
+
+                ax.add_patch(FancyBboxPatch((tx, ty), tab_w, 7,
                                            boxstyle="round,pad=0.02",
-                                           facecolor='#0d0d14',
-                                           edgecolor='#2a2a3a', linewidth=1))
+                                           facecolor=bg_color,
+                                           edgecolor=border_color,
+                                           linewidth=2 if is_active else 1))
+                ax.text(tx + tab_w/2, ty + 3.5, tab_label, fontsize=9,
+                        fontweight='bold',
+                        ha='center', va='center',
+                        color='white' if is_active else '#888888')
+                self.tab_bboxes[i] = (ty, ty + 7, tx, tx + tab_w)
+                self.tab_vals.append(tab_id)
+
+            # === TAB CONTENT AREA (15-74) ===
+            ax.add_patch(FancyBboxPatch((M, 15), 100 - 2*M, 59,
+                                       boxstyle="round,pad=0.02",
+                                       facecolor='#0d0d14',
+                                       edgecolor='#2a2a3a', linewidth=1))
 
-                if self.props_tab == 'props':
-                    self._draw_props_tab(ax, elem, M, 6)
-                else:
-                    self._draw_anim_tab(ax, elem, M, 6)
+            if self.props_tab == 'props':
+                self._draw_props_tab(ax, elem, M, 6)
+            else:
+                self._draw_anim_tab(ax, elem, M, 6)
 
-                # === ACTIONS (8-13) ===
-                ax.text(50, 10, '[E] Edit All   [D] Duplicate   [Del] Delete',
-                        fontsize=7, ha='center', va='center', color='#888888')
+            # === ACTIONS (8-13) ===
+            ax.text(50, 10, '[E] Edit All   [D] Duplicate   [Del] Delete',
+                    fontsize=7, ha='center', va='center', color='#888888')
 
         else:
             # No selection - clear instructions
@@ -636,11 +1337,17 @@ class VisualDesigner:
 
         step = self._get_current_step()
         if step:
-            ax.text(50, 4, f'{step.name[:18]}  ({len(step.elements)} elements)',
+            ax.text(50, 4, f'{_trunc(step.name, 18)}  ({len(step.elements)} elements)',
                     fontsize=8, ha='center', va='center', color='#aaaaaa')
 
         ax.axis('off')
 
+        # Groups in click priority order
+        self._right_click_index = _band_index([
+            ('tab', self.tab_bboxes), ('phase', self.phase_bboxes),
+            ('easing', self.easing_bboxes), ('effect', self.effect_bboxes),
+            ('slider', self.slider_bboxes), ('prop', self.prop_bboxes)])
+
     def _draw_props_tab(self, ax, elem, M, BTN_H):
         """Draw the Properties/Content tab"""
         props = self._get_editable_props(elem)
@@ -648,24 +1355,26 @@ class VisualDesigner:
         # Draw up to 7 properties with good spacing
         y = 73
         row_h = 7
-        for prop_name, prop_val, prop_type in props[:7]:
+        self.prop_bboxes = np.empty((len(props[:7]), 4), dtype=np.float32)
+        for i, (prop_name, prop_val, prop_type) in enumerate(props[:7]):
             # Label - bright and readable
             ax.text(M + 2, y, f"{prop_name}", fontsize=8,
-                    ha='left', va='center', color=self.colors['text'], fontweight='bold')
+                    ha='left', va='center', color=self._rgba['text'], fontweight='bold')
             # Value box (clickable) - good contrast
             ax.add_patch(FancyBboxPatch((38, y - 3), 55, 6,
                                        boxstyle="round,pad=0.02",
                                        facecolor='#1a1a2e',
-                                       edgecolor=self.colors['primary'], linewidth=1))
-            ax.text(65, y, str(prop_val)[:12], fontsize=8, ha='center',
+                                       edgecolor=self._rgba['primary'], linewidth=1))
+            ax.text(65, y, _sshort(prop_val, 12), fontsize=8, ha='center',
                     va='center', color='#ffffff')
-            self.prop_buttons.append((y - 3, y + 3, 38, 93, prop_name, self.selected_element))
+            self.prop_bboxes[i] = (y - 3, y + 3, 38, 93)
+            self.prop_vals.append((prop_name, self.selected_element))
             y -= row_h
 
         # Show count if more properties
         if len(props) > 7:
             ax.text(50, y + 2, f'Press [E] for {len(props) - 7} more...', fontsize=7,
-                    ha='center', color=self.colors['accent'])
+                    ha='center', color=self._rgba['accent'])
 
     def _draw_anim_tab(self, ax, elem, M, BTN_H):
         """Draw the Animation tab with granular timing controls"""
@@ -675,7 +1384,7 @@ class VisualDesigner:
 
         # === TIMING SECTION (top) ===
         ax.text(M + 2, 72, 'Timing', fontsize=9, fontweight='bold',
-                ha='left', va='center', color=self.colors['text'])
+                ha='left', va='center', color=self._rgba['text'])
 
         # Duration slider
         duration = elem.get('duration', 1.0)
@@ -688,7 +1397,7 @@ class VisualDesigner:
         self._draw_slider(ax, M + 28, 59, 62, delay, 0.0, 2.0, 's', 'delay')
 
         # Speed multiplier (for animated elements)
-        if elem_type in ('particle_flow', 'typewriter_text', 'token_flow', 'neural_network'):
+        if elem_type in _SPEED_TYPES:
             speed = elem.get('speed', 1.0)
             ax.text(M + 2, 55, 'Speed:', fontsize=7, ha='left', color='#aaaaaa')
             self._draw_slider(ax, M + 28, 53, 62, speed, 0.25, 4.0, 'x', 'speed')
@@ -698,7 +1407,7 @@ class VisualDesigner:
 
         # === PHASE SECTION ===
         ax.text(M + 2, phase_y, 'Phase', fontsize=8, fontweight='bold',
-                ha='left', va='center', color=self.colors['text'])
+                ha='left', va='center', color=self._rgba['text'])
 
         current_phase = elem.get('animation_phase', 'early')
         phases = [('immediate', 'Imm'), ('early', 'Ear'), ('middle', 'Mid'),
@@ -706,12 +1415,13 @@ class VisualDesigner:
 
         btn_w = 17
         y = phase_y - 6
+        self.phase_bboxes = np.empty((len(phases), 4), dtype=np.float32)
         for i, (phase_val, phase_label) in enumerate(phases):
             is_cur = phase_val == current_phase
             px = M + 2 + i * (btn_w + 2)
 
-            bg = self.colors['accent'] if is_cur else '#1a1a2e'
-            border = self.colors['accent'] if is_cur else '#3a3a4a'
+            bg = self._rgba['accent'] if is_cur else '#1a1a2e'
+            border = self._rgba['accent'] if is_cur else '#3a3a4a'
             ax.add_patch(FancyBboxPatch((px, y), btn_w, BTN_H,
                                        boxstyle="round,pad=0.02",
                                        facecolor=bg, edgecolor=border,
@@ -719,12 +1429,13 @@ class VisualDesigner:
             ax.text(px + btn_w/2, y + BTN_H/2, phase_label, fontsize=6,
                     ha='center', va='center', fontweight='bold',
                     color='white' if is_cur else '#aaaaaa')
-            self.phase_buttons.append((y, y + BTN_H, px, px + btn_w, phase_val))
+            self.phase_bboxes[i] = (y, y + BTN_H, px, px + btn_w)
+            self.phase_vals.append(phase_val)
 
         # === EASING SECTION ===
         easing_y = y - 10
         ax.text(M + 2, easing_y, 'Easing', fontsize=8, fontweight='bold',
-                ha='left', va='center', color=self.colors['text'])
+                ha='left', va='center', color=self._rgba['text'])
 
         current_easing = elem.get('easing', 'ease_in_out')
         easings = [
@@ -733,14 +1444,15 @@ class VisualDesigner:
         ]
 
         btn_w = 21
+        self.easing_bboxes = np.empty((sum(map(len, easings)), 4), dtype=np.float32)
         for row, easing_row in enumerate(easings):
             ey = easing_y - 6 - row * (BTN_H + 1)
             for i, (easing_val, easing_label) in enumerate(easing_row):
                 is_cur = easing_val == current_easing
                 px = M + 2 + i * (btn_w + 2)
 
-                bg = self.colors['highlight'] if is_cur else '#1a1a2e'
-                border = self.colors['highlight'] if is_cur else '#3a3a4a'
+                bg = self._rgba['highlight'] if is_cur else '#1a1a2e'
+                border = self._rgba['highlight'] if is_cur else '#3a3a4a'
                 ax.add_patch(FancyBboxPatch((px, ey), btn_w, BTN_H,
                                            boxstyle="round,pad=0.02",
                                            facecolor=bg, edgecolor=border,
@@ -748,24 +1460,26 @@ class VisualDesigner:
                 ax.text(px + btn_w/2, ey + BTN_H/2, easing_label, fontsize=6,
                         ha='center', va='center', fontweight='bold',
                         color='white' if is_cur else '#aaaaaa')
-                self.easing_buttons.append((ey, ey + BTN_H, px, px + btn_w, easing_val))
+                self.easing_bboxes[len(self.easing_vals)] = (ey, ey + BTN_H, px, px + btn_w)
+                self.easing_vals.append(easing_val)
 
         # === EFFECT SECTION ===
         effect_y = easing_y - 22
         ax.text(M + 2, effect_y, 'Effect', fontsize=8, fontweight='bold',
-                ha='left', va='center', color=self.colors['text'])
+                ha='left', va='center', color=self._rgba['text'])
 
         current_effect = elem.get('continuous_effect', 'none')
         effects = [('none', 'None'), ('pulse', 'Pulse'), ('breathing', 'Breathe')]
 
         btn_w = 28
         fy = effect_y - 6
+        self.effect_bboxes = np.empty((len(effects), 4), dtype=np.float32)
         for i, (effect_val, effect_label) in enumerate(effects):
             is_cur = effect_val == current_effect
             px = M + 2 + i * (btn_w + 2)
 
-            bg = self.colors['success'] if is_cur else '#1a1a2e'
-            border = self.colors['success'] if is_cur else '#3a3a4a'
+            bg = self._rgba['success'] if is_cur else '#1a1a2e'
+            border = self._rgba['success'] if is_cur else '#3a3a4a'
             ax.add_patch(FancyBboxPatch((px, fy), btn_w, BTN_H,
                                        boxstyle="round,pad=0.02",
                                        facecolor=bg, edgecolor=border,
@@ -773,7 +1487,8 @@ class VisualDesigner:
             ax.text(px + btn_w/2, fy + BTN_H/2, effect_label, fontsize=6,
                     ha='center', va='center', fontweight='bold',
                     color='white' if is_cur else '#aaaaaa')
-            self.effect_buttons.append((fy, fy + BTN_H, px, px + btn_w, effect_val))
+            self.effect_bboxes[i] = (fy, fy + BTN_H, px, px + btn_w)
+            self.effect_vals.append(effect_val)
 
     def _draw_slider(self, ax, x, y, width, value, min_val, max_val, unit, prop_name):
         """Draw a clickable slider control"""
@@ -788,7 +1503,7 @@ class VisualDesigner:
         fill_w = max(2, pct * (width - 4))
         ax.add_patch(FancyBboxPatch((x + 1, y + 0.5), fill_w, 3,
                                    boxstyle="round,pad=0.01",
-                                   facecolor=self.colors['primary'],
+                                   facecolor=self._rgba['primary'],
                                    edgecolor='none'))
 
         # Value label
@@ -796,17 +1511,18 @@ class VisualDesigner:
                 ha='left', va='center', color='white', fontweight='bold')
 
         # Store slider region for click handling
-        self.slider_buttons.append((y, y + 4, x, x + width, prop_name, min_val, max_val))
+        self.slider_bboxes = np.vstack([self.slider_bboxes, (y, y + 4, x, x + width)])
+        self.slider_vals.append((prop_name, min_val, max_val))
 
-    def _draw_bottom_bar(self):
-        """Draw bottom navigation bar"""
+    def _build_bottom_bar_once(self):
+        """Draw static navigation buttons and create the step indicator artist"""
         ax = self.ax_bottom
         ax.clear()
         ax.set_facecolor(self.PANEL_HEADER)
         ax.set_xlim(0, 100)
         ax.set_ylim(0, 100)
 
-        # Navigation buttons
+        # Navigation buttons (never change, drawn once)
         nav_btns = [
             (8, '<', 'prev'),
             (18, '+', 'add'),
@@ -814,8 +1530,9 @@ class VisualDesigner:
             (92, '>', 'next'),
         ]
 
-        self.nav_buttons = []
-        for x, icon, action in nav_btns:
+        self.nav_bboxes = np.empty((len(nav_btns), 4), dtype=np.float32)
+        self.nav_vals = []
+        for i, (x, icon, action) in enumerate(nav_btns):
             btn = FancyBboxPatch((x - 5, 20), 10, 60,
                                  boxstyle="round,pad=0.02",
                                  facecolor='#1a1a24',
@@ -823,75 +1540,153 @@ class VisualDesigner:
                                  linewidth=1)
             ax.add_patch(btn)
             ax.text(x, 50, icon, fontsize=16, fontweight='bold',
-                    ha='center', va='center', color=self.colors['text'])
-            self.nav_buttons.append((x - 5, x + 5, 20, 80, action))
+                    ha='center', va='center', color=self._rgba['text'])
+            self.nav_bboxes[i] = (20, 80, x - 5, x + 5)
+            self.nav_vals.append(action)
+        self._nav_click_index = _band_index([('nav', self.nav_bboxes)])
 
-        # Step indicator
-        step = self._get_current_step()
-        step_name = step.name[:20] if step else "No step"
-        indicator = f'Step {self.current_step + 1}/{len(self.schema.steps)}: {step_name}'
-        ax.text(55, 50, indicator, fontsize=11, fontweight='bold',
-                ha='center', va='center', color=self.colors['primary'])
+        # Step indicator - text updated in place by _update_bottom_bar
+        self._step_indicator_text = ax.text(55, 50, '', fontsize=11, fontweight='bold',
+                                            ha='center', va='center',
+                                            color=self._rgba['primary'])
 
         ax.axis('off')
 
-    def _draw_canvas(self):
-        """Draw the main canvas with elements"""
+    def _update_bottom_bar(self):
+        """Update the step indicator text (nav buttons are static)"""
+        self._step_indicator_text.set_text(self._step_label)
+
+    def _init_canvas_axes(self):
+        """Style the canvas axes and draw the grid once, on first draw"""
         ax = self.ax_canvas
-        ax.clear()
         ax.set_facecolor(self.CANVAS_BG)
         ax.set_xlim(0, 100)
         ax.set_ylim(0, 100)
 
         # Subtle grid
+        self._canvas_grid = set()
         for i in range(10, 100, 10):
-            ax.axhline(i, color='#1a1a1a', linewidth=0.5, alpha=0.5)
-            ax.axvline(i, color='#1a1a1a', linewidth=0.5, alpha=0.5)
+            self._canvas_grid.add(ax.axhline(i, color='#1a1a1a', linewidth=0.5, alpha=0.5))
+            self._canvas_grid.add(ax.axvline(i, color='#1a1a1a', linewidth=0.5, alpha=0.5))
+
+        ax.axis('off')
+
+        # Spines styling
+        for spine in ax.spines.values():
+            spine.set_visible(True)
+            spine.set_color(self._rgba['primary'])
+            spine.set_linewidth(2)
+
+        self._canvas_styled = True
+
+    def _draw_canvas(self):
+        """Draw the main canvas with elements"""
+        ax = self.ax_canvas
+        if not self._canvas_styled:
+            self._init_canvas_axes()
+        else:
+            # Remove the previous element artists; grid, limits and styling stay
+            for container in ax.containers[:]:
+                container.remove()
+            for artist in (*ax.patches, *ax.texts, *ax.lines, *ax.collections):
+                if artist not in self._canvas_grid:
+                    artist.remove()
 
         step = self._get_current_step()
         if step:
             # Step title
             if step.title:
                 ax.text(50, 96, step.title, fontsize=14, fontweight='bold',
-                        ha='center', va='top', color=self.colors['primary'])
+                        ha='center', va='top', color=self._rgba['primary'])
 
-            # Draw elements
+            # Draw elements, skipping those wholly outside the (possibly zoomed) view
+            visible = self._canvas_visible = self._visible_elements()
             for i, elem in enumerate(step.elements):
-                self._draw_element(ax, elem, i == self.selected_element)
+                if visible[i] or i == self.selected_element:
+                    self._draw_element(ax, elem, i == self.selected_element)
+
+            # Drop cached labels and arrows of elements no longer on this step
+            live = {id(elem) for elem in step.elements}
+            self._canvas_labels = {key: label for key, label in self._canvas_labels.items()
+                                   if key[0] in live}
+            self._canvas_arrows = {key: arrow for key, arrow in self._canvas_arrows.items()
+                                   if key[0] in live}
 
         # Placement indicator
         if self.placing_element:
             ax.text(50, 2, f'Click to place: {self.placing_element}',
                     fontsize=10, ha='center', va='bottom',
-                    color=self.colors['accent'],
+                    color=self._rgba['accent'],
                     bbox=dict(boxstyle='round,pad=0.3',
-                             facecolor='#1a1a1a', edgecolor=self.colors['accent']))
-
-        ax.axis('off')
-
-        # Restore spines styling
-        for spine in ax.spines.values():
-            spine.set_visible(True)
-            spine.set_color(self.colors['primary'])
-            spine.set_linewidth(2)
+                             facecolor='#1a1a1a', edgecolor=self._rgba['accent']))
+
+    def _canvas_text(self, ax, elem, role, x, y, text, **kwargs):
+        """Draw an element label, reusing its Text artist from the previous redraw
+
+        Removing artists from the canvas only detaches them, so the label created
+        on first draw is re-attached and just gets its text and position updated. Style kwargs
+        are applied on creation only.
+        """
+        key = (id(elem), role)
+        label = self._canvas_labels.get(key)
+        if label is None:
+            label = ax.text(x, y, text, **kwargs)
+            self._canvas_labels[key] = label
+        else:
+            label.set_text(text)
+            label.set_position((x, y))
+            ax.add_artist(label)
+        return label
+
+    def _canvas_arrow(self, ax, elem, role, posA, posB, color, lw, **kwargs):
+        """Draw an element arrow, reusing its FancyArrowPatch from the previous redraw
+
+        Only the end points, color and line width are updated on reuse; arrow and
+        connection styles are applied on creation only.
+        """
+        key = (id(elem), role)
+        arrow = self._canvas_arrows.get(key)
+        if arrow is None:
+            # Same head size and stacking (above the grid) as an annotate() arrow
+            # at the default font size
+            arrow = FancyArrowPatch(posA, posB, color=color, lw=lw,
+                                    mutation_scale=10, zorder=3, **kwargs)
+            self._canvas_arrows[key] = arrow
+        else:
+            arrow.set_positions(posA, posB)
+            arrow.set_color(color)
+            arrow.set_linewidth(lw)
+        ax.add_patch(arrow)
+        return arrow
 
     def _draw_element(self, ax, elem, selected):
         """Draw a single element on canvas"""
         t = elem.get('type', 'text')
-        pos = elem.get('position', {'x': 50, 'y': 50})
+        pos = elem.get('position', _DEFAULT_POS)
         x, y = pos['x'], pos['y']
 
-        sel_color = self.colors['accent']
+        # Bind palette colors once; each self._rgba[...] is an attr + dict lookup
+        colors = self._rgba
+        primary = colors['primary']
+        secondary = colors['secondary']
+        accent = colors['accent']
+        success = colors['success']
+        warning = colors['warning']
+        dim = colors['dim']
+        text_color = colors['text']
+
+        sel_color = accent
         lw = 2.5 if selected else 1
 
-        if t in ('text', 'typewriter_text'):
-            content = elem.get('content', 'Text')[:25]
-            bbox = dict(boxstyle='round,pad=0.4',
-                       facecolor='#1a1a24' if selected else 'none',
-                       edgecolor=sel_color if selected else 'none',
-                       linewidth=lw)
-            ax.text(x, y, content, fontsize=11, ha='center', va='center',
-                   color=self.colors['text'], bbox=bbox)
+        if t in _TEXT_TYPES:
+            content = _trunc(elem.get('content', 'Text'), 25)
+            label = self._canvas_text(ax, elem, 'content', x, y, content, fontsize=11,
+                                      ha='center', va='center', color=text_color,
+                                      bbox=dict(boxstyle='round,pad=0.4'))
+            # Selection only restyles the label's existing bbox patch
+            label.get_bbox_patch().set(facecolor='#1a1a24' if selected else 'none',
+                                       edgecolor=sel_color if selected else 'none',
+                                       linewidth=lw)
 
         elif t == 'box':
             w, h = elem.get('width', 25), elem.get('height', 12)
@@ -899,17 +1694,20 @@ class VisualDesigner:
                 (x - w/2, y - h/2), w, h,
                 boxstyle="round,pad=0.3",
                 facecolor='#1a1a24',
-                edgecolor=sel_color if selected else self.colors['primary'],
+                edgecolor=sel_color if selected else primary,
                 linewidth=lw))
             if elem.get('title'):
-                ax.text(x, y + h/4, elem['title'][:15], fontsize=9,
-                       fontweight='bold', ha='center', color=self.colors['primary'])
+                self._canvas_text(ax, elem, 'title', x, y + h/4, _trunc(elem['title'], 15),
+                                  fontsize=9, fontweight='bold', ha='center',
+                                  color=primary)
 
         elif t == 'bullet_list':
             items = elem.get('items', [])[:4]
-            for j, item in enumerate(items):
-                ax.text(x - 10, y + 4 - j * 4, f'* {item[:15]}',
-                       fontsize=8, ha='left', color=self.colors['text'])
+            ys = (y + 4 - np.arange(len(items)) * 4).tolist()
+            for j, (item, iy) in enumerate(zip(items, ys)):
+                self._canvas_text(ax, elem, ('item', j), x - 10, iy,
+                                  f'* {_trunc(item, 15)}', fontsize=8, ha='left',
+                                  color=text_color)
             if selected:
                 ax.add_patch(Rectangle((x - 15, y - 10), 30, 18,
                                        fill=False, edgecolor=sel_color, linewidth=lw))
@@ -919,55 +1717,51 @@ class VisualDesigner:
             ax.add_patch(FancyBboxPatch(
                 (x - w/2, y - h/2), w/2 - 1, h,
                 boxstyle="round,pad=0.2", facecolor='#1a1a24',
-                edgecolor=self.colors['warning'], linewidth=1))
+                edgecolor=warning, linewidth=1))
             ax.add_patch(FancyBboxPatch(
                 (x + 1, y - h/2), w/2 - 1, h,
                 boxstyle="round,pad=0.2", facecolor='#1a1a24',
-                edgecolor=self.colors['success'], linewidth=1))
+                edgecolor=success, linewidth=1))
             if selected:
                 ax.add_patch(Rectangle((x - w/2 - 1, y - h/2 - 1), w + 2, h + 2,
                                        fill=False, edgecolor=sel_color, linewidth=lw))
 
-        elif t in ('arrow', 'arc_arrow'):
-            start = elem.get('start', {'x': x - 10, 'y': y})
-            end = elem.get('end', {'x': x + 10, 'y': y})
+        elif t in _ARROW_TYPES:
+            sx, sy, ex, ey = _endpoints(elem, x, y, 10)
             style = 'arc3,rad=0.2' if t == 'arc_arrow' else None
-            ax.annotate('', xy=(end['x'], end['y']), xytext=(start['x'], start['y']),
-                       arrowprops=dict(arrowstyle='-|>', lw=lw,
-                                      color=sel_color if selected else self.colors['primary'],
-                                      connectionstyle=style))
+            self._canvas_arrow(ax, elem, 'arrow', (sx, sy), (ex, ey),
+                               sel_color if selected else primary, lw,
+                               arrowstyle='-|>', connectionstyle=style)
 
         elif t == 'similarity_meter':
             r = elem.get('radius', 5)
             ax.add_patch(Wedge((x, y), r, 0, 180,
-                              facecolor=self.colors['success'],
-                              edgecolor=sel_color if selected else self.colors['dim'],
+                              facecolor=success,
+                              edgecolor=sel_color if selected else dim,
                               linewidth=lw))
-            ax.text(x, y, f"{elem.get('score', 75)}%", fontsize=8,
-                   ha='center', va='center', color='white', fontweight='bold')
+            self._canvas_text(ax, elem, 'score', x, y, f"{elem.get('score', 75)}%", fontsize=8,
+                              ha='center', va='center', color='white', fontweight='bold')
 
         elif t == 'progress_bar':
             w = elem.get('width', 18)
             ax.add_patch(Rectangle((x - w/2, y - 1.5), w, 3,
                                   facecolor='#1a1a24',
-                                  edgecolor=sel_color if selected else self.colors['dim'],
+                                  edgecolor=sel_color if selected else dim,
                                   linewidth=lw))
             fill = w * elem.get('current', 5) / max(elem.get('total', 10), 1)
             ax.add_patch(Rectangle((x - w/2, y - 1.5), fill, 3,
-                                  facecolor=self.colors['success']))
+                                  facecolor=success))
 
         elif t == 'neural_network':
             w, h = elem.get('width', 35), elem.get('height', 22)
-            layers = elem.get('layers', [3, 4, 2])
-            sp = w / (len(layers) + 1)
-            for li, n in enumerate(layers):
-                lx = x - w/2 + (li + 1) * sp
-                ns = h / (n + 1)
-                for ni in range(n):
-                    ny = y - h/2 + (ni + 1) * ns
-                    ax.add_patch(Circle((lx, ny), 0.9,
-                                       facecolor=self.colors['primary'],
-                                       edgecolor='white', linewidth=0.3))
+            fx, fy, _ = _neuron_layout(tuple(elem.get('layers', [3, 4, 2])))
+            if len(fx):
+                # All neurons as one collection, sized in data units like Circle patches
+                ax.add_collection(EllipseCollection(
+                    1.8, 1.8, 0, units='xy',
+                    offsets=np.column_stack([x + w * (fx - 0.5), y + h * (fy - 0.5)]),
+                    offset_transform=ax.transData,
+                    facecolors=primary, edgecolors='white', linewidths=0.3))
             if selected:
                 ax.add_patch(Rectangle((x - w/2 - 1, y - h/2 - 1), w + 2, h + 2,
                                        fill=False, edgecolor=sel_color, linewidth=lw))
@@ -978,26 +1772,26 @@ class VisualDesigner:
                 (x - w/2, y - h/2), w, h,
                 boxstyle="round,pad=0.2",
                 facecolor='#0a0a12',
-                edgecolor=sel_color if selected else self.colors['dim'],
+                edgecolor=sel_color if selected else dim,
                 linewidth=lw))
-            code = elem.get('code', 'code...')[:20]
-            ax.text(x, y, code, fontsize=7, ha='center', va='center',
-                   color=self.colors['success'], family='monospace')
+            code = _trunc(elem.get('code', 'code...'), 20)
+            self._canvas_text(ax, elem, 'code', x, y, code, fontsize=7, ha='center',
+                              va='center', color=success, family='monospace')
 
         elif t == 'flow':
             w = elem.get('width', 45)
             steps = elem.get('steps', [{'title': 'Step'}])[:4]
             step_w = w / len(steps) - 2
-            for i, s in enumerate(steps):
-                sx = x - w/2 + i * (step_w + 2) + step_w/2
-                ax.add_patch(FancyBboxPatch(
-                    (sx - step_w/2, y - 4), step_w, 8,
-                    boxstyle="round,pad=0.2",
-                    facecolor='#1a1a24',
-                    edgecolor=self.colors['primary'],
-                    linewidth=1))
-                ax.text(sx, y, s.get('title', '')[:8], fontsize=7,
-                       ha='center', va='center', color=self.colors['text'])
+            xs = (x - w/2 + np.arange(len(steps)) * (step_w + 2) + step_w/2).tolist()
+            # All step boxes as one collection
+            ax.add_collection(PatchCollection(
+                [FancyBboxPatch((sx - step_w/2, y - 4), step_w, 8, boxstyle="round,pad=0.2")
+                 for sx in xs],
+                facecolors='#1a1a24', edgecolors=primary, linewidths=1))
+            for i, (s, sx) in enumerate(zip(steps, xs)):
+                self._canvas_text(ax, elem, ('step', i), sx, y, _trunc(s.get('title', ''), 8),
+                                  fontsize=7, ha='center', va='center',
+                                  color=text_color)
             if selected:
                 ax.add_patch(Rectangle((x - w/2 - 1, y - 6), w + 2, 12,
                                        fill=False, edgecolor=sel_color, linewidth=lw))
@@ -1009,21 +1803,22 @@ class VisualDesigner:
             cell_w, cell_h = 12, 6
             total_w = cols * cell_w + (cols - 1) * 2
             total_h = rows * cell_h + (rows - 1) * 2
-            for r in range(rows):
-                for c in range(cols):
-                    idx = r * cols + c
-                    cx = x - total_w/2 + c * (cell_w + 2) + cell_w/2
-                    cy = y + total_h/2 - r * (cell_h + 2) - cell_h/2
-                    ax.add_patch(FancyBboxPatch(
-                        (cx - cell_w/2, cy - cell_h/2), cell_w, cell_h,
-                        boxstyle="round,pad=0.1",
-                        facecolor='#1a1a24',
-                        edgecolor=self.colors['primary'],
-                        linewidth=0.8))
-                    if idx < len(items):
-                        ax.text(cx, cy, items[idx].get('title', '')[:6],
-                               fontsize=6, ha='center', va='center',
-                               color=self.colors['text'])
+            if rows > 0 and cols > 0:
+                # All cells as one PolyCollection, padded by 0.1 like the cell boxes were;
+                # unsnapped, as the curved box paths were, to keep their 1 px stroke
+                x_left, y_low = np.meshgrid(x - total_w/2 + np.arange(cols) * (cell_w + 2),
+                                            y - total_h/2 + np.arange(rows) * (cell_h + 2))
+                ax.add_collection(PolyCollection(
+                    _rect_verts(x_left.ravel() - 0.1, y_low.ravel() - 0.1,
+                                cell_w + 0.2, cell_h + 0.2),
+                    facecolor='#1a1a24', edgecolor=primary, linewidth=0.8, snap=False), autolim=False)
+            for idx, item in enumerate(items[:rows * cols]):
+                r, c = divmod(idx, cols)
+                cx = x - total_w/2 + c * (cell_w + 2) + cell_w/2
+                cy = y + total_h/2 - r * (cell_h + 2) - cell_h/2
+                self._canvas_text(ax, elem, ('cell', idx), cx, cy, _trunc(item.get('title', ''), 6),
+                                  fontsize=6, ha='center', va='center',
+                                  color=text_color)
             if selected:
                 ax.add_patch(Rectangle((x - total_w/2 - 1, y - total_h/2 - 1),
                                        total_w + 2, total_h + 2,
@@ -1031,36 +1826,39 @@ class VisualDesigner:
 
         elif t == 'checklist':
             items = elem.get('items', [])[:4]
-            for j, item in enumerate(items):
-                iy = y + 4 - j * 4
-                ax.add_patch(Rectangle((x - 12, iy - 1.5), 3, 3,
-                                       facecolor='none',
-                                       edgecolor=self.colors['success'],
-                                       linewidth=0.8))
-                ax.text(x - 7, iy, item[:12], fontsize=7,
-                       ha='left', va='center', color=self.colors['text'])
+            ys = y + 4 - np.arange(len(items)) * 4
+            if items:
+                # All check boxes as one collection
+                ax.add_collection(PolyCollection(
+                    _rect_verts(x - 12, ys - 1.5, 3, 3),
+                    facecolors='none', edgecolors=success, linewidths=0.8))
+            for j, (item, iy) in enumerate(zip(items, ys.tolist())):
+                self._canvas_text(ax, elem, ('item', j), x - 7, iy, _trunc(item, 12), fontsize=7,
+                                  ha='left', va='center', color=text_color)
             if selected:
                 ax.add_patch(Rectangle((x - 15, y - 10), 30, 18,
                                        fill=False, edgecolor=sel_color, linewidth=lw))
 
         elif t == 'particle_flow':
-            start = elem.get('start', {'x': x - 15, 'y': y})
-            end = elem.get('end', {'x': x + 15, 'y': y})
+            sx, sy, ex, ey = _endpoints(elem, x, y, 15)
             n = elem.get('num_particles', 10)
-            ax.plot([start['x'], end['x']], [start['y'], end['y']],
-                   '--', color=self.colors['dim'], linewidth=0.5, alpha=0.5)
-            for i in range(min(n, 8)):
-                t_pos = i / max(n - 1, 1)
-                px = start['x'] + (end['x'] - start['x']) * t_pos
-                py = start['y'] + (end['y'] - start['y']) * t_pos
-                ax.add_patch(Circle((px, py), 0.6,
-                                   facecolor=self.colors['accent'],
-                                   edgecolor='none', alpha=0.4 + t_pos * 0.5))
+            ax.plot([sx, ex], [sy, ey],
+                   '--', color=dim, linewidth=0.5, alpha=0.5)
+            # Up to 8 sample particles as one collection, alpha ramping along the path
+            t_pos = np.arange(min(n, 8)) / max(n - 1, 1)
+            offsets = np.column_stack([sx + (ex - sx) * t_pos,
+                                       sy + (ey - sy) * t_pos])
+            facecolors = np.tile(accent, (len(t_pos), 1))
+            facecolors[:, 3] = 0.4 + t_pos * 0.5
+            ax.add_collection(EllipseCollection(
+                1.2, 1.2, 0, units='xy', offsets=offsets,
+                offset_transform=ax.transData,
+                facecolors=facecolors, edgecolors='none'))
             if selected:
-                min_x = min(start['x'], end['x'])
-                min_y = min(start['y'], end['y'])
-                w = abs(end['x'] - start['x']) + 4
-                h = abs(end['y'] - start['y']) + 6
+                min_x = min(sx, ex)
+                min_y = min(sy, ey)
+                w = abs(ex - sx) + 4
+                h = abs(ey - sy) + 6
                 ax.add_patch(Rectangle((min_x - 2, min_y - 3), w, h,
                                        fill=False, edgecolor=sel_color, linewidth=lw))
 
@@ -1070,19 +1868,21 @@ class VisualDesigner:
             ax.add_patch(FancyBboxPatch(
                 (x - w/2, y + 2), w, elem.get('code_height', 8),
                 boxstyle="round,pad=0.2", facecolor='#0a0a12',
-                edgecolor=self.colors['dim'], linewidth=0.8))
-            ax.text(x, y + 6, elem.get('code', 'code')[:15], fontsize=6,
-                   ha='center', va='center', color='#a8ff60', family='monospace')
+                edgecolor=dim, linewidth=0.8))
+            self._canvas_text(ax, elem, 'code', x, y + 6, _trunc(elem.get('code', 'code'), 15),
+                              fontsize=6, ha='center', va='center', color='#a8ff60',
+                              family='monospace')
             # Arrow
-            ax.annotate('', xy=(x, y - 1), xytext=(x, y + 1),
-                       arrowprops=dict(arrowstyle='->', lw=1, color=self.colors['accent']))
+            self._canvas_arrow(ax, elem, 'arrow', (x, y + 1), (x, y - 1), accent, 1,
+                               arrowstyle='->')
             # Output box
             ax.add_patch(FancyBboxPatch(
                 (x - w/2, y - elem.get('output_height', 5) - 1), w, elem.get('output_height', 5),
                 boxstyle="round,pad=0.2", facecolor='#1a2e1a',
-                edgecolor=self.colors['success'], linewidth=0.8))
-            ax.text(x, y - 3, elem.get('output', 'out')[:15], fontsize=6,
-                   ha='center', va='center', color='#60ffa8', family='monospace')
+                edgecolor=success, linewidth=0.8))
+            self._canvas_text(ax, elem, 'output', x, y - 3, _trunc(elem.get('output', 'out'), 15),
+                              fontsize=6, ha='center', va='center', color='#60ffa8',
+                              family='monospace')
             if selected:
                 ax.add_patch(Rectangle((x - w/2 - 1, y - h/2 - 1), w + 2, h + 2,
                                        fill=False, edgecolor=sel_color, linewidth=lw))
@@ -1090,17 +1890,18 @@ class VisualDesigner:
         elif t == 'conversation':
             w = elem.get('width', 35)
             msgs = elem.get('messages', [{'role': 'user', 'content': 'Hello'}])[:3]
-            for i, msg in enumerate(msgs):
+            ys = (y + 6 - np.arange(len(msgs)) * 5).tolist()
+            for i, (msg, by) in enumerate(zip(msgs, ys)):
                 is_user = msg.get('role', 'user') == 'user'
                 bx = x - w/4 if is_user else x + w/4 - w/2
-                by = y + 6 - i * 5
-                color = self.colors['primary'] if is_user else self.colors['secondary']
+                color = primary if is_user else secondary
                 ax.add_patch(FancyBboxPatch(
                     (bx, by - 2), w/2 - 2, 4,
                     boxstyle="round,pad=0.2", facecolor='#1a1a24',
                     edgecolor=color, linewidth=0.8))
-                ax.text(bx + w/4 - 1, by, msg.get('content', '')[:10], fontsize=6,
-                       ha='center', va='center', color=self.colors['text'])
+                self._canvas_text(ax, elem, ('msg', i), bx + w/4 - 1, by,
+                                  _trunc(msg.get('content', ''), 10), fontsize=6, ha='center',
+                                  va='center', color=text_color)
             if selected:
                 ax.add_patch(Rectangle((x - w/2 - 1, y - 10), w + 2, 20,
                                        fill=False, edgecolor=sel_color, linewidth=lw))
@@ -1109,16 +1910,17 @@ class VisualDesigner:
             w = elem.get('width', 40)
             events = elem.get('events', [{'date': '2023', 'title': 'Event'}])[:4]
             # Main line
-            ax.plot([x - w/2, x + w/2], [y, y], color=self.colors['dim'], linewidth=1.5)
+            ax.plot([x - w/2, x + w/2], [y, y], color=dim, linewidth=1.5)
             # Events
             spacing = w / max(len(events) - 1, 1) if len(events) > 1 else 0
-            for i, ev in enumerate(events):
-                ex = x - w/2 + i * spacing
+            xs = (x - w/2 + np.arange(len(events)) * spacing).tolist()
+            for i, (ev, ex) in enumerate(zip(events, xs)):
                 ax.add_patch(Circle((ex, y), 1.2,
-                                   facecolor=self.colors['primary'],
+                                   facecolor=primary,
                                    edgecolor='white', linewidth=0.5))
-                ax.text(ex, y + 3, ev.get('date', '')[:6], fontsize=5,
-                       ha='center', va='bottom', color=self.colors['dim'])
+                self._canvas_text(ax, elem, ('event', i), ex, y + 3, _trunc(ev.get('date', ''), 6),
+                                  fontsize=5, ha='center', va='bottom',
+                                  color=dim)
             if selected:
                 ax.add_patch(Rectangle((x - w/2 - 2, y - 5), w + 4, 10,
                                        fill=False, edgecolor=sel_color, linewidth=lw))
@@ -1127,15 +1929,17 @@ class VisualDesigner:
             items = elem.get('items', [{'title': 'Item'}])[:4]
             base_w = elem.get('base_width', 30)
             box_h = 5
-            for i, item in enumerate(items):
-                w = base_w - i * 3
-                iy = y + (len(items)/2 - i - 0.5) * (box_h + 1)
+            idx = np.arange(len(items))
+            widths = (base_w - idx * 3).tolist()
+            ys = (y + (len(items)/2 - idx - 0.5) * (box_h + 1)).tolist()
+            for i, (item, w, iy) in enumerate(zip(items, widths, ys)):
                 ax.add_patch(FancyBboxPatch(
                     (x - w/2, iy - box_h/2), w, box_h,
                     boxstyle="round,pad=0.2", facecolor='#1a1a24',
-                    edgecolor=self.colors['primary'], linewidth=0.8))
-                ax.text(x, iy, item.get('title', '')[:10], fontsize=6,
-                       ha='center', va='center', color=self.colors['text'])
+                    edgecolor=primary, linewidth=0.8))
+                self._canvas_text(ax, elem, ('item', i), x, iy, _trunc(item.get('title', ''), 10),
+                                  fontsize=6, ha='center', va='center',
+                                  color=text_color)
             if selected:
                 ax.add_patch(Rectangle((x - base_w/2 - 1, y - len(items)*3 - 1),
                                        base_w + 2, len(items)*6 + 2,
@@ -1146,16 +1950,13 @@ class VisualDesigner:
             tokens = elem.get('tokens_x', ['A', 'B', 'C'])[:4]
             n = len(tokens)
             cell_s = min(w, h) / n
-            for i in range(n):
-                for j in range(n):
-                    intensity = 0.8 if i == j else 0.3
-                    cx = x - w/2 + j * cell_s + cell_s/2
-                    cy = y + h/2 - i * cell_s - cell_s/2
-                    ax.add_patch(Rectangle(
-                        (cx - cell_s/2 + 0.2, cy - cell_s/2 + 0.2),
-                        cell_s - 0.4, cell_s - 0.4,
-                        facecolor=plt.cm.viridis(intensity),
-                        edgecolor='#333', linewidth=0.3))
+            # All n*n cells as one collection; diagonal cells are highlighted
+            i, j, _ = _heatmap_cells(n)
+            ax.add_collection(PolyCollection(
+                _rect_verts(x - w/2 + j * cell_s + 0.2, y + h/2 - (i + 1) * cell_s + 0.2,
+                            cell_s - 0.4, cell_s - 0.4),
+                facecolors=np.array([_viridis(0.3), _viridis(0.8)])[(i == j).astype(int)],
+                edgecolors='#333', linewidths=0.3))
             if selected:
                 ax.add_patch(Rectangle((x - w/2 - 1, y - h/2 - 1), w + 2, h + 2,
                                        fill=False, edgecolor=sel_color, linewidth=lw))
@@ -1166,23 +1967,25 @@ class VisualDesigner:
             ax.add_patch(FancyBboxPatch(
                 (x - w/2, y + 4), w, 5,
                 boxstyle="round,pad=0.2", facecolor='#1a1a24',
-                edgecolor=self.colors['primary'], linewidth=0.8))
-            ax.text(x, y + 6.5, elem.get('input_text', 'Hello')[:15], fontsize=6,
-                   ha='center', va='center', color=self.colors['text'])
+                edgecolor=primary, linewidth=0.8))
+            self._canvas_text(ax, elem, 'input_text', x, y + 6.5,
+                              _trunc(elem.get('input_text', 'Hello'), 15), fontsize=6, ha='center',
+                              va='center', color=text_color)
             # Arrow
-            ax.annotate('', xy=(x, y + 1), xytext=(x, y + 3),
-                       arrowprops=dict(arrowstyle='->', lw=1, color=self.colors['accent']))
+            self._canvas_arrow(ax, elem, 'arrow', (x, y + 3), (x, y + 1), accent, 1,
+                               arrowstyle='->')
             # Tokens
-            tokens = elem.get('input_text', 'Hello').split()[:4]
+            tokens = _words(elem.get('input_text', 'Hello'), 4)
             tok_w = min(8, w / len(tokens) - 1) if tokens else 8
-            for i, tok in enumerate(tokens):
-                tx = x - w/2 + 3 + i * (tok_w + 1)
+            xs = (x - w/2 + 3 + np.arange(len(tokens)) * (tok_w + 1)).tolist()
+            for i, (tok, tx) in enumerate(zip(tokens, xs)):
                 ax.add_patch(FancyBboxPatch(
                     (tx, y - 3), tok_w, 4,
                     boxstyle="round,pad=0.1", facecolor='#1a1a24',
-                    edgecolor=self.colors['secondary'], linewidth=0.6))
-                ax.text(tx + tok_w/2, y - 1, tok[:5], fontsize=5,
-                       ha='center', va='center', color=self.colors['text'])
+                    edgecolor=secondary, linewidth=0.6))
+                self._canvas_text(ax, elem, ('token', i), tx + tok_w/2, y - 1, _trunc(tok, 5),
+                                  fontsize=5, ha='center', va='center',
+                                  color=text_color)
             if selected:
                 ax.add_patch(Rectangle((x - w/2 - 1, y - 5), w + 2, 14,
                                        fill=False, edgecolor=sel_color, linewidth=lw))
@@ -1193,43 +1996,44 @@ class VisualDesigner:
             n = len(models)
             col_w = w / (n + 1)
             # Headers
-            for i, m in enumerate(models):
-                mx = x - w/2 + (i + 1.5) * col_w
-                ax.text(mx, y + h/2 - 2, m.get('name', f'M{i+1}')[:6], fontsize=7,
-                       fontweight='bold', ha='center', va='center',
-                       color=self.colors['primary'])
+            xs = (x - w/2 + (np.arange(n) + 1.5) * col_w).tolist()
+            for i, (m, mx) in enumerate(zip(models, xs)):
+                self._canvas_text(ax, elem, ('model', i), mx, y + h/2 - 2,
+                                  _trunc(m.get('name', f'M{i+1}'), 6), fontsize=7, fontweight='bold',
+                                  ha='center', va='center', color=primary)
             # Grid lines
-            for i in range(3):
-                ry = y + h/2 - 5 - i * 6
+            for ry in (y + h/2 - 5 - np.arange(3) * 6).tolist():
                 ax.plot([x - w/2 + col_w, x + w/2], [ry, ry],
-                       color=self.colors['dim'], linewidth=0.5, alpha=0.5)
+                       color=dim, linewidth=0.5, alpha=0.5)
             if selected:
                 ax.add_patch(Rectangle((x - w/2 - 1, y - h/2 - 1), w + 2, h + 2,
                                        fill=False, edgecolor=sel_color, linewidth=lw))
 
         elif t == 'parameter_slider':
             w = elem.get('width', 25)
-            label = elem.get('label', 'Parameter')[:12]
+            label = _trunc(elem.get('label', 'Parameter'), 12)
             val = elem.get('current_value', 0.5)
             min_v, max_v = elem.get('min_value', 0), elem.get('max_value', 1)
             ratio = (val - min_v) / (max_v - min_v) if max_v != min_v else 0.5
             # Label
-            ax.text(x, y + 5, label, fontsize=8, fontweight='bold',
-                   ha='center', va='center', color=self.colors['text'])
+            self._canvas_text(ax, elem, 'label', x, y + 5, label, fontsize=8,
+                              fontweight='bold', ha='center', va='center',
+                              color=text_color)
             # Track
             ax.add_patch(Rectangle((x - w/2, y - 0.5), w, 1,
                                   facecolor='#333', edgecolor='#555', linewidth=0.5))
             # Fill
             ax.add_patch(Rectangle((x - w/2, y - 0.5), w * ratio, 1,
-                                  facecolor=self.colors['accent']))
+                                  facecolor=accent))
             # Handle
             ax.add_patch(Circle((x - w/2 + w * ratio, y), 1.2,
                                facecolor='white',
-                               edgecolor=self.colors['accent'],
+                               edgecolor=accent,
                                linewidth=1))
             # Value
-            ax.text(x - w/2 + w * ratio, y + 2.5, f'{val}', fontsize=7,
-                   ha='center', va='bottom', color=self.colors['accent'])
+            self._canvas_text(ax, elem, 'value', x - w/2 + w * ratio, y + 2.5, f'{val}',
+                              fontsize=7, ha='center', va='bottom',
+                              color=accent)
             if selected:
                 ax.add_patch(Rectangle((x - w/2 - 2, y - 3), w + 4, 10,
                                        fill=False, edgecolor=sel_color, linewidth=lw))
@@ -1238,14 +2042,13 @@ class VisualDesigner:
             before = elem.get('before_weights', [0.5, 0.3])[:4]
             after = elem.get('after_weights', [0.7, 0.5])[:4]
             bar_w = 15
-            for i, (b, a) in enumerate(zip(before, after)):
-                iy = y + 3 - i * 4
-                # Before bar (left)
-                ax.add_patch(Rectangle((x - bar_w - 1, iy - 1), bar_w * b, 2,
-                                       facecolor=self.colors['warning']))
-                # After bar (right)
-                ax.add_patch(Rectangle((x + 1, iy - 1), bar_w * a, 2,
-                                       facecolor=self.colors['success']))
+            n = min(len(before), len(after))
+            ys = y + 3 - np.arange(n) * 4
+            # Before bars (left) and after bars (right)
+            ax.barh(ys, bar_w * np.asarray(before[:n], dtype=float), height=2,
+                    left=x - bar_w - 1, color=warning)
+            ax.barh(ys, bar_w * np.asarray(after[:n], dtype=float), height=2,
+                    left=x + 1, color=success)
             if selected:
                 ax.add_patch(Rectangle((x - bar_w - 2, y - 7), bar_w * 2 + 6, 14,
                                        fill=False, edgecolor=sel_color, linewidth=lw))
@@ -1256,16 +2059,16 @@ class VisualDesigner:
             ax.add_patch(FancyBboxPatch(
                 (x - w/2, y - h/2), w, h,
                 boxstyle="round,pad=0.2", facecolor='#1a1a24',
-                edgecolor=sel_color if selected else self.colors['primary'],
+                edgecolor=sel_color if selected else primary,
                 linewidth=lw))
-            ax.text(x, y, '3D', fontsize=12, fontweight='bold',
-                   ha='center', va='center', color=self.colors['primary'])
+            self._canvas_text(ax, elem, 'badge', x, y, '3D', fontsize=12, fontweight='bold',
+                              ha='center', va='center', color=primary)
             points = elem.get('points', [])[:5]
             for i, pt in enumerate(points):
                 px = x - 6 + i * 3
                 py = y - 3 + (i % 2) * 2
                 ax.add_patch(Circle((px, py), 0.8,
-                                   facecolor=self.colors['accent'],
+                                   facecolor=accent,
                                    edgecolor='none'))
 
         elif t == 'vector_3d':
@@ -1273,15 +2076,15 @@ class VisualDesigner:
             ax.add_patch(FancyBboxPatch(
                 (x - w/2, y - h/2), w, h,
                 boxstyle="round,pad=0.2", facecolor='#1a1a24',
-                edgecolor=sel_color if selected else self.colors['primary'],
+                edgecolor=sel_color if selected else primary,
                 linewidth=lw))
-            ax.text(x, y + 3, 'v3D', fontsize=10, fontweight='bold',
-                   ha='center', va='center', color=self.colors['primary'])
+            self._canvas_text(ax, elem, 'badge', x, y + 3, 'v3D', fontsize=10,
+                              fontweight='bold', ha='center', va='center',
+                              color=primary)
             # Draw some arrows to indicate vectors
             for i, (dx, dy) in enumerate([(3, 2), (-2, 3), (4, -1)]):
-                ax.annotate('', xy=(x + dx, y - 2 + dy), xytext=(x, y - 2),
-                           arrowprops=dict(arrowstyle='->', lw=0.8,
-                                          color=self.colors['accent']))
+                self._canvas_arrow(ax, elem, ('vector', i), (x, y - 2), (x + dx, y - 2 + dy),
+                                   accent, 0.8, arrowstyle='->')
 
         else:
             # Generic placeholder
@@ -1289,10 +2092,10 @@ class VisualDesigner:
             ax.add_patch(FancyBboxPatch(
                 (x - w/2, y - h/2), w, h,
                 boxstyle="round,pad=0.2", facecolor='#1a1a24',
-                edgecolor=sel_color if selected else self.colors['dim'],
+                edgecolor=sel_color if selected else dim,
                 linewidth=lw, linestyle='--'))
-            ax.text(x, y, t[:8], fontsize=7, ha='center', va='center',
-                   color=self.colors['dim'])
+            self._canvas_text(ax, elem, 'badge', x, y, _trunc(t, 8), fontsize=7, ha='center',
+                              va='center', color=dim)
 
     def _get_editable_props(self, elem):
         """Get editable properties for element - comprehensive by element type"""
@@ -1300,172 +2103,16 @@ class VisualDesigner:
         props = []
 
         # === POSITION (most elements) ===
-        if 'position' in elem or elem_type not in ('arrow', 'arc_arrow', 'particle_flow'):
-            pos = elem.get('position', {'x': 50, 'y': 50})
+        if 'position' in elem or elem_type not in _EXTRA_ARROW_PROPS:
+            pos = elem.get('position', _DEFAULT_POS)
             props.append(('x', int(pos['x']), 'pos'))
             props.append(('y', int(pos['y']), 'pos'))
 
         # === BY ELEMENT TYPE ===
 
-        if elem_type == 'text':
-            props.append(('content', str(elem.get('content', ''))[:15], 'str'))
-
-        elif elem_type == 'typewriter_text':
-            props.append(('content', str(elem.get('content', ''))[:15], 'str'))
-            props.append(('show_cursor', elem.get('show_cursor', True), 'bool'))
-            props.append(('cursor_blink_rate', elem.get('cursor_blink_rate', 2.0), 'float'))
-
-        elif elem_type == 'code_block':
-            props.append(('code', str(elem.get('code', ''))[:15], 'str'))
-            props.append(('language', elem.get('language', 'python'), 'str'))
-            props.append(('width', int(elem.get('width', 60)), 'num'))
-            props.append(('height', int(elem.get('height', 25)), 'num'))
-
-        elif elem_type == 'code_execution':
-            props.append(('code', str(elem.get('code', ''))[:15], 'str'))
-            props.append(('output', str(elem.get('output', ''))[:15], 'str'))
-            props.append(('language', elem.get('language', 'python'), 'str'))
-            props.append(('width', int(elem.get('width', 70)), 'num'))
-
-        elif elem_type == 'box':
-            props.append(('title', str(elem.get('title', ''))[:15], 'str'))
-            props.append(('content', str(elem.get('content', ''))[:15], 'str'))
-            props.append(('width', int(elem.get('width', 60)), 'num'))
-            props.append(('height', int(elem.get('height', 20)), 'num'))
-
-        elif elem_type == 'comparison':
-            props.append(('left_title', str(elem.get('left_title', 'Before'))[:12], 'str'))
-            props.append(('right_title', str(elem.get('right_title', 'After'))[:12], 'str'))
-            props.append(('width', int(elem.get('width', 80)), 'num'))
-            props.append(('height', int(elem.get('height', 30)), 'num'))
-
-        elif elem_type == 'conversation':
-            msgs = elem.get('messages', [])
-            props.append(('messages', f'{len(msgs)} msgs', 'list'))
-            props.append(('width', int(elem.get('width', 70)), 'num'))
-            props.append(('stagger', elem.get('stagger', True), 'bool'))
-
-        elif elem_type == 'bullet_list':
-            items = elem.get('items', [])
-            props.append(('items', f'{len(items)} items', 'list'))
-            props.append(('bullet_char', elem.get('bullet_char', '*'), 'str'))
-            props.append(('spacing', elem.get('spacing', 6.0), 'float'))
-            props.append(('stagger', elem.get('stagger', True), 'bool'))
-
-        elif elem_type == 'checklist':
-            items = elem.get('items', [])
-            props.append(('items', f'{len(items)} items', 'list'))
-            props.append(('spacing', elem.get('spacing', 6.5), 'float'))
-            props.append(('fontsize', elem.get('fontsize', 18), 'num'))
-
-        elif elem_type == 'timeline':
-            events = elem.get('events', [])
-            props.append(('events', f'{len(events)} events', 'list'))
-            props.append(('orientation', elem.get('orientation', 'horizontal'), 'choice'))
-            props.append(('width', int(elem.get('width', 80)), 'num'))
-            props.append(('height', int(elem.get('height', 25)), 'num'))
-
-        elif elem_type == 'flow':
-            steps = elem.get('steps', [])
-            props.append(('steps', f'{len(steps)} steps', 'list'))
-            props.append(('width', int(elem.get('width', 80)), 'num'))
-            props.append(('stagger', elem.get('stagger', True), 'bool'))
-
-        elif elem_type == 'grid':
-            items = elem.get('items', [])
-            props.append(('items', f'{len(items)} items', 'list'))
-            props.append(('columns', elem.get('columns', 2), 'num'))
-            props.append(('rows', elem.get('rows', 2), 'num'))
-            props.append(('cell_width', int(elem.get('cell_width', 30)), 'num'))
-            props.append(('cell_height', int(elem.get('cell_height', 18)), 'num'))
-
-        elif elem_type == 'stacked_boxes':
-            items = elem.get('items', [])
-            props.append(('items', f'{len(items)} items', 'list'))
-            props.append(('base_width', int(elem.get('base_width', 70)), 'num'))
-            props.append(('box_height', int(elem.get('box_height', 12)), 'num'))
-
-        elif elem_type in ('arrow', 'arc_arrow', 'particle_flow'):
-            start = elem.get('start', {'x': 30, 'y': 50})
-            end = elem.get('end', {'x': 70, 'y': 50})
-            props.append(('start_x', int(start['x']), 'start'))
-            props.append(('start_y', int(start['y']), 'start'))
-            props.append(('end_x', int(end['x']), 'end'))
-            props.append(('end_y', int(end['y']), 'end'))
-
-            if elem_type == 'arc_arrow':
-                props.append(('arc_height', int(elem.get('arc_height', 15)), 'num'))
-                props.append(('direction', elem.get('direction', 'up'), 'choice'))
-
-            if elem_type == 'particle_flow':
-                props.append(('num_particles', elem.get('num_particles', 30), 'num'))
-                props.append(('particle_size', elem.get('particle_size', 30), 'num'))
-                props.append(('spread', elem.get('spread', 0.5), 'float'))
-
-        elif elem_type == 'neural_network':
-            layers = elem.get('layers', [3, 5, 5, 2])
-            props.append(('layers', str(layers), 'layers'))
-            props.append(('width', int(elem.get('width', 70)), 'num'))
-            props.append(('height', int(elem.get('height', 50)), 'num'))
-            props.append(('show_connections', elem.get('show_connections', True), 'bool'))
-
-        elif elem_type == 'attention_heatmap':
-            props.append(('title', str(elem.get('title', 'Attention'))[:15], 'str'))
-            tokens_x = elem.get('tokens_x', [])
-            props.append(('tokens_x', f'{len(tokens_x)} tokens', 'list'))
-            props.append(('width', int(elem.get('width', 50)), 'num'))
-            props.append(('height', int(elem.get('height', 50)), 'num'))
-            props.append(('show_values', elem.get('show_values', True), 'bool'))
-
-        elif elem_type == 'token_flow':
-            props.append(('input_text', str(elem.get('input_text', ''))[:15], 'str'))
-            props.append(('width', int(elem.get('width', 80)), 'num'))
-            props.append(('height', int(elem.get('height', 40)), 'num'))
-            props.append(('show_embeddings', elem.get('show_embeddings', True), 'bool'))
-
-        elif elem_type == 'model_comparison':
-            models = elem.get('models', [])
-            props.append(('models', f'{len(models)} models', 'list'))
-            props.append(('width', int(elem.get('width', 85)), 'num'))
-            props.append(('height', int(elem.get('height', 50)), 'num'))
-
-        elif elem_type == 'similarity_meter':
-            props.append(('score', int(elem.get('score', 75)), 'num'))
-            props.append(('radius', int(elem.get('radius', 8)), 'num'))
-            props.append(('label', str(elem.get('label', 'Similarity'))[:15], 'str'))
-
-        elif elem_type == 'progress_bar':
-            props.append(('current', elem.get('current', 5), 'num'))
-            props.append(('total', elem.get('total', 10), 'num'))
-            props.append(('width', int(elem.get('width', 30)), 'num'))
-            props.append(('label', str(elem.get('label', 'Progress'))[:15], 'str'))
-
-        elif elem_type == 'weight_comparison':
-            before = elem.get('before_weights', [])
-            after = elem.get('after_weights', [])
-            props.append(('before_weights', f'{len(before)} vals', 'list'))
-            props.append(('after_weights', f'{len(after)} vals', 'list'))
-
-        elif elem_type == 'parameter_slider':
-            props.append(('label', str(elem.get('label', 'Parameter'))[:15], 'str'))
-            props.append(('current_value', elem.get('current_value', 0.5), 'float'))
-            props.append(('min_value', elem.get('min_value', 0.0), 'float'))
-            props.append(('max_value', elem.get('max_value', 1.0), 'float'))
-            props.append(('width', int(elem.get('width', 40)), 'num'))
-
-        elif elem_type == 'scatter_3d':
-            points = elem.get('points', [])
-            props.append(('points', f'{len(points)} pts', 'list'))
-            props.append(('camera_elev', elem.get('camera_elev', 20.0), 'float'))
-            props.append(('camera_azim', elem.get('camera_azim', 45.0), 'float'))
-            props.append(('rotate_camera', elem.get('rotate_camera', False), 'bool'))
-
-        elif elem_type == 'vector_3d':
-            vectors = elem.get('vectors', [])
-            props.append(('vectors', f'{len(vectors)} vecs', 'list'))
-            props.append(('camera_elev', elem.get('camera_elev', 20.0), 'float'))
-            props.append(('camera_azim', elem.get('camera_azim', 45.0), 'float'))
-            props.append(('rotate_camera', elem.get('rotate_camera', False), 'bool'))
+        for name, key, default, caster, kind in _PROP_SCHEMA.get(elem_type, ()):
+            value = elem.get(key, default)
+            props.append((name, caster(value) if caster else value, kind))
 
         return props
 
@@ -1475,85 +2122,159 @@ class VisualDesigner:
         return None
 
     def _get_current_elements(self):
+        """Elements of the current step, bound by _sync_current_elements()"""
+        return self._cur_elements
+
+    def _sync_current_elements(self):
+        """Re-bind the current step's element list and indicator after the schema or step changes"""
         step = self._get_current_step()
-        return step.elements if step else []
+        self._cur_elements = step.elements if step else []
+        self._resolve_selection()
+        step_name = _trunc(step.name, 20) if step else "No step"
+        self._step_label = f'Step {self.current_step + 1}/{len(self.schema.steps)}: {step_name}'
+
+    @property
+    def selected_element(self):
+        """Index of the selected element in the current step, or None"""
+        return self._selected_idx
+
+    @selected_element.setter
+    def selected_element(self, idx):
+        self._selected_idx = idx
+        self._resolve_selection()
+
+    def _resolve_selection(self):
+        """Bind _selected_elem to the selected element dict (None if nothing valid is selected)"""
+        idx = self._selected_idx
+        elements = self._cur_elements
+        self._selected_elem = elements[idx] if idx is not None and idx < len(elements) else None
+
+    def _element_hitbox(self, elem):
+        """Hit region of an element as (min_x, min_y, max_x, max_y, radius)
+
+        A non-zero radius marks a circular region centered in the box.
+        """
+        pos = elem.get('position', _DEFAULT_POS)
+        elem_type = elem.get('type', 'text')
 
-    def _get_element_at(self, x, y):
-        """Find element at canvas position - improved hit detection"""
-        elements = self._get_current_elements()
-        for i in range(len(elements) - 1, -1, -1):
-            elem = elements[i]
-            pos = elem.get('position', {'x': 50, 'y': 50})
-            elem_type = elem.get('type', 'text')
-
-            # Calculate hit box based on element type
-            if elem_type in ('text', 'typewriter_text'):
-                # Text elements - use content length for width estimation
-                content = elem.get('content', 'Text')
-                w = max(10, len(content) * 0.8)
-                h = 6
-            elif elem_type in ('arrow', 'arc_arrow'):
-                # Arrows - use start/end points
-                start = elem.get('start', {'x': pos['x'] - 10, 'y': pos['y']})
-                end = elem.get('end', {'x': pos['x'] + 10, 'y': pos['y']})
-                min_x = min(start['x'], end['x']) - 3
-                max_x = max(start['x'], end['x']) + 3
-                min_y = min(start['y'], end['y']) - 3
-                max_y = max(start['y'], end['y']) + 3
-                if min_x <= x <= max_x and min_y <= y <= max_y:
-                    return i
-                continue
-            elif elem_type == 'particle_flow':
-                # Particle flow - use start/end
-                start = elem.get('start', {'x': pos['x'] - 15, 'y': pos['y']})
-                end = elem.get('end', {'x': pos['x'] + 15, 'y': pos['y']})
-                min_x = min(start['x'], end['x']) - 3
-                max_x = max(start['x'], end['x']) + 3
-                min_y = min(start['y'], end['y']) - 3
-                max_y = max(start['y'], end['y']) + 3
-                if min_x <= x <= max_x and min_y <= y <= max_y:
-                    return i
-                continue
-            elif elem_type == 'similarity_meter':
-                # Meter - circular hit area
-                r = elem.get('radius', 5) + 2
-                if (x - pos['x'])**2 + (y - pos['y'])**2 <= r**2:
-                    return i
-                continue
-            elif elem_type in ('comparison', 'flow', 'grid'):
-                w = elem.get('width', 50) / 2 + 3
-                h = elem.get('height', 18) / 2 + 3
-            elif elem_type == 'neural_network':
-                w = elem.get('width', 35) / 2 + 3
-                h = elem.get('height', 22) / 2 + 3
-            elif elem_type in ('bullet_list', 'checklist'):
-                w = 18
-                h = 12
-            else:
-                w = elem.get('width', 18) / 2 + 5
-                h = elem.get('height', 10) / 2 + 5
+        # Calculate hit box based on element type
+        if elem_type in _TEXT_TYPES:
+            # Text elements - use content length for width estimation
+            content = elem.get('content', 'Text')
+            w = max(10, len(content) * 0.8)
+            h = 6
+        elif elem_type in _ENDPOINT_TYPES:
+            # Arrows and particle flows - use start/end points
+            spread = 15 if elem_type == 'particle_flow' else 10
+            sx, sy, ex, ey = _endpoints(elem, pos['x'], pos['y'], spread)
+            return (min(sx, ex) - 3, min(sy, ey) - 3,
+                    max(sx, ex) + 3, max(sy, ey) + 3, 0)
+        elif elem_type == 'similarity_meter':
+            # Meter - circular hit area
+            r = elem.get('radius', 5) + 2
+            return pos['x'] - r, pos['y'] - r, pos['x'] + r, pos['y'] + r, r
+        else:
+            w_key, w_default, w_div, w_pad, h_key, h_default, h_div, h_pad = \
+                self.HITBOX_SPECS.get(elem_type, self.DEFAULT_HITBOX_SPEC)
+            w = (elem.get(w_key, w_default) if w_key else w_default) / w_div + w_pad
+            h = (elem.get(h_key, h_default) if h_key else h_default) / h_div + h_pad
 
-            # Check hit box
-            if pos['x'] - w <= x <= pos['x'] + w and pos['y'] - h <= y <= pos['y'] + h:
-                return i
+        return pos['x'] - w, pos['y'] - h, pos['x'] + w, pos['y'] + h, 0
 
-        return None
+    def _get_element_hitboxes(self):
+        """(N, 5) hit regions of the current step's elements, rebuilt after each edit"""
+        if self._elem_hitboxes is None or self._elem_hitboxes[0] != self._edit_rev:
+            self._elem_hitboxes = (self._edit_rev, np.array(
+                [self._element_hitbox(elem) for elem in self._get_current_elements()],
+                dtype=float).reshape(-1, 5))
+        return self._elem_hitboxes[1]
+
+    def _get_element_at(self, x, y):
+        """Find the topmost element at canvas position"""
+        boxes = self._get_element_hitboxes()
+        min_x, min_y, max_x, max_y, r = boxes.T
+        hits = (min_x <= x) & (x <= max_x) & (min_y <= y) & (y <= max_y)
+        # Circular regions also need the point inside the radius
+        hits &= (r == 0) | ((x - (min_x + max_x) / 2)**2 + (y - (min_y + max_y) / 2)**2 <= r**2)
+        idx = np.flatnonzero(hits)
+        return int(idx[-1]) if len(idx) else None
 
     def _refresh_canvas_only(self):
         """Fast refresh - only redraw canvas"""
-        self._draw_canvas()
-        self.fig.canvas.draw_idle()
-        self.fig.canvas.flush_events()
+        self._schedule_redraw('canvas')
 
     def _refresh_all(self):
         """Full refresh of all panels"""
-        self._draw_top_bar()
-        self._draw_left_panel()
-        self._draw_right_panel()
-        self._draw_bottom_bar()
-        self._draw_canvas()
-        self.fig.canvas.draw_idle()
-        self.fig.canvas.flush_events()
+        self._schedule_redraw('top', 'left', 'right', 'bottom', 'canvas')
+
+    def _schedule_redraw(self, *regions):
+        """Mark panels dirty and schedule a single redraw for all of them"""
+        # Every edit ends here, so this invalidates the hit-test and preview caches
+        self._edit_rev += 1
+        self._dirty.update(regions)
+        if self._preview_alive and ('canvas' in regions or 'right' in regions):
+            self._schedule_preview_render()
+        if not self._redraw_pending and not self._update_depth:
+            self._redraw_pending = True
+            self._redraw_timer.start()
+
+    def _schedule_drag_redraw(self, *regions):
+        """Schedule a redraw while dragging, drawing at once if a frame has already passed
+
+        The first motion event after a quiet frame redraws immediately; later ones in
+        the same frame fall through to the timer, which drains the final position.
+        """
+        self._schedule_redraw(*regions)
+        if (not self._update_depth
+                and time.monotonic() - self._last_redraw >= self.REDRAW_INTERVAL_MS / 1000):
+            self._redraw_timer.stop()
+            self._do_redraw()
+
+    @contextmanager
+    def _batched(self):
+        """Hold back redraws until the outermost batch ends, then schedule one for all of them"""
+        self._update_depth += 1
+        try:
+            yield
+        finally:
+            self._update_depth -= 1
+            if not self._update_depth and self._dirty and not self._redraw_pending:
+                self._redraw_pending = True
+                self._redraw_timer.start()
+
+    def _do_redraw(self):
+        """Redraw only the dirty panels, then request one figure draw"""
+        self._redraw_pending = False
+        if self._update_depth:
+            # A timer started before the batch fired inside it (e.g. from a dialog's
+            # event loop); the batch reschedules once it ends
+            return
+        self._last_redraw = time.monotonic()
+        dirty, self._dirty = self._dirty, set()
+        if 'top' in dirty:
+            self._draw_top_bar()
+        if 'left' in dirty:
+            self._draw_left_panel()
+        if 'right' in dirty:
+            self._draw_right_panel()
+        if 'bottom' in dirty:
+            self._update_bottom_bar()
+        if 'canvas' in dirty:
+            self._draw_canvas()
+
+        canvas = self.fig.canvas
+        if not dirty or 'canvas' in dirty or not self._fig_drawn or not canvas.supports_blit:
+            canvas.draw_idle()
+            return
+        # Only side panels changed: repaint their axes and blit just those regions
+        for region in dirty:
+            ax = self._panel_axes[region]
+            self.fig.draw_artist(ax)
+            canvas.blit(ax.bbox)
+
+    def _on_draw(self, event):
+        """Note a full figure draw, which partial panel repaints build on"""
+        self._fig_drawn = True
 
     # Event handlers
     def _on_click(self, event):
@@ -1572,16 +2293,14 @@ class VisualDesigner:
         if y is None:
             return
 
-        for y_min, y_max, elem_type in self.elem_boxes:
-            if y_min <= y <= y_max:
-                if self.placing_element == elem_type:
-                    self.placing_element = None
-                else:
-                    self.placing_element = elem_type
-                self._draw_left_panel()
-                self._draw_canvas()
-                self.fig.canvas.draw_idle()
-                return
+        hit = _band_lookup(self._left_click_index, 0, y)
+        if hit is not None:
+            elem_type = self.elem_boxes[hit[1]][2]
+            if self.placing_element == elem_type:
+                self.placing_element = None
+            else:
+                self.placing_element = elem_type
+            self._schedule_redraw('left', 'canvas')
 
     def _handle_canvas_click(self, event):
         """Handle click on canvas"""
@@ -1611,14 +2330,12 @@ class VisualDesigner:
             self.selected_element = clicked
             self.dragging = True
             elem = self._get_current_elements()[clicked]
-            pos = elem.get('position', {'x': 50, 'y': 50})
+            pos = elem.get('position', _DEFAULT_POS)
             self.drag_offset = (x - pos['x'], y - pos['y'])
         else:
             self.selected_element = None
 
-        self._draw_canvas()
-        self._draw_right_panel()
-        self.fig.canvas.draw_idle()
+        self._schedule_redraw('canvas', 'right')
 
     def _handle_right_panel_click(self, event):
         """Handle click on properties panel"""
@@ -1626,55 +2343,38 @@ class VisualDesigner:
         if x is None or y is None:
             return
 
-        # Check tab buttons first
-        for y_min, y_max, x_min, x_max, tab_id in self.tab_buttons:
-            if y_min <= y <= y_max and x_min <= x <= x_max:
-                if self.props_tab != tab_id:
-                    self.props_tab = tab_id
-                    self._draw_right_panel()
-                    self.fig.canvas.draw_idle()
-                return
-
-        # Check phase buttons
-        for y_min, y_max, x_min, x_max, phase in self.phase_buttons:
-            if y_min <= y <= y_max and x_min <= x <= x_max:
-                self._save_undo_state()
-                self._set_phase(phase)
-                return
-
-        # Check easing buttons
-        for y_min, y_max, x_min, x_max, easing in self.easing_buttons:
-            if y_min <= y <= y_max and x_min <= x <= x_max:
-                self._save_undo_state()
-                self._set_easing(easing)
-                return
-
-        # Check effect buttons
-        for y_min, y_max, x_min, x_max, effect in self.effect_buttons:
-            if y_min <= y <= y_max and x_min <= x <= x_max:
-                self._save_undo_state()
-                self._set_effect(effect)
-                return
+        hit = _band_lookup(self._right_click_index, x, y)
+        if hit is None:
+            return
+        group, i = hit
 
-        # Check slider buttons
-        for y_min, y_max, x_min, x_max, prop_name, min_val, max_val in self.slider_buttons:
-            if y_min <= y <= y_max and x_min <= x <= x_max:
-                self._save_undo_state()
-                # Calculate value from click position
-                pct = (x - x_min) / (x_max - x_min)
-                pct = max(0, min(1, pct))
-                new_val = min_val + pct * (max_val - min_val)
-                # Round to 1 decimal
-                new_val = round(new_val, 1)
-                self._set_timing_prop(prop_name, new_val)
-                return
+        if group == 'tab':
+            tab_id = self.tab_vals[i]
+            if self.props_tab != tab_id:
+                self.props_tab = tab_id
+                self._schedule_redraw('right')
+            return
 
-        # Check property buttons
-        for y_min, y_max, x_min, x_max, prop_name, elem_idx in self.prop_buttons:
-            if y_min <= y <= y_max and x_min <= x <= x_max:
-                self._save_undo_state()
-                self._edit_property_by_index(prop_name, elem_idx)
-                return
+        self._save_undo_state()
+        if group == 'phase':
+            self._set_phase(self.phase_vals[i])
+        elif group == 'easing':
+            self._set_easing(self.easing_vals[i])
+        elif group == 'effect':
+            self._set_effect(self.effect_vals[i])
+        elif group == 'slider':
+            prop_name, min_val, max_val = self.slider_vals[i]
+            x_min, x_max = self.slider_bboxes[i, 2:]
+            # Calculate value from click position
+            pct = (x - x_min) / (x_max - x_min)
+            pct = max(0, min(1, pct))
+            new_val = min_val + pct * (max_val - min_val)
+            # Round to 1 decimal
+            new_val = round(float(new_val), 1)
+            self._set_timing_prop(prop_name, new_val)
+        else:
+            prop_name, elem_idx = self.prop_vals[i]
+            self._edit_property_by_index(prop_name, elem_idx)
 
     def _handle_bottom_click(self, event):
         """Handle click on navigation bar"""
@@ -1682,21 +2382,25 @@ class VisualDesigner:
         if x is None or y is None:
             return
 
-        for x_min, x_max, y_min, y_max, action in self.nav_buttons:
-            if x_min <= x <= x_max and y_min <= y <= y_max:
-                if action == 'prev':
-                    self._prev_step()
-                elif action == 'next':
-                    self._next_step()
-                elif action == 'add':
-                    self._add_step()
-                elif action == 'del':
-                    self._delete_step()
-                return
+        hit = _band_lookup(self._nav_click_index, x, y)
+        if hit is not None:
+            action = self.nav_vals[hit[1]]
+            if action == 'prev':
+                self._prev_step()
+            elif action == 'next':
+                self._next_step()
+            elif action == 'add':
+                self._add_step()
+            elif action == 'del':
+                self._delete_step()
 
     def _on_release(self, event):
         if self.dragging:
             self.unsaved = True
+            # Motion below the redraw step may not have been drawn; show the exact drop
+            if self._last_drag_pos is not None:
+                self._refresh_canvas_only()
+        self._last_drag_pos = None
         self.dragging = False
         self.scaling = False
         self.scale_start = None
@@ -1710,12 +2414,13 @@ class VisualDesigner:
                 # Scale factor based on vertical drag
                 scale_delta = dy * 0.02
                 new_scale = max(0.5, min(3.0, start_scale + scale_delta))
-                if abs(new_scale - self.canvas_scale) > 0.01:
+                if abs(new_scale - self.canvas_scale) >= 0.02:
                     self.canvas_scale = new_scale
                     self._update_canvas_zoom()
             return
 
-        if not self.dragging or self.selected_element is None:
+        elem = self._selected_elem
+        if not self.dragging or elem is None:
             return
         if event.inaxes != self.ax_canvas:
             return
@@ -1724,12 +2429,23 @@ class VisualDesigner:
         if x is None or y is None:
             return
 
-        elements = self._get_current_elements()
-        if self.selected_element < len(elements):
-            new_x = max(5, min(95, x - self.drag_offset[0]))
-            new_y = max(5, min(95, y - self.drag_offset[1]))
-            elements[self.selected_element]['position'] = {'x': new_x, 'y': new_y}
-            self._refresh_canvas_only()
+        new_x = max(5, min(95, x - self.drag_offset[0]))
+        new_y = max(5, min(95, y - self.drag_offset[1]))
+        elem['position'] = {'x': new_x, 'y': new_y}
+        # Skip redraws for motion within the same half canvas unit
+        drag_pos = (round(new_x * 2) / 2, round(new_y * 2) / 2)
+        if drag_pos != self._last_drag_pos:
+            self._last_drag_pos = drag_pos
+            self._schedule_drag_redraw('canvas')
+
+    def _visible_elements(self):
+        """Per current element, whether its hit box reaches into the canvas view"""
+        x0, x1 = self.ax_canvas.get_xlim()
+        y0, y1 = self.ax_canvas.get_ylim()
+        min_x, min_y, max_x, max_y, _ = self._get_element_hitboxes().T
+        margin = self.CULL_MARGIN
+        return ((max_x >= x0 - margin) & (min_x <= x1 + margin) &
+                (max_y >= y0 - margin) & (min_y <= y1 + margin)).tolist()
 
     def _update_canvas_zoom(self):
         """Update canvas view based on scale"""
@@ -1737,7 +2453,11 @@ class VisualDesigner:
         half_range = 50 / self.canvas_scale
         self.ax_canvas.set_xlim(center - half_range, center + half_range)
         self.ax_canvas.set_ylim(center - half_range, center + half_range)
-        self.fig.canvas.draw_idle()
+        # Rebuild the elements only when the new view culls a different set
+        if self._visible_elements() != self._canvas_visible:
+            self._schedule_drag_redraw('canvas')
+        else:
+            self._schedule_drag_redraw()
 
     def _on_scroll(self, event):
         if event.inaxes == self.ax_left:
@@ -1746,54 +2466,28 @@ class VisualDesigner:
                 self.scroll_offset = max(0, self.scroll_offset - 1)
             else:
                 self.scroll_offset = min(max_scroll, self.scroll_offset + 1)
-            self._draw_left_panel()
-            self.fig.canvas.draw_idle()
+            self._schedule_redraw('left')
 
     def _on_key(self, event):
-        key = event.key
-
-        # Undo/Redo
-        if key == 'ctrl+z':
-            self._undo()
+        binding = self.KEY_BINDINGS.get(event.key)
+        if binding is None:
             return
-        elif key in ('ctrl+shift+z', 'ctrl+Z'):  # Shift makes Z uppercase
-            self._redo()
-            return
-
-        if key == 'escape':
-            self.placing_element = None
-            self.selected_element = None
-            self._refresh_all()
-        elif key in ('delete', 'backspace'):
-            self._save_undo_state()
-            self._delete_selected()
-        elif key == 'd':
+        action, undoable = binding
+        if undoable:
             self._save_undo_state()
-            self._duplicate_selected()
-        elif key == 'e':
-            self._save_undo_state()
-            self._edit_selected()
-        elif key == 's':
-            self._save()
-        elif key == 'o':
-            self._open_file()
-        elif key == 'n':
-            self._new_file()
-        elif key == 'g':
-            self._generate()
-        elif key == 'p':
-            self._open_preview_window()
-        elif key == 'left':
-            self._prev_step()
-        elif key == 'right':
-            self._next_step()
-        elif key == 'q':
-            self._quit()
+        getattr(self, action)()
+
+    def _clear_selection(self):
+        """Cancel placement and deselect"""
+        self.placing_element = None
+        self.selected_element = None
+        self._refresh_all()
 
     # Preview window with animation controls
     def _open_preview_window(self):
         """Open a separate preview window with animation controls"""
         if self.preview_fig is not None:
+            self._preview_alive = False
             try:
                 plt.close(self.preview_fig)
             except:
@@ -1805,28 +2499,54 @@ class VisualDesigner:
         self.preview_ax = self.preview_fig.add_axes([0.05, 0.15, 0.9, 0.8])
         self.preview_ax.set_facecolor(self.CANVAS_BG)
         for spine in self.preview_ax.spines.values():
-            spine.set_color(self.colors['primary'])
+            spine.set_color(self._rgba['primary'])
             spine.set_linewidth(2)
 
         self.preview_controls_ax = self.preview_fig.add_axes([0.05, 0.02, 0.9, 0.10])
         self.preview_controls_ax.set_facecolor(self.PANEL_HEADER)
         self.preview_controls_ax.axis('off')
 
+        # Pooled patches carry the old axes' transforms
+        self._preview_artists = {}
+        self._preview_moving = []
+        self._preview_bg = None
+        self._clear_preview_frames()
+        self._preview_blit_bbox = None
+        self._preview_controls = None
         self._render_preview_step()
         self._draw_preview_controls()
 
         self.preview_fig.canvas.mpl_connect('key_press_event', self._on_preview_key)
         self.preview_fig.canvas.mpl_connect('button_press_event', self._on_preview_click)
+        self.preview_fig.canvas.mpl_connect('close_event', self._on_preview_close)
+        self._preview_timer = self.preview_fig.canvas.new_timer(interval=self.PREVIEW_REFRESH_MS)
+        self._preview_timer.single_shot = True
+        self._preview_timer.add_callback(self._flush_preview)
+        self._preview_dirty = False
+        self._preview_alive = True
 
         self.preview_fig.show()
 
-    def _render_preview_step(self):
-        """Render current step in preview window"""
+    def _render_preview_step(self, animated=False):
+        """Render current step in preview window
+
+        With animated=True, artists of elements still mid-transition, and every artist a
+        full draw would stack above them, are flagged animated and collected in draw
+        order in _preview_moving for _blit_preview_frame.
+        """
         if self.preview_ax is None:
             return
+        self._preview_dirty = False
+
+        # Pooled patches may still be flagged from the last blitted frame
+        for artist in self._preview_moving:
+            artist.set_animated(False)
+        self._preview_moving = []
 
         ax = self.preview_ax
         ax.clear()
+        # Spines, axis and title artists that get_children() lists after added artists
+        tail = len(ax.get_children())
         ax.set_facecolor(self.CANVAS_BG)
         ax.set_xlim(0, 100)
         ax.set_ylim(0, 100)
@@ -1835,437 +2555,608 @@ class VisualDesigner:
         if step:
             if step.title:
                 ax.text(50, 95, step.title, fontsize=18, fontweight='bold',
-                        ha='center', va='top', color=self.colors['primary'])
-
-            for elem in step.elements:
-                self._draw_preview_element_full(ax, elem, self.animation_progress)
+                        ha='center', va='top', color=self._rgba['primary'])
+
+            starts, ends, easing_ids, views = self._preview_timing(step)
+            alphas = _vectorized_alpha(self.animation_progress, starts, ends, easing_ids)
+            # Raw progress, as eased alphas can overshoot 1 before the transition ends
+            settled = self.animation_progress >= ends
+            moving = set()
+            # Leading artists of the full-draw order that stay in the background
+            baked = None
+            for i in np.flatnonzero(alphas > 0):
+                if not animated or settled[i]:
+                    self._draw_preview_element_full(ax, step.elements[i], views[i], float(alphas[i]))
+                    continue
+                n = len(ax.get_children())
+                self._draw_preview_element_full(ax, step.elements[i], views[i], float(alphas[i]))
+                children = ax.get_children()
+                moving.update(children[n - tail:len(children) - tail])
+            if moving:
+                # A full draw stacks by zorder, then insertion order; settled artists it
+                # would draw above a moving one can't stay baked into the background
+                children = ax.get_children()
+                order = sorted(children[:len(children) - tail], key=lambda artist: artist.get_zorder())
+                baked = next(i for i, artist in enumerate(order) if artist in moving)
+                self._preview_moving = order[baked:]
+                for artist in self._preview_moving:
+                    artist.set_animated(True)
+            self._preview_static_key = (id(step), self._edit_rev, settled.tobytes(), baked)
+
+            # Drop pooled patches of elements no longer on this step
+            live = {id(elem) for elem in step.elements}
+            self._preview_artists = {key: patch for key, patch in self._preview_artists.items()
+                                     if key[0] in live}
 
         ax.axis('off')
         for spine in ax.spines.values():
             spine.set_visible(True)
-            spine.set_color(self.colors['primary'])
+            spine.set_color(self._rgba['primary'])
             spine.set_linewidth(2)
 
-    def _apply_easing(self, t, easing):
-        """Apply easing function to normalized time t (0-1)"""
-        import math
-        if easing == 'linear':
-            return t
-        elif easing == 'ease_in':
-            return t * t
-        elif easing == 'ease_out':
-            return 1 - (1 - t) ** 2
-        elif easing == 'ease_in_out':
-            return 3 * t * t - 2 * t * t * t
-        elif easing == 'ease_in_cubic':
-            return t * t * t
-        elif easing == 'ease_out_cubic':
-            return 1 - (1 - t) ** 3
-        elif easing == 'elastic_out':
-            if t == 0 or t == 1:
-                return t
-            return math.pow(2, -10 * t) * math.sin((t - 0.075) * (2 * math.pi) / 0.3) + 1
-        elif easing == 'bounce_out':
-            if t < 1/2.75:
-                return 7.5625 * t * t
-            elif t < 2/2.75:
-                t -= 1.5/2.75
-                return 7.5625 * t * t + 0.75
-            elif t < 2.5/2.75:
-                t -= 2.25/2.75
-                return 7.5625 * t * t + 0.9375
-            else:
-                t -= 2.625/2.75
-                return 7.5625 * t * t + 0.984375
-        return t  # fallback to linear
-
-    def _draw_preview_element_full(self, ax, elem, progress):
-        """Draw element in full preview with animation progress"""
-        phase = elem.get('animation_phase', 'early')
-        phase_ranges = {
-            'immediate': (0.0, 0.2),
-            'early': (0.2, 0.4),
-            'middle': (0.4, 0.6),
-            'late': (0.6, 0.8),
-            'final': (0.8, 1.0)
-        }
-
-        start, end = phase_ranges.get(phase, (0.2, 0.4))
-
-        # Apply duration and delay from timing controls
-        duration = elem.get('duration', 1.0)
-        delay = elem.get('delay', 0.0)
-        speed = elem.get('speed', 1.0)
-
-        # Delay shifts the start point (delay of 1.0s = shift by 10%)
-        start = start + delay * 0.1
-
-        # Duration affects how long the element animates
-        phase_duration = (end - start) * duration
-        end = min(1.0, start + phase_duration)
-
-        # Calculate base alpha
-        if progress < start:
-            alpha = 0.0
-        elif progress >= end:
-            alpha = 1.0
-        else:
-            t = (progress - start) / (end - start)
-            # Apply easing
-            easing = elem.get('easing', 'ease_in_out')
-            alpha = self._apply_easing(t, easing)
-
-        if alpha <= 0:
+    def _blit_preview_frame(self):
+        """Show an animated frame by drawing moving artists and controls over the cached background"""
+        fig = self.preview_fig
+        canvas = fig.canvas
+        if not canvas.supports_blit:
+            canvas.draw_idle()
             return
 
-        # Store speed for element-specific animations
-        elem_speed = speed
-
-        t = elem.get('type', 'text')
-        pos = elem.get('position', {'x': 50, 'y': 50})
-        x, y = pos['x'], pos['y']
-
-        if t in ('text', 'typewriter_text'):
-            content = elem.get('content', 'Text')
-            if t == 'typewriter_text':
-                # Apply speed to typewriter - faster speed = more characters visible
-                type_progress = min(1.0, alpha * elem_speed)
-                visible_chars = int(len(content) * type_progress)
-                display_content = content[:visible_chars]
-                if visible_chars < len(content):
-                    display_content += '|'
-                ax.text(x, y, display_content, fontsize=14, ha='center', va='center',
-                       color=self.colors['text'], alpha=min(1.0, alpha * 2))
-            else:
-                ax.text(x, y, content, fontsize=14, ha='center', va='center',
-                       color=self.colors['text'], alpha=alpha)
-
-        elif t == 'box':
-            w, h = elem.get('width', 25), elem.get('height', 12)
-            ax.add_patch(FancyBboxPatch(
-                (x - w/2, y - h/2), w, h,
-                boxstyle="round,pad=0.3",
-                facecolor='#1a1a24',
-                edgecolor=self.colors['primary'],
-                linewidth=1.5, alpha=alpha))
-            if elem.get('title'):
-                ax.text(x, y + h/4, elem['title'], fontsize=11,
-                       fontweight='bold', ha='center', color=self.colors['primary'], alpha=alpha)
-
-        elif t == 'bullet_list':
-            items = elem.get('items', [])
-            stagger = elem.get('stagger', 0.1)
-            for j, item in enumerate(items):
-                item_alpha = min(1.0, max(0, (alpha - j * stagger) / (1 - j * stagger))) if stagger else alpha
-                if item_alpha > 0:
-                    ax.text(x - 10, y + 6 - j * 5, f'* {item}',
-                           fontsize=10, ha='left', color=self.colors['text'], alpha=item_alpha)
+        key = (self._preview_static_key, canvas.get_width_height())
+        if self._preview_bg is None or key != self._preview_bg_key:
+            # Full draw without animated artists or changing controls, then cache it
+            controls = self._preview_control_artists
+            for artist in controls:
+                artist.set_animated(True)
+            canvas.draw()
+            for artist in controls:
+                artist.set_animated(False)
+            self._preview_bg = canvas.copy_from_bbox(fig.bbox)
+            self._preview_bg_key = key
+
+        canvas.restore_region(self._preview_bg)
+        # Already in full-draw stacking order
+        for artist in self._preview_moving:
+            self.preview_ax.draw_artist(artist)
+        bbox = self._preview_frame_bbox()
+        self._cache_preview_frame(bbox, canvas.copy_from_bbox(bbox))
+        self._blit_preview_region(bbox)
+
+    def _preview_frame_bbox(self):
+        """Figure region a blitted frame changes: the preview axes, grown to take in
+        moving text that spills past them (text is not clipped to the axes)"""
+        renderer = self.preview_fig.canvas.get_renderer()
+        spill = [artist.get_window_extent(renderer) for artist in self._preview_moving
+                 if isinstance(artist, Text) and artist.get_visible() and artist.get_text()]
+        bbox = Bbox.union([self.preview_ax.bbox, *spill]) if spill else self.preview_ax.bbox
+        return Bbox.intersection(bbox, self.preview_fig.bbox).frozen()
+
+    def _blit_preview_region(self, bbox):
+        """Draw the changing controls artists, then blit the frame region (and the last
+        frame's, erasing its spilled text) and the controls axes"""
+        controls_ax = self.preview_controls_ax
+        for artist in self._preview_control_artists:
+            controls_ax.draw_artist(artist)
+        canvas = self.preview_fig.canvas
+        last = self._preview_blit_bbox
+        canvas.blit(Bbox.union([bbox, last]) if last is not None else bbox)
+        canvas.blit(controls_ax.bbox)
+        self._preview_blit_bbox = bbox
+
+    def _preview_frame_key(self):
+        """Frame cache key: ((id(step), edit rev, canvas size), playback frame index)"""
+        owner = (id(self._get_current_step()), self._edit_rev,
+                 self.preview_fig.canvas.get_width_height())
+        return owner, round(self.animation_progress * self.PREVIEW_FRAMES)
+
+    def _clear_preview_frames(self, owner=None):
+        """Drop all replayable frames; later ones belong to owner"""
+        self._preview_frames.clear()
+        self._preview_frames_for = owner
+        self._preview_frames_bytes = 0
+
+    def _cache_preview_frame(self, bbox, pixels):
+        """Keep a blitted frame for replay while the cache is under its byte budget
+
+        Frames are never evicted for newer ones: playback loops through them in order,
+        where least-recently-used eviction would drop each frame just before its replay.
+        """
+        owner, index = self._preview_frame_key()
+        if owner != self._preview_frames_for:
+            self._clear_preview_frames(owner)
+        old = self._preview_frames.pop(index, None)
+        if old is not None:
+            self._preview_frames_bytes -= old[3]
+        nbytes = 4 * math.ceil(bbox.width) * math.ceil(bbox.height)
+        if self._preview_frames_bytes + nbytes <= self.PREVIEW_FRAME_CACHE_BYTES:
+            self._preview_frames[index] = (self._preview_bg_key, bbox, pixels, nbytes)
+            self._preview_frames_bytes += nbytes
+
+    def _restore_preview_frame(self):
+        """Blit a cached frame for the current progress with fresh controls; False on a miss"""
+        canvas = self.preview_fig.canvas
+        if not canvas.supports_blit:
+            return False
+        owner, index = self._preview_frame_key()
+        cached = self._preview_frames.get(index) if owner == self._preview_frames_for else None
+        # Pixels outside the cached region come from the background, so it has to be
+        # the one the frame was drawn over
+        if cached is None or cached[0] != self._preview_bg_key:
+            return False
+        _, bbox, pixels, _ = cached
+        canvas.restore_region(self._preview_bg)
+        canvas.restore_region(pixels)
+        self._blit_preview_region(bbox)
+        return True
 
-        elif t == 'comparison':
-            w, h = elem.get('width', 50), elem.get('height', 18)
-            ax.add_patch(FancyBboxPatch(
-                (x - w/2, y - h/2), w/2 - 1, h,
-                boxstyle="round,pad=0.2", facecolor='#1a1a24',
-                edgecolor=self.colors['warning'], linewidth=1.5, alpha=alpha))
-            ax.add_patch(FancyBboxPatch(
-                (x + 1, y - h/2), w/2 - 1, h,
-                boxstyle="round,pad=0.2", facecolor='#1a1a24',
-                edgecolor=self.colors['success'], linewidth=1.5, alpha=alpha))
-            if elem.get('left_title'):
-                ax.text(x - w/4, y + h/3, elem['left_title'], fontsize=9,
-                       fontweight='bold', ha='center', color=self.colors['warning'], alpha=alpha)
-            if elem.get('right_title'):
-                ax.text(x + w/4, y + h/3, elem['right_title'], fontsize=9,
-                       fontweight='bold', ha='center', color=self.colors['success'], alpha=alpha)
-
-        elif t in ('arrow', 'arc_arrow'):
-            start = elem.get('start', {'x': x - 10, 'y': y})
-            end = elem.get('end', {'x': x + 10, 'y': y})
-            ex = start['x'] + (end['x'] - start['x']) * alpha
-            ey = start['y'] + (end['y'] - start['y']) * alpha
-            style = 'arc3,rad=0.2' if t == 'arc_arrow' else None
-            ax.annotate('', xy=(ex, ey), xytext=(start['x'], start['y']),
-                       arrowprops=dict(arrowstyle='-|>', lw=2,
-                                      color=self.colors['primary'],
-                                      connectionstyle=style))
-
-        elif t == 'similarity_meter':
-            r = elem.get('radius', 5)
-            score = elem.get('score', 75)
-            current_score = score * alpha
-            ax.add_patch(Wedge((x, y), r, 0, 180,
-                              facecolor='#1a1a24',
-                              edgecolor=self.colors['dim'],
-                              linewidth=1.5))
-            fill_angle = 180 * (1 - current_score / 100)
-            ax.add_patch(Wedge((x, y), r, fill_angle, 180,
-                              facecolor=self.colors['success'],
-                              edgecolor='none'))
-            ax.text(x, y - 2, f"{int(current_score)}%", fontsize=10,
-                   ha='center', va='center', color='white', fontweight='bold')
-
-        elif t == 'progress_bar':
-            w = elem.get('width', 18)
-            current = elem.get('current', 5)
-            total = elem.get('total', 10)
-            ax.add_patch(Rectangle((x - w/2, y - 2), w, 4,
-                                  facecolor='#1a1a24',
-                                  edgecolor=self.colors['dim'],
-                                  linewidth=1.5, alpha=alpha))
-            fill = w * (current / max(total, 1)) * alpha
-            ax.add_patch(Rectangle((x - w/2, y - 2), fill, 4,
-                                  facecolor=self.colors['success'], alpha=alpha))
-
-        elif t == 'neural_network':
-            w, h = elem.get('width', 35), elem.get('height', 22)
-            layers = elem.get('layers', [3, 4, 2])
-            sp = w / (len(layers) + 1)
-            for li, n in enumerate(layers):
-                layer_alpha = min(1.0, max(0, alpha * len(layers) - li))
-                lx = x - w/2 + (li + 1) * sp
-                ns = h / (n + 1)
-                for ni in range(n):
-                    ny = y - h/2 + (ni + 1) * ns
-                    ax.add_patch(Circle((lx, ny), 1.2,
-                                       facecolor=self.colors['primary'],
-                                       edgecolor='white', linewidth=0.5,
-                                       alpha=layer_alpha))
-
-        elif t == 'particle_flow':
-            start_pos = elem.get('start', {'x': x - 15, 'y': y})
-            end_pos = elem.get('end', {'x': x + 15, 'y': y})
-            n = elem.get('num_particles', 15)
-            # Apply speed to particle movement
-            flow_alpha = min(1.0, alpha * elem_speed)
-            for i in range(n):
-                # Stagger particles and apply speed
-                t_pos = ((i / n) + flow_alpha * 2) % 1.0
-                px = start_pos['x'] + (end_pos['x'] - start_pos['x']) * t_pos
-                py = start_pos['y'] + (end_pos['y'] - start_pos['y']) * t_pos
-                # Add some vertical spread based on particle index
-                spread = elem.get('spread', 0.5)
-                py += np.sin(i * 1.5) * spread * 3
-                size = 0.8 + np.sin(t_pos * np.pi) * 0.4
-                particle_alpha = 0.3 + np.sin(t_pos * np.pi) * 0.6
-                ax.add_patch(Circle((px, py), size,
-                                   facecolor=self.colors['accent'],
-                                   edgecolor='none', alpha=particle_alpha * alpha))
-
-        elif t == 'code_block':
-            w, h = elem.get('width', 30), elem.get('height', 15)
-            ax.add_patch(FancyBboxPatch(
-                (x - w/2, y - h/2), w, h,
-                boxstyle="round,pad=0.2", facecolor='#0d1117',
-                edgecolor=self.colors['dim'], linewidth=1.5, alpha=alpha))
-            code = elem.get('code', '# code')[:40]
-            ax.text(x - w/2 + 2, y + h/4, code, fontsize=8, family='monospace',
-                   ha='left', va='center', color=self.colors['secondary'], alpha=alpha)
-
-        elif t == 'code_execution':
-            w = elem.get('width', 35)
-            code_h, out_h = elem.get('code_height', 8), elem.get('output_height', 5)
-            # Code box
-            ax.add_patch(FancyBboxPatch(
-                (x - w/2, y + 2), w, code_h,
-                boxstyle="round,pad=0.2", facecolor='#0d1117',
-                edgecolor=self.colors['dim'], linewidth=1, alpha=alpha))
-            # Output box
-            ax.add_patch(FancyBboxPatch(
-                (x - w/2, y - out_h - 2), w, out_h,
+    def _apply_easing(self, t, easing):
+        """Apply easing function to normalized time t (0-1)"""
+        t = np.asarray(min(max(t, 0.0), 1.0))
+        return float(_eased(t, _EASING_IDS.get(easing, 0)))
+
+    def _preview_timing(self, step):
+        """Per-element (starts, ends, easing_ids, views) of a step, cached until the next edit"""
+        cache = self._preview_timing_cache
+        if cache is not None and cache[0] == self._edit_rev and cache[1] is step:
+            return cache[2]
+
+        n = len(step.elements)
+        starts, ends = np.empty(n), np.empty(n)
+        easing_ids = np.zeros(n, dtype=int)
+        views = []
+        for i, elem in enumerate(step.elements):
+            pos = elem.get('position', _DEFAULT_POS)
+            views.append(ElementView(elem.get('type', 'text'), pos['x'], pos['y'],
+                                     elem.get('speed', 1.0)))
+
+            start, end = _PHASE_RANGES.get(elem.get('animation_phase', 'early'), _EARLY_RANGE)
+
+            # Delay shifts the start point (delay of 1.0s = shift by 10%)
+            start = start + elem.get('delay', 0.0) * 0.1
+
+            # Duration affects how long the element animates
+            phase_duration = (end - start) * elem.get('duration', 1.0)
+            starts[i], ends[i] = start, min(1.0, start + phase_duration)
+
+            # Unknown easings keep id 0 (linear)
+            easing_ids[i] = _EASING_IDS.get(elem.get('easing', 'ease_in_out'), 0)
+
+        timing = (starts, ends, easing_ids, views)
+        self._preview_timing_cache = (self._edit_rev, step, timing)
+        return timing
+
+    def _preview_pooled(self, elem, role, factory):
+        """The element's pooled preview artist for role, created with factory() on first use
+
+        ax.clear() only detaches artists, so each frame re-adds the pooled one and the
+        caller updates its geometry and alpha through setters. Style is set by factory().
+        """
+        key = (id(elem), role)
+        artist = self._preview_artists.get(key)
+        if artist is None:
+            artist = self._preview_artists[key] = factory()
+        return artist
+
+    def _preview_patch(self, ax, elem, role, factory):
+        """Attach the element's pooled preview patch"""
+        patch = self._preview_pooled(elem, role, factory)
+        ax.add_patch(patch)
+        return patch
+
+    def _preview_collection(self, ax, elem, role, factory):
+        """Attach the element's pooled preview collection"""
+        collection = self._preview_pooled(elem, role, factory)
+        # Preview limits are fixed, so skip the data limit update
+        ax.add_collection(collection, autolim=False)
+        return collection
+
+    def _draw_preview_element_full(self, ax, elem, view, alpha):
+        """Draw element in full preview at its eased animation alpha"""
+        # view.speed drives element-specific animations
+        self._preview_renderers.get(view.type, self._preview_placeholder)(
+            ax, elem, view.x, view.y, alpha, view.speed)
+
+    # Preview renderers, one per element type: (ax, elem, x, y, alpha, elem_speed)
+    def _preview_text(self, ax, elem, x, y, alpha, elem_speed):
+        ax.text(x, y, elem.get('content', 'Text'), fontsize=14, ha='center', va='center',
+               color=self._rgba['text'], alpha=alpha)
+
+    def _preview_typewriter_text(self, ax, elem, x, y, alpha, elem_speed):
+        content = elem.get('content', 'Text')
+        # Apply speed to typewriter - faster speed = more characters visible
+        type_progress = min(1.0, alpha * elem_speed)
+        visible_chars = int(len(content) * type_progress)
+        display_content = _trunc(content, visible_chars)
+        if visible_chars < len(content):
+            display_content += '|'
+        ax.text(x, y, display_content, fontsize=14, ha='center', va='center',
+               color=self._rgba['text'], alpha=min(1.0, alpha * 2))
+
+    def _preview_box(self, ax, elem, x, y, alpha, elem_speed):
+        w, h = elem.get('width', 25), elem.get('height', 12)
+        patch = self._preview_patch(ax, elem, 'box', lambda: FancyBboxPatch(
+            (0, 0), 1, 1,
+            boxstyle="round,pad=0.3",
+            facecolor='#1a1a24',
+            edgecolor=self._rgba['primary'],
+            linewidth=1.5))
+        patch.set_bounds(x - w/2, y - h/2, w, h)
+        patch.set_alpha(alpha)
+        if elem.get('title'):
+            ax.text(x, y + h/4, elem['title'], fontsize=11,
+                   fontweight='bold', ha='center', color=self._rgba['primary'], alpha=alpha)
+
+    def _preview_bullet_list(self, ax, elem, x, y, alpha, elem_speed):
+        items = elem.get('items', [])
+        stagger = elem.get('stagger', 0.1)
+        # Items past alpha / stagger have not started fading in yet
+        if stagger > 0 and alpha < 1:
+            items = items[:math.ceil(alpha / stagger)]
+        for j, item in enumerate(items):
+            item_alpha = min(1.0, max(0, (alpha - j * stagger) / (1 - j * stagger))) if stagger else alpha
+            if item_alpha > 0:
+                ax.text(x - 10, y + 6 - j * 5, f'* {item}',
+                       fontsize=10, ha='left', color=self._rgba['text'], alpha=item_alpha)
+
+    def _preview_comparison(self, ax, elem, x, y, alpha, elem_speed):
+        w, h = elem.get('width', 50), elem.get('height', 18)
+        left = self._preview_patch(ax, elem, 'left', lambda: FancyBboxPatch(
+            (0, 0), 1, 1,
+            boxstyle="round,pad=0.2", facecolor='#1a1a24',
+            edgecolor=self._rgba['warning'], linewidth=1.5))
+        left.set_bounds(x - w/2, y - h/2, w/2 - 1, h)
+        left.set_alpha(alpha)
+        right = self._preview_patch(ax, elem, 'right', lambda: FancyBboxPatch(
+            (0, 0), 1, 1,
+            boxstyle="round,pad=0.2", facecolor='#1a1a24',
+            edgecolor=self._rgba['success'], linewidth=1.5))
+        right.set_bounds(x + 1, y - h/2, w/2 - 1, h)
+        right.set_alpha(alpha)
+        if elem.get('left_title'):
+            ax.text(x - w/4, y + h/3, elem['left_title'], fontsize=9,
+                   fontweight='bold', ha='center', color=self._rgba['warning'], alpha=alpha)
+        if elem.get('right_title'):
+            ax.text(x + w/4, y + h/3, elem['right_title'], fontsize=9,
+                   fontweight='bold', ha='center', color=self._rgba['success'], alpha=alpha)
+
+    def _preview_arrow(self, ax, elem, x, y, alpha, elem_speed, connectionstyle=None):
+        sx, sy, ex, ey = _endpoints(elem, x, y, 10)
+        ex = sx + (ex - sx) * alpha
+        ey = sy + (ey - sy) * alpha
+        ax.annotate('', xy=(ex, ey), xytext=(sx, sy),
+                   arrowprops=dict(arrowstyle='-|>', lw=2,
+                                  color=self._rgba['primary'],
+                                  connectionstyle=connectionstyle))
+
+    def _preview_arc_arrow(self, ax, elem, x, y, alpha, elem_speed):
+        self._preview_arrow(ax, elem, x, y, alpha, elem_speed, connectionstyle='arc3,rad=0.2')
+
+    def _preview_similarity_meter(self, ax, elem, x, y, alpha, elem_speed):
+        r = elem.get('radius', 5)
+        score = elem.get('score', 75)
+        current_score = score * alpha
+        bg = self._preview_patch(ax, elem, 'meter_bg', lambda: Wedge(
+            (0, 0), 1, 0, 180,
+            facecolor='#1a1a24',
+            edgecolor=self._rgba['dim'],
+            linewidth=1.5))
+        bg.set_center((x, y))
+        bg.set_radius(r)
+        fill_angle = 180 * (1 - current_score / 100)
+        fill = self._preview_patch(ax, elem, 'meter_fill', lambda: Wedge(
+            (0, 0), 1, 0, 180,
+            facecolor=self._rgba['success'],
+            edgecolor='none'))
+        fill.set_center((x, y))
+        fill.set_radius(r)
+        fill.set_theta1(fill_angle)
+        ax.text(x, y - 2, f"{int(current_score)}%", fontsize=10,
+               ha='center', va='center', color='white', fontweight='bold')
+
+    def _preview_progress_bar(self, ax, elem, x, y, alpha, elem_speed):
+        w = elem.get('width', 18)
+        current = elem.get('current', 5)
+        total = elem.get('total', 10)
+        track = self._preview_patch(ax, elem, 'track', lambda: Rectangle(
+            (0, 0), 1, 4,
+            facecolor='#1a1a24',
+            edgecolor=self._rgba['dim'],
+            linewidth=1.5))
+        track.set_bounds(x - w/2, y - 2, w, 4)
+        track.set_alpha(alpha)
+        fill = w * (current / max(total, 1)) * alpha
+        bar = self._preview_patch(ax, elem, 'bar', lambda: Rectangle(
+            (0, 0), 1, 4,
+            facecolor=self._rgba['success']))
+        bar.set_bounds(x - w/2, y - 2, fill, 4)
+        bar.set_alpha(alpha)
+
+    def _preview_neural_network(self, ax, elem, x, y, alpha, elem_speed):
+        w, h = elem.get('width', 35), elem.get('height', 22)
+        layers = tuple(elem.get('layers', [3, 4, 2]))
+        fx, fy, layer = _neuron_layout(layers)
+        layer_alpha = np.clip(alpha * len(layers) - layer, 0.0, 1.0)
+        # Only layers that have started fading in are drawn
+        shown = layer_alpha > 0
+        if shown.any():
+            neurons = self._preview_collection(ax, elem, 'neurons', lambda: EllipseCollection(
+                2.4, 2.4, 0, units='xy', offset_transform=ax.transData,
+                facecolors=self._rgba['primary'], edgecolors='white', linewidths=0.5))
+            neurons.set_offsets(np.column_stack([x + w * (fx[shown] - 0.5),
+                                                 y + h * (fy[shown] - 0.5)]))
+            neurons.set_alpha(layer_alpha[shown])
+
+    def _preview_particle_flow(self, ax, elem, x, y, alpha, elem_speed):
+        sx, sy, ex, ey = _endpoints(elem, x, y, 15)
+        n = elem.get('num_particles', 15)
+        # Apply speed to particle movement
+        flow_alpha = min(1.0, alpha * elem_speed)
+        if n > 0:
+            # Stagger particles and apply speed
+            phase, jitter = _particle_phases(n)
+            t_pos = (phase + flow_alpha * 2) % 1.0
+            # Add some vertical spread based on particle index
+            offsets = np.column_stack([
+                sx + (ex - sx) * t_pos,
+                sy + (ey - sy) * t_pos + jitter * (elem.get('spread', 0.5) * 3)])
+            arc = np.sin(t_pos * np.pi)
+            diameters = 2 * (0.8 + arc * 0.4)
+            facecolors = np.tile(self._rgba['accent'], (n, 1))
+            facecolors[:, 3] = (0.3 + arc * 0.6) * alpha
+            # One collection for all particles, sized in data units like Circle patches
+            ax.add_collection(EllipseCollection(
+                diameters, diameters, 0, units='xy', offsets=offsets,
+                offset_transform=ax.transData,
+                facecolors=facecolors, edgecolors='none'))
+
+    def _preview_code_block(self, ax, elem, x, y, alpha, elem_speed):
+        w, h = elem.get('width', 30), elem.get('height', 15)
+        ax.add_patch(FancyBboxPatch(
+            (x - w/2, y - h/2), w, h,
+            boxstyle="round,pad=0.2", facecolor='#0d1117',
+            edgecolor=self._rgba['dim'], linewidth=1.5, alpha=alpha))
+        code = _trunc(elem.get('code', '# code'), 40)
+        ax.text(x - w/2 + 2, y + h/4, code, fontsize=8, family='monospace',
+               ha='left', va='center', color=self._rgba['secondary'], alpha=alpha)
+
+    def _preview_code_execution(self, ax, elem, x, y, alpha, elem_speed):
+        w = elem.get('width', 35)
+        code_h, out_h = elem.get('code_height', 8), elem.get('output_height', 5)
+        # Code box
+        ax.add_patch(FancyBboxPatch(
+            (x - w/2, y + 2), w, code_h,
+            boxstyle="round,pad=0.2", facecolor='#0d1117',
+            edgecolor=self._rgba['dim'], linewidth=1, alpha=alpha))
+        # Output box
+        ax.add_patch(FancyBboxPatch(
+            (x - w/2, y - out_h - 2), w, out_h,
+            boxstyle="round,pad=0.2", facecolor='#1a1a24',
+            edgecolor=self._rgba['success'], linewidth=1, alpha=alpha))
+        ax.text(x, y + 5, _trunc(elem.get('code', '>>>'), 25), fontsize=7, family='monospace',
+               ha='center', color=self._rgba['text'], alpha=alpha)
+        ax.text(x, y - out_h/2, _trunc(elem.get('output', 'output'), 20), fontsize=7,
+               ha='center', color=self._rgba['success'], alpha=alpha)
+
+    def _preview_checklist(self, ax, elem, x, y, alpha, elem_speed):
+        items = elem.get('items', [])[:5]
+        shown = items[:math.ceil(alpha * (len(items) + 1))]
+        if not shown:
+            return
+        item_alpha = np.clip(alpha * (len(items) + 1) - np.arange(len(shown)), 0.0, 1.0)
+        iys = y + 6 - np.arange(len(shown)) * 5
+        # All boxes as one collection; an item is ticked (filled) once past half faded in
+        edgecolors = np.tile(self._rgba['success'], (len(shown), 1))
+        edgecolors[:, 3] = item_alpha
+        boxes = self._preview_collection(ax, elem, 'boxes', lambda: PolyCollection(
+            [], linewidths=1))
+        boxes.set_verts(_rect_verts(x - 12, iys - 1, 2.5, 2.5))
+        boxes.set_facecolor(np.where((item_alpha > 0.5)[:, None], edgecolors, 0.0))
+        boxes.set_edgecolor(edgecolors)
+        for item, iy, a in zip(shown, iys.tolist(), item_alpha.tolist()):
+            ax.text(x - 8, iy, _trunc(item, 15), fontsize=9, ha='left',
+                   color=self._rgba['text'], alpha=a)
+
+    def _preview_flow(self, ax, elem, x, y, alpha, elem_speed):
+        steps = elem.get('steps', [])[:5]
+        w = elem.get('width', 60)
+        step_w = w / max(len(steps), 1)
+        # Boxes appear one by one
+        boxes = []
+        for j, step in enumerate(steps[:math.ceil(alpha * (len(steps) + 1))]):
+            sx = x - w/2 + j * step_w + step_w/2
+            step_alpha = min(1.0, max(0, alpha * (len(steps) + 1) - j))
+            boxes.append(FancyBboxPatch(
+                (sx - step_w/2 + 1, y - 4), step_w - 2, 8,
                 boxstyle="round,pad=0.2", facecolor='#1a1a24',
-                edgecolor=self.colors['success'], linewidth=1, alpha=alpha))
-            ax.text(x, y + 5, elem.get('code', '>>>')[: 25], fontsize=7, family='monospace',
-                   ha='center', color=self.colors['text'], alpha=alpha)
-            ax.text(x, y - out_h/2, elem.get('output', 'output')[:20], fontsize=7,
-                   ha='center', color=self.colors['success'], alpha=alpha)
-
-        elif t == 'checklist':
-            items = elem.get('items', [])[:5]
-            for j, item in enumerate(items):
-                item_alpha = min(1.0, max(0, alpha * (len(items) + 1) - j))
-                iy = y + 6 - j * 5
-                ax.add_patch(Rectangle((x - 12, iy - 1), 2.5, 2.5,
-                                       facecolor=self.colors['success'] if item_alpha > 0.5 else 'none',
-                                       edgecolor=self.colors['success'], linewidth=1, alpha=item_alpha))
-                ax.text(x - 8, iy, item[:15], fontsize=9, ha='left',
-                       color=self.colors['text'], alpha=item_alpha)
-
-        elif t == 'flow':
-            steps = elem.get('steps', [])[:5]
-            w = elem.get('width', 60)
-            step_w = w / max(len(steps), 1)
-            for j, step in enumerate(steps):
-                step_alpha = min(1.0, max(0, alpha * (len(steps) + 1) - j))
-                sx = x - w/2 + j * step_w + step_w/2
-                ax.add_patch(FancyBboxPatch(
-                    (sx - step_w/2 + 1, y - 4), step_w - 2, 8,
-                    boxstyle="round,pad=0.2", facecolor='#1a1a24',
-                    edgecolor=self.colors['primary'], linewidth=1, alpha=step_alpha))
-                label = step.get('label', f'S{j+1}')[:6]
-                ax.text(sx, y, label, fontsize=8, ha='center', va='center',
-                       color=self.colors['text'], alpha=step_alpha)
-                if j < len(steps) - 1:
-                    ax.annotate('', xy=(sx + step_w/2 - 1, y), xytext=(sx + step_w/2 - 3, y),
-                               arrowprops=dict(arrowstyle='->', lw=1, color=self.colors['dim']))
-
-        elif t == 'grid':
-            cols, rows = elem.get('columns', 2), elem.get('rows', 2)
-            cw, ch = elem.get('cell_width', 15), elem.get('cell_height', 10)
-            items = elem.get('items', [])
-            for r in range(rows):
-                for c in range(cols):
-                    idx = r * cols + c
-                    cell_alpha = min(1.0, max(0, alpha * (cols * rows + 1) - idx))
-                    cx = x - (cols * cw) / 2 + c * cw + cw/2
-                    cy = y + (rows * ch) / 2 - r * ch - ch/2
-                    ax.add_patch(FancyBboxPatch(
-                        (cx - cw/2 + 1, cy - ch/2 + 1), cw - 2, ch - 2,
-                        boxstyle="round,pad=0.1", facecolor='#1a1a24',
-                        edgecolor=self.colors['primary'], linewidth=1, alpha=cell_alpha))
-                    if idx < len(items):
-                        ax.text(cx, cy, items[idx].get('title', '')[:5], fontsize=7,
-                               ha='center', va='center', color=self.colors['text'], alpha=cell_alpha)
-
-        elif t == 'scatter_3d':
-            # Show isometric projection for 3D preview
-            w, h = 25, 20
-            ax.add_patch(FancyBboxPatch(
-                (x - w/2, y - h/2), w, h,
-                boxstyle="round,pad=0.2", facecolor='#0d0d14',
-                edgecolor=self.colors['primary'], linewidth=1.5, alpha=alpha))
-            # Draw axes
-            ax.plot([x - 8, x + 8], [y - 5, y - 5], color=self.colors['dim'], linewidth=0.5, alpha=alpha)
-            ax.plot([x, x], [y - 5, y + 6], color=self.colors['dim'], linewidth=0.5, alpha=alpha)
-            ax.plot([x, x - 6], [y - 5, y - 2], color=self.colors['dim'], linewidth=0.5, alpha=alpha)
-            # Points
-            points = elem.get('points', [])[:8]
-            elev = elem.get('camera_elev', 20)
-            azim = elem.get('camera_azim', 45)
-            for i, pt in enumerate(points):
-                pt_alpha = max(0.0, min(1.0, alpha * (len(points) + 1) - i))
-                if pt_alpha <= 0:
-                    continue
-                # Simple isometric projection
-                px = x + pt.get('x', 0) * 2 - pt.get('y', 0) * 0.5
-                py = y + pt.get('z', 0) * 2 + pt.get('y', 0) * 0.3
-                ax.add_patch(Circle((px, py), 0.8,
-                                   facecolor=self.colors['accent'],
-                                   edgecolor='white', linewidth=0.3, alpha=pt_alpha))
-
-        elif t == 'vector_3d':
-            w, h = 25, 20
-            ax.add_patch(FancyBboxPatch(
-                (x - w/2, y - h/2), w, h,
-                boxstyle="round,pad=0.2", facecolor='#0d0d14',
-                edgecolor=self.colors['primary'], linewidth=1.5, alpha=alpha))
-            # Draw axes
-            ax.plot([x - 8, x + 8], [y - 5, y - 5], color=self.colors['dim'], linewidth=0.5, alpha=alpha)
-            ax.plot([x, x], [y - 5, y + 6], color=self.colors['dim'], linewidth=0.5, alpha=alpha)
-            # Vectors
-            vectors = elem.get('vectors', [])[:5]
-            colors_list = ['primary', 'secondary', 'accent', 'warning', 'success']
-            for i, vec in enumerate(vectors):
-                vec_alpha = max(0.0, min(1.0, alpha * (len(vectors) + 1) - i))
-                if vec_alpha <= 0:
-                    continue
-                vx = vec.get('x', 1) * 3
-                vy = vec.get('y', 1) * 1.5
-                vz = vec.get('z', 1) * 3
-                # Isometric projection
-                ex = x + vx - vy * 0.3
-                ey = y + vz + vy * 0.2
-                vec_color = vec.get('color', colors_list[i % len(colors_list)])
-                ax.annotate('', xy=(ex, ey), xytext=(x, y),
-                           arrowprops=dict(arrowstyle='->', lw=1.5,
-                                          color=self.colors.get(vec_color, vec_color),
-                                          alpha=vec_alpha))
-
-        elif t == 'attention_heatmap':
-            w, h = elem.get('width', 25), elem.get('height', 25)
-            tokens = elem.get('tokens_x', ['A', 'B', 'C'])[:5]
-            n = len(tokens)
-            cell_size = min(w, h) / (n + 1)
-            # Draw grid
-            for i in range(n):
-                for j in range(n):
-                    cell_alpha = max(0.0, min(1.0, alpha * (n * n + 1) - (i * n + j)))
-                    if cell_alpha <= 0:
-                        continue
-                    cx = x - w/2 + (j + 1.5) * cell_size
-                    cy = y + h/2 - (i + 1.5) * cell_size
-                    # Random weight for demo
-                    weight = 0.3 + 0.7 * ((i + j) % 3) / 2
-                    ax.add_patch(Rectangle(
-                        (cx - cell_size/2, cy - cell_size/2), cell_size * 0.9, cell_size * 0.9,
-                        facecolor=self.colors['accent'], alpha=weight * cell_alpha))
-            # Labels
-            for i, tok in enumerate(tokens):
-                ax.text(x - w/2 + cell_size/2, y + h/2 - (i + 1.5) * cell_size,
-                       tok[:3], fontsize=6, ha='center', va='center',
-                       color=self.colors['text'], alpha=alpha)
-
-        elif t == 'parameter_slider':
-            w = elem.get('width', 25)
-            label = elem.get('label', 'Param')[:12]
-            val = elem.get('current_value', 0.5)
-            min_v, max_v = elem.get('min_value', 0), elem.get('max_value', 1)
-            ratio = (val - min_v) / (max_v - min_v) if max_v != min_v else 0.5
-            # Label
-            ax.text(x, y + 5, label, fontsize=10, fontweight='bold',
-                   ha='center', va='center', color=self.colors['text'], alpha=alpha)
-            # Track
-            ax.add_patch(Rectangle((x - w/2, y - 1), w, 2,
-                                  facecolor='#333', edgecolor='#555', linewidth=0.5, alpha=alpha))
-            # Fill
-            ax.add_patch(Rectangle((x - w/2, y - 1), w * ratio * alpha, 2,
-                                  facecolor=self.colors['accent'], alpha=alpha))
-            # Handle
-            handle_x = x - w/2 + w * ratio * alpha
-            ax.add_patch(Circle((handle_x, y), 1.5,
-                               facecolor='white', edgecolor=self.colors['accent'],
-                               linewidth=1.5, alpha=alpha))
-            # Value
-            ax.text(handle_x, y + 3, f'{val:.1f}', fontsize=8,
-                   ha='center', va='bottom', color=self.colors['accent'], alpha=alpha)
-
-        elif t == 'token_flow':
-            w, h = elem.get('width', 40), elem.get('height', 20)
-            input_text = elem.get('input_text', 'Hello')[:15]
-            # Input box
-            ax.add_patch(FancyBboxPatch(
-                (x - w/2, y + h/4), w * 0.3, h * 0.4,
+                edgecolor=self._rgba['primary'], linewidth=1, alpha=step_alpha))
+            label = _trunc(step.get('label', f'S{j+1}'), 6)
+            ax.text(sx, y, label, fontsize=8, ha='center', va='center',
+                   color=self._rgba['text'], alpha=step_alpha)
+        if boxes:
+            # One collection keeps each box's own colors and fade-in alpha
+            ax.add_collection(PatchCollection(boxes, match_original=True))
+        if len(steps) > 1:
+            # Connecting arrows show from the start, as one quiver
+            tails = x - w/2 + (np.arange(len(steps) - 1) + 1) * step_w - 3
+            ax.quiver(tails, np.full(len(tails), y), 2, 0, color=self._rgba['dim'],
+                      angles='xy', scale_units='xy', scale=1,
+                      width=0.0013, headwidth=4, headlength=5, headaxislength=4.5)
+
+    def _preview_grid(self, ax, elem, x, y, alpha, elem_speed):
+        cols, rows = elem.get('columns', 2), elem.get('rows', 2)
+        cw, ch = elem.get('cell_width', 15), elem.get('cell_height', 10)
+        items = elem.get('items', [])
+        # Cells appear in row-major order; stop at the first one not yet visible
+        cells = []
+        for idx in range(min(cols * rows, math.ceil(alpha * (cols * rows + 1)))):
+            r, c = divmod(idx, cols)
+            cell_alpha = min(1.0, max(0, alpha * (cols * rows + 1) - idx))
+            cx = x - (cols * cw) / 2 + c * cw + cw/2
+            cy = y + (rows * ch) / 2 - r * ch - ch/2
+            cells.append(FancyBboxPatch(
+                (cx - cw/2 + 1, cy - ch/2 + 1), cw - 2, ch - 2,
                 boxstyle="round,pad=0.1", facecolor='#1a1a24',
-                edgecolor=self.colors['dim'], linewidth=1, alpha=alpha))
-            ax.text(x - w/2 + w * 0.15, y + h/4 + h * 0.2, input_text[:8], fontsize=7,
-                   ha='center', va='center', color=self.colors['text'], alpha=alpha)
-            # Tokens
-            tokens = input_text.split()[:3] or ['tok']
-            for i, tok in enumerate(tokens):
-                tok_alpha = max(0.0, min(1.0, alpha * 3 - i))
-                if tok_alpha <= 0:
-                    continue
-                tx = x - w * 0.1 + i * 8
-                ax.add_patch(FancyBboxPatch(
-                    (tx - 3, y - 2), 6, 4,
-                    boxstyle="round,pad=0.1", facecolor='#1a1a24',
-                    edgecolor=self.colors['accent'], linewidth=1, alpha=tok_alpha))
-                ax.text(tx, y, tok[:4], fontsize=6, ha='center', va='center',
-                       color=self.colors['accent'], alpha=tok_alpha)
-            # Arrow
-            ax.annotate('', xy=(x - w * 0.15, y + h * 0.1), xytext=(x - w * 0.3, y + h * 0.1),
-                       arrowprops=dict(arrowstyle='->', lw=1, color=self.colors['dim']), alpha=alpha)
-
-        else:
-            w, h = elem.get('width', 18), elem.get('height', 10)
+                edgecolor=self._rgba['primary'], linewidth=1, alpha=cell_alpha))
+            if idx < len(items):
+                ax.text(cx, cy, _trunc(items[idx].get('title', ''), 5), fontsize=7,
+                       ha='center', va='center', color=self._rgba['text'], alpha=cell_alpha)
+        if cells:
+            # One collection keeps each cell's own colors and fade-in alpha
+            ax.add_collection(PatchCollection(cells, match_original=True))
+
+    def _preview_scatter_3d(self, ax, elem, x, y, alpha, elem_speed):
+        # Show isometric projection for 3D preview
+        w, h = 25, 20
+        ax.add_patch(FancyBboxPatch(
+            (x - w/2, y - h/2), w, h,
+            boxstyle="round,pad=0.2", facecolor='#0d0d14',
+            edgecolor=self._rgba['primary'], linewidth=1.5, alpha=alpha))
+        # Draw axes
+        ax.plot([x - 8, x + 8], [y - 5, y - 5], color=self._rgba['dim'], linewidth=0.5, alpha=alpha)
+        ax.plot([x, x], [y - 5, y + 6], color=self._rgba['dim'], linewidth=0.5, alpha=alpha)
+        ax.plot([x, x - 6], [y - 5, y - 2], color=self._rgba['dim'], linewidth=0.5, alpha=alpha)
+        # Points
+        points = elem.get('points', [])[:8]
+        elev = elem.get('camera_elev', 20)
+        azim = elem.get('camera_azim', 45)
+        shown = points[:math.ceil(alpha * (len(points) + 1))]
+        if shown:
+            pt_alpha = np.clip(alpha * (len(points) + 1) - np.arange(len(shown)), 0.0, 1.0)
+            # Simple isometric projection of all points at once
+            dots = EllipseCollection(
+                1.6, 1.6, 0, units='xy', offsets=_xyz(shown, 0) @ _SCATTER_PROJ.T + (x, y),
+                offset_transform=ax.transData,
+                facecolors=self._rgba['accent'], edgecolors='white', linewidths=0.3)
+            dots.set_alpha(pt_alpha)
+            ax.add_collection(dots)
+
+    def _preview_vector_3d(self, ax, elem, x, y, alpha, elem_speed):
+        w, h = 25, 20
+        ax.add_patch(FancyBboxPatch(
+            (x - w/2, y - h/2), w, h,
+            boxstyle="round,pad=0.2", facecolor='#0d0d14',
+            edgecolor=self._rgba['primary'], linewidth=1.5, alpha=alpha))
+        # Draw axes
+        ax.plot([x - 8, x + 8], [y - 5, y - 5], color=self._rgba['dim'], linewidth=0.5, alpha=alpha)
+        ax.plot([x, x], [y - 5, y + 6], color=self._rgba['dim'], linewidth=0.5, alpha=alpha)
+        # Vectors
+        vectors = elem.get('vectors', [])[:5]
+        shown = vectors[:math.ceil(alpha * (len(vectors) + 1))]
+        if shown:
+            # Isometric projection of all vectors at once, drawn as one quiver from the origin
+            uv = _xyz(shown, 1) @ _VECTOR_PROJ.T
+            colors = np.array([to_rgba(self._rgba.get(c, c)) for c in (
+                vec.get('color', _VECTOR_COLORS[i % len(_VECTOR_COLORS)])
+                for i, vec in enumerate(shown))])
+            colors[:, 3] = np.clip(alpha * (len(vectors) + 1) - np.arange(len(shown)), 0.0, 1.0)
+            ax.quiver(np.full(len(shown), x), np.full(len(shown), y), uv[:, 0], uv[:, 1],
+                      color=colors, angles='xy', scale_units='xy', scale=1,
+                      width=0.002, headwidth=4, headlength=5, headaxislength=4.5)
+
+    def _preview_attention_heatmap(self, ax, elem, x, y, alpha, elem_speed):
+        w, h = elem.get('width', 25), elem.get('height', 25)
+        tokens = elem.get('tokens_x', ['A', 'B', 'C'])[:5]
+        n = len(tokens)
+        cell_size = min(w, h) / (n + 1)
+        # Draw grid: cells fade in one after another, as one collection
+        count = min(n * n, math.ceil(alpha * (n * n + 1)))
+        if count > 0:
+            i, j, weight = (arr[:count] for arr in _heatmap_cells(n))
+            cell_alpha = np.clip(alpha * (n * n + 1) - np.arange(count), 0.0, 1.0)
+            facecolors = np.tile(self._rgba['accent'], (count, 1))
+            facecolors[:, 3] = weight * cell_alpha
+            cells = self._preview_collection(ax, elem, 'cells', lambda: PolyCollection(
+                [], edgecolors='none'))
+            cells.set_verts(_rect_verts(x - w/2 + (j + 1) * cell_size,
+                                        y + h/2 - (i + 2) * cell_size,
+                                        cell_size * 0.9, cell_size * 0.9))
+            cells.set_facecolor(facecolors)
+        # Labels
+        for i, tok in enumerate(tokens):
+            ax.text(x - w/2 + cell_size/2, y + h/2 - (i + 1.5) * cell_size,
+                   _trunc(tok, 3), fontsize=6, ha='center', va='center',
+                   color=self._rgba['text'], alpha=alpha)
+
+    def _preview_parameter_slider(self, ax, elem, x, y, alpha, elem_speed):
+        w = elem.get('width', 25)
+        label = _trunc(elem.get('label', 'Param'), 12)
+        val = elem.get('current_value', 0.5)
+        min_v, max_v = elem.get('min_value', 0), elem.get('max_value', 1)
+        ratio = (val - min_v) / (max_v - min_v) if max_v != min_v else 0.5
+        # Label
+        ax.text(x, y + 5, label, fontsize=10, fontweight='bold',
+               ha='center', va='center', color=self._rgba['text'], alpha=alpha)
+        # Track
+        ax.add_patch(Rectangle((x - w/2, y - 1), w, 2,
+                              facecolor='#333', edgecolor='#555', linewidth=0.5, alpha=alpha))
+        # Fill
+        ax.add_patch(Rectangle((x - w/2, y - 1), w * ratio * alpha, 2,
+                              facecolor=self._rgba['accent'], alpha=alpha))
+        # Handle
+        handle_x = x - w/2 + w * ratio * alpha
+        ax.add_patch(Circle((handle_x, y), 1.5,
+                           facecolor='white', edgecolor=self._rgba['accent'],
+                           linewidth=1.5, alpha=alpha))
+        # Value
+        ax.text(handle_x, y + 3, f'{val:.1f}', fontsize=8,
+               ha='center', va='bottom', color=self._rgba['accent'], alpha=alpha)
+
+    def _preview_token_flow(self, ax, elem, x, y, alpha, elem_speed):
+        w, h = elem.get('width', 40), elem.get('height', 20)
+        input_text = _trunc(elem.get('input_text', 'Hello'), 15)
+        # Input box
+        ax.add_patch(FancyBboxPatch(
+            (x - w/2, y + h/4), w * 0.3, h * 0.4,
+            boxstyle="round,pad=0.1", facecolor='#1a1a24',
+            edgecolor=self._rgba['dim'], linewidth=1, alpha=alpha))
+        ax.text(x - w/2 + w * 0.15, y + h/4 + h * 0.2, _trunc(input_text, 8), fontsize=7,
+               ha='center', va='center', color=self._rgba['text'], alpha=alpha)
+        # Tokens
+        tokens = _words(input_text, 3) or ('tok',)
+        for i, tok in enumerate(tokens[:math.ceil(alpha * 3)]):
+            tok_alpha = max(0.0, min(1.0, alpha * 3 - i))
+            tx = x - w * 0.1 + i * 8
             ax.add_patch(FancyBboxPatch(
-                (x - w/2, y - h/2), w, h,
-                boxstyle="round,pad=0.2", facecolor='#1a1a24',
-                edgecolor=self.colors['dim'], linewidth=1.5, linestyle='--', alpha=alpha))
-            ax.text(x, y, t, fontsize=9, ha='center', va='center',
-                   color=self.colors['dim'], alpha=alpha)
+                (tx - 3, y - 2), 6, 4,
+                boxstyle="round,pad=0.1", facecolor='#1a1a24',
+                edgecolor=self._rgba['accent'], linewidth=1, alpha=tok_alpha))
+            ax.text(tx, y, _trunc(tok, 4), fontsize=6, ha='center', va='center',
+                   color=self._rgba['accent'], alpha=tok_alpha)
+        # Arrow
+        ax.annotate('', xy=(x - w * 0.15, y + h * 0.1), xytext=(x - w * 0.3, y + h * 0.1),
+                   arrowprops=dict(arrowstyle='->', lw=1, color=self._rgba['dim']), alpha=alpha)
+
+    def _preview_placeholder(self, ax, elem, x, y, alpha, elem_speed):
+        """Dashed box labelled with the element type, for types without a preview"""
+        t = elem.get('type', 'text')
+        w, h = elem.get('width', 18), elem.get('height', 10)
+        ax.add_patch(FancyBboxPatch(
+            (x - w/2, y - h/2), w, h,
+            boxstyle="round,pad=0.2", facecolor='#1a1a24',
+            edgecolor=self._rgba['dim'], linewidth=1.5, linestyle='--', alpha=alpha))
+        ax.text(x, y, t, fontsize=9, ha='center', va='center',
+               color=self._rgba['dim'], alpha=alpha)
+
+    def _draw_preview_controls(self, draw=True):
+        """Draw animation controls in preview window; draw=False leaves drawing to the caller
+
+        Controls are built once per window; later calls only update the play button,
+        progress fill, percentage and loop toggle.
+        """
+        bar_w = 60
+        if self._preview_controls is None:
+            self._build_preview_controls(bar_w)
+        play, fill, percent, loop = self._preview_controls
+        play.set_text('II' if self.animation_playing else '>')
+        fill.set_width(bar_w * self.animation_progress)
+        percent.set_text(f'{self.animation_progress:.0%}')
+        loop.set_color(self._rgba['accent'] if self.animation_loop else self._rgba['dim'])
+
+        if draw and self.preview_fig:
+            self.preview_fig.canvas.draw_idle()
 
-    def _draw_preview_controls(self):
-        """Draw animation controls in preview window"""
+    def _build_preview_controls(self, bar_w):
+        """Create the static controls and keep handles to the ones playback updates"""
         ax = self.preview_controls_ax
         ax.clear()
         ax.set_facecolor(self.PANEL_HEADER)
@@ -2273,43 +3164,43 @@ class VisualDesigner:
         ax.set_ylim(0, 100)
 
         # Play/Pause
-        play_text = 'II' if self.animation_playing else '>'
-        ax.text(5, 50, play_text, fontsize=18, ha='center', va='center',
-               color=self.colors['primary'], fontweight='bold', family='monospace')
+        play = ax.text(5, 50, '>', fontsize=18, ha='center', va='center',
+                       color=self._rgba['primary'], fontweight='bold', family='monospace')
 
         # Progress bar
-        bar_x, bar_y, bar_w, bar_h = 12, 35, 60, 30
+        bar_x, bar_y, bar_h = 12, 35, 30
         ax.add_patch(Rectangle((bar_x, bar_y), bar_w, bar_h,
-                               facecolor='#1a1a24', edgecolor=self.colors['dim'], linewidth=1))
-        ax.add_patch(Rectangle((bar_x, bar_y), bar_w * self.animation_progress, bar_h,
-                               facecolor=self.colors['primary'], edgecolor='none'))
+                               facecolor='#1a1a24', edgecolor=self._rgba['dim'], linewidth=1))
+        fill = ax.add_patch(Rectangle((bar_x, bar_y), 0, bar_h,
+                                      facecolor=self._rgba['primary'], edgecolor='none'))
 
-        ax.text(bar_x + bar_w / 2, 75, f'{int(self.animation_progress * 100)}%',
-               fontsize=10, ha='center', va='center', color=self.colors['text'])
+        percent = ax.text(bar_x + bar_w / 2, 75, '0%',
+                          fontsize=10, ha='center', va='center', color=self._rgba['text'])
 
         # Phase indicators
         phases = ['imm', 'early', 'mid', 'late', 'final']
         phase_x = [0.0, 0.2, 0.4, 0.6, 0.8]
+        ticks = []
         for phase, px in zip(phases, phase_x):
             screen_x = bar_x + bar_w * px
-            ax.axvline(screen_x, ymin=0.35, ymax=0.65, color=self.colors['dim'], linewidth=0.5)
-            ax.text(screen_x, 20, phase, fontsize=6, ha='center', color=self.colors['dim'])
+            ticks.append(ax.axvline(screen_x, ymin=0.35, ymax=0.65, color=self._rgba['dim'], linewidth=0.5))
+            ax.text(screen_x, 20, phase, fontsize=6, ha='center', color=self._rgba['dim'])
 
         # Loop toggle
-        loop_color = self.colors['accent'] if self.animation_loop else self.colors['dim']
-        ax.text(78, 50, 'LOOP', fontsize=9, ha='center', va='center', color=loop_color, fontweight='bold')
+        loop = ax.text(78, 50, 'LOOP', fontsize=9, ha='center', va='center',
+                       color=self._rgba['dim'], fontweight='bold')
 
         # Step navigation
-        ax.text(88, 50, '<', fontsize=16, ha='center', va='center', color=self.colors['text'])
-        ax.text(95, 50, '>', fontsize=16, ha='center', va='center', color=self.colors['text'])
+        ax.text(88, 50, '<', fontsize=16, ha='center', va='center', color=self._rgba['text'])
+        ax.text(95, 50, '>', fontsize=16, ha='center', va='center', color=self._rgba['text'])
 
         ax.text(50, 5, 'Space: Play/Pause  |  Arrows: Scrub  |  L: Loop  |  R: Reset  |  Q: Close',
-               fontsize=7, ha='center', va='bottom', color=self.colors['dim'])
+               fontsize=7, ha='center', va='bottom', color=self._rgba['dim'])
 
         ax.axis('off')
-
-        if self.preview_fig:
-            self.preview_fig.canvas.draw_idle()
+        self._preview_controls = (play, fill, percent, loop)
+        # Phase ticks sit on top of the fill, so they are redrawn with it
+        self._preview_control_artists = (play, fill, *ticks, percent, loop)
 
     def _on_preview_key(self, event):
         """Handle key events in preview window"""
@@ -2336,10 +3227,37 @@ class VisualDesigner:
             self.animation_loop = not self.animation_loop
             self._draw_preview_controls()
         elif key == 'q':
+            self._preview_alive = False
             plt.close(self.preview_fig)
             self.preview_fig = None
             self.preview_ax = None
 
+    def _schedule_preview_render(self):
+        """Mark the open preview dirty and (re)start its debounce timer"""
+        self._preview_dirty = True
+        # Restarting pushes the render past a burst of edits, e.g. a held step key
+        self._preview_timer.stop()
+        self._preview_timer.start()
+
+    def _flush_preview(self):
+        """Re-render the preview once after designer edits settle"""
+        # Playback renders every frame anyway, and any render since the edit clears the flag
+        if not self._preview_dirty or not self._preview_alive or self.animation_playing:
+            return
+        self.preview_fig.canvas.manager.set_window_title(f'Preview: Step {self.current_step + 1}')
+        self._render_preview_step()
+        self._draw_preview_controls()
+
+    def _on_preview_close(self, event):
+        """Mark the preview dead when its window is closed, stopping playback"""
+        # A replaced preview's window may report closing after the new one opened
+        if self.preview_fig is not None and event.canvas is not self.preview_fig.canvas:
+            return
+        self._preview_alive = False
+        self.animation_playing = False
+        self.preview_fig = None
+        self.preview_ax = None
+
     def _on_preview_click(self, event):
         """Handle click events in preview window"""
         if event.inaxes == self.preview_controls_ax:
@@ -2381,39 +3299,58 @@ class VisualDesigner:
 
     def _start_animation(self):
         """Start animation playback"""
+        clock = time.perf_counter()
+        # Frames owed to wall time but not yet shown
+        due = 0.0
+
         def animate():
+            nonlocal clock, due
+            # Ticks queued before the window closed end here
+            if not (self._preview_alive and self.animation_playing):
+                return
             try:
-                if not self.animation_playing or self.preview_fig is None:
-                    return
-
-                # Check if figure still exists and has a valid canvas
-                if not plt.fignum_exists(self.preview_fig.number):
-                    self.animation_playing = False
-                    self.preview_fig = None
-                    return
-
-                self.animation_progress += 0.02
-                if self.animation_progress >= 1.0:
+                # Advance by elapsed frames so slow renders drop frames instead of
+                # slowing playback; capped so a stalled window does not jump ahead.
+                # Progress stays on whole frames so every lap hits the frame cache.
+                now = time.perf_counter()
+                due = min(max(due + (now - clock) * 1000 / self.PREVIEW_FRAME_MS, 1.0), 4.0)
+                clock = now
+                frames = int(due)
+                due -= frames
+                frame = round(self.animation_progress * self.PREVIEW_FRAMES) + frames
+                if frame >= self.PREVIEW_FRAMES:
                     if self.animation_loop:
-                        self.animation_progress = 0
+                        frame = 0
                     else:
-                        self.animation_progress = 1.0
+                        frame = self.PREVIEW_FRAMES
                         self.animation_playing = False
+                self.animation_progress = frame / self.PREVIEW_FRAMES
 
-                self._render_preview_step()
-                self._draw_preview_controls()
+                if self.animation_playing:
+                    # Replay a cached frame, else blit moving elements and controls;
+                    # static ones stay in the background
+                    self._draw_preview_controls(draw=False)
+                    if not self._restore_preview_frame():
+                        self._render_preview_step(animated=True)
+                        self._blit_preview_frame()
+                else:
+                    # Last frame: full redraw so settled artists are no longer animated
+                    self._render_preview_step()
+                    self._draw_preview_controls()
 
-                if self.animation_playing and self.preview_fig is not None:
+                if self.animation_playing and self._preview_alive:
                     if self.preview_fig.canvas and self.preview_fig.canvas.manager:
-                        self.preview_fig.canvas.draw_idle()
-                        self.preview_fig.canvas.flush_events()
-                        self.preview_fig.canvas.manager.window.after(33, animate)
+                        # Leave the rest of the frame to the Tk event loop
+                        spent_ms = (time.perf_counter() - now) * 1000
+                        self.preview_fig.canvas.manager.window.after(
+                            max(1, int(self.PREVIEW_FRAME_MS - spent_ms)), animate)
             except Exception:
-                # Preview window was closed, stop animation
+                # Preview window was torn down mid-frame, stop animation
+                self._preview_alive = False
                 self.animation_playing = False
                 self.preview_fig = None
 
-        if self.preview_fig:
+        if self._preview_alive:
             animate()
 
     # Element operations
@@ -2461,35 +3398,49 @@ class VisualDesigner:
             self._refresh_all()
 
     def _duplicate_selected(self):
-        if self.selected_element is None:
+        if self._selected_elem is None:
             return
         elements = self._get_current_elements()
-        if self.selected_element < len(elements):
-            new_elem = copy.deepcopy(elements[self.selected_element])
-            pos = new_elem.get('position', {'x': 50, 'y': 50})
-            new_elem['position'] = {'x': pos['x'] + 5, 'y': pos['y'] - 5}
-            elements.append(new_elem)
-            self.selected_element = len(elements) - 1
-            self.unsaved = True
-            self._refresh_all()
+        new_elem = _clone(self._selected_elem)
+        pos = new_elem.get('position', _DEFAULT_POS)
+        new_elem['position'] = {'x': pos['x'] + 5, 'y': pos['y'] - 5}
+        elements.append(new_elem)
+        self.selected_element = len(elements) - 1
+        self.unsaved = True
+        self._refresh_all()
 
     def _edit_selected(self):
-        if self.selected_element is None:
-            return
-        elements = self._get_current_elements()
-        if self.selected_element >= len(elements):
-            return
-
-        elem = elements[self.selected_element]
-        self._show_edit_dialog(elem)
+        if self._selected_elem is not None:
+            self._show_edit_dialog(self._selected_elem)
+
+    def _get_dialog_root(self):
+        """Dialog parent: the designer's own Tk window, else a shared hidden Tk root
+
+        The TkAgg window already runs a Tcl interpreter, so dialogs parented to it need
+        no second one and open centered over the designer.
+        """
+        window = getattr(self.fig.canvas.manager, 'window', None)
+        if isinstance(window, Tk):
+            return window
+        root = self._dialog_root
+        try:
+            if root is not None and root.winfo_exists():
+                return root
+        except TclError:
+            pass  # Interpreter already destroyed
+        root = self._dialog_root = Tk()
+        root.withdraw()
+        # Keep dialogs of the unmapped root above the designer window
+        root.attributes('-topmost', True)
+        return root
 
     def _show_edit_dialog(self, elem):
         """Show edit dialog for element"""
         try:
-            root = Tk()
-            root.withdraw()
+            root = self._get_dialog_root()
 
             t = elem.get('type', 'unknown')
+            old = _clone(elem)
 
             if 'content' in elem:
                 result = simpledialog.askstring("Edit Content",
@@ -2498,7 +3449,6 @@ class VisualDesigner:
                                                parent=root)
                 if result is not None:
                     elem['content'] = result
-                    self.unsaved = True
 
             elif 'title' in elem:
                 result = simpledialog.askstring("Edit Title",
@@ -2507,7 +3457,6 @@ class VisualDesigner:
                                                parent=root)
                 if result is not None:
                     elem['title'] = result
-                    self.unsaved = True
 
             elif 'items' in elem:
                 items_str = '\n'.join(elem['items'])
@@ -2516,8 +3465,7 @@ class VisualDesigner:
                                                initialvalue=items_str,
                                                parent=root)
                 if result is not None:
-                    elem['items'] = [x.strip() for x in result.split('\n') if x.strip()]
-                    self.unsaved = True
+                    elem['items'] = _split_entries(result, _LINES_RE)
 
             elif 'score' in elem:
                 result = simpledialog.askinteger("Edit Score", "Score (0-100):",
@@ -2526,237 +3474,112 @@ class VisualDesigner:
                                                 parent=root)
                 if result is not None:
                     elem['score'] = result
-                    self.unsaved = True
 
-            root.destroy()
-            self._refresh_all()
+            # OK-through without a change leaves the element and display as they were
+            if elem != old:
+                self.unsaved = True
+                self._refresh_all()
 
-        except Exception as e:
-            print(f"Edit error: {e}")
+        except Exception:
+            log.exception("Edit error")
 
     def _edit_property(self, prop_name, elem):
         """Edit a specific property - handles all property types"""
         try:
-            root = Tk()
-            root.withdraw()
-            result = None
-
-            # Position properties
-            if prop_name in ('x', 'y'):
-                pos = elem.get('position', {'x': 50, 'y': 50})
-                result = simpledialog.askinteger(f"Edit {prop_name.upper()}",
-                                                f"{prop_name} (0-100):",
-                                                initialvalue=int(pos[prop_name]),
-                                                minvalue=0, maxvalue=100,
-                                                parent=root)
-                if result is not None:
-                    if 'position' not in elem:
-                        elem['position'] = {'x': 50, 'y': 50}
-                    elem['position'][prop_name] = result
-                    self.unsaved = True
-
-            # Start position properties (for arrows, particle_flow)
-            elif prop_name == 'start_x':
-                start = elem.get('start', {'x': 30, 'y': 50})
-                result = simpledialog.askinteger("Edit Start X", "start_x (0-100):",
-                                                initialvalue=int(start['x']),
-                                                minvalue=0, maxvalue=100, parent=root)
-                if result is not None:
-                    if 'start' not in elem:
-                        elem['start'] = {'x': 30, 'y': 50}
-                    elem['start']['x'] = result
-                    self.unsaved = True
-
-            elif prop_name == 'start_y':
-                start = elem.get('start', {'x': 30, 'y': 50})
-                result = simpledialog.askinteger("Edit Start Y", "start_y (0-100):",
-                                                initialvalue=int(start['y']),
-                                                minvalue=0, maxvalue=100, parent=root)
-                if result is not None:
-                    if 'start' not in elem:
-                        elem['start'] = {'x': 30, 'y': 50}
-                    elem['start']['y'] = result
-                    self.unsaved = True
-
-            # End position properties
-            elif prop_name == 'end_x':
-                end = elem.get('end', {'x': 70, 'y': 50})
-                result = simpledialog.askinteger("Edit End X", "end_x (0-100):",
-                                                initialvalue=int(end['x']),
-                                                minvalue=0, maxvalue=100, parent=root)
-                if result is not None:
-                    if 'end' not in elem:
-                        elem['end'] = {'x': 70, 'y': 50}
-                    elem['end']['x'] = result
-                    self.unsaved = True
-
-            elif prop_name == 'end_y':
-                end = elem.get('end', {'x': 70, 'y': 50})
-                result = simpledialog.askinteger("Edit End Y", "end_y (0-100):",
-                                                initialvalue=int(end['y']),
-                                                minvalue=0, maxvalue=100, parent=root)
-                if result is not None:
-                    if 'end' not in elem:
-                        elem['end'] = {'x': 70, 'y': 50}
-                    elem['end']['y'] = result
-                    self.unsaved = True
-
-            # Size properties
-            elif prop_name in ('width', 'height', 'radius'):
-                result = simpledialog.askinteger(f"Edit {prop_name}",
-                                                f"{prop_name} (1-100):",
-                                                initialvalue=int(elem.get(prop_name, 20)),
-                                                minvalue=1, maxvalue=100, parent=root)
-                if result is not None:
-                    elem[prop_name] = result
-                    self.unsaved = True
-
-            # String properties
-            elif prop_name in ('content', 'title', 'code', 'input_text', 'label', 'output'):
-                current = elem.get(prop_name, '')
-                result = simpledialog.askstring(f"Edit {prop_name}", f"{prop_name}:",
-                                               initialvalue=current, parent=root)
-                if result is not None:
-                    elem[prop_name] = result
-                    self.unsaved = True
+            # Dialogs run their own event loop; keep it from drawing a half-applied edit
+            with self._batched():
+                spec = _EDIT_SPECS.get(prop_name)
+                if spec is not None and self._ask_by_spec(spec, elem, prop_name,
+                                                          self._get_dialog_root()):
+                    self._refresh_all()
+
+        except Exception:
+            log.exception("Edit error")
+
+    def _ask_by_spec(self, spec, elem, prop_name, root):
+        """Run the edit dialog (or toggle) an _EDIT_SPECS entry describes; True if it changed elem"""
+        kind, container, key, default = spec[:4]
+        if container:
+            current = elem.get(container, default)[key]
+        else:
+            current = elem.get(key, default)
+
+        if kind == 'list':
+            # The list editor applies its result itself, even when OK leaves it as it was
+            before = _clone(current)
+            self._edit_list_property(elem, prop_name, root)
+            changed = elem.get(key, default) != before
+            if changed:
+                self.unsaved = True
+            return changed
+
+        result = self._edit_askers[kind](current, spec, root)
+        if result is None or result == current:
+            return False
+        if container:
+            if container not in elem:
+                elem[container] = dict(default)
+            elem[container][key] = result
+        else:
+            elem[key] = result
+        self.unsaved = True
+        return True
 
-            # Numeric properties
-            elif prop_name == 'score':
-                result = simpledialog.askinteger("Edit Score", "Score (0-100):",
-                                                initialvalue=elem.get('score', 75),
-                                                minvalue=0, maxvalue=100, parent=root)
-                if result is not None:
-                    elem['score'] = result
-                    self.unsaved = True
+    # Edit askers, one per EditSpec kind: (current, spec, root) -> new value, or None
+    # to leave the element unchanged
+    def _ask_int(self, current, spec, root):
+        low, high = spec.bounds
+        return simpledialog.askinteger(*spec.prompts, initialvalue=int(current),
+                                      minvalue=low, maxvalue=high, parent=root)
 
-            elif prop_name == 'num_particles':
-                result = simpledialog.askinteger("Edit Particles", "num_particles (5-100):",
-                                                initialvalue=elem.get('num_particles', 15),
-                                                minvalue=5, maxvalue=100, parent=root)
-                if result is not None:
-                    elem['num_particles'] = result
-                    self.unsaved = True
+    def _ask_float(self, current, spec, root):
+        return simpledialog.askfloat(*spec.prompts, initialvalue=current, parent=root)
 
-            elif prop_name == 'arc_height':
-                result = simpledialog.askinteger("Edit Arc Height", "arc_height (1-50):",
-                                                initialvalue=elem.get('arc_height', 10),
-                                                minvalue=1, maxvalue=50, parent=root)
-                if result is not None:
-                    elem['arc_height'] = result
-                    self.unsaved = True
+    def _ask_string(self, current, spec, root):
+        return simpledialog.askstring(*spec.prompts, initialvalue=current, parent=root)
 
-            elif prop_name in ('current', 'total'):
-                result = simpledialog.askinteger(f"Edit {prop_name}", f"{prop_name} (0-1000):",
-                                                initialvalue=elem.get(prop_name, 10),
-                                                minvalue=0, maxvalue=1000, parent=root)
-                if result is not None:
-                    elem[prop_name] = result
-                    self.unsaved = True
-
-            # Float properties
-            elif prop_name in ('current_value', 'min_value', 'max_value', 'spacing',
-                               'cursor_blink_rate', 'spread', 'camera_elev', 'camera_azim'):
-                result = simpledialog.askfloat(f"Edit {prop_name}", f"{prop_name}:",
-                                              initialvalue=elem.get(prop_name, 0.5),
-                                              parent=root)
-                if result is not None:
-                    elem[prop_name] = result
-                    self.unsaved = True
-
-            # More integer properties
-            elif prop_name in ('columns', 'rows', 'cell_width', 'cell_height',
-                               'fontsize', 'base_width', 'box_height', 'particle_size'):
-                result = simpledialog.askinteger(f"Edit {prop_name}", f"{prop_name}:",
-                                                initialvalue=int(elem.get(prop_name, 10)),
-                                                minvalue=1, maxvalue=200, parent=root)
-                if result is not None:
-                    elem[prop_name] = result
-                    self.unsaved = True
+    def _toggle_bool(self, current, spec, root):
+        return not current
 
-            # More string properties
-            elif prop_name in ('left_title', 'right_title', 'language', 'bullet_char'):
-                result = simpledialog.askstring(f"Edit {prop_name}", f"{prop_name}:",
-                                               initialvalue=elem.get(prop_name, ''),
-                                               parent=root)
-                if result is not None:
-                    elem[prop_name] = result
-                    self.unsaved = True
-
-            # Boolean properties (toggle)
-            elif prop_name in ('show_cursor', 'stagger', 'show_connections', 'show_values',
-                               'show_embeddings', 'rotate_camera'):
-                current = elem.get(prop_name, True)
-                elem[prop_name] = not current
-                self.unsaved = True
-
-            # Choice properties (cycle through options)
-            elif prop_name == 'orientation':
-                current = elem.get('orientation', 'horizontal')
-                elem['orientation'] = 'vertical' if current == 'horizontal' else 'horizontal'
-                self.unsaved = True
-
-            elif prop_name == 'direction':
-                current = elem.get('direction', 'up')
-                elem['direction'] = 'down' if current == 'up' else 'up'
-                self.unsaved = True
+    def _cycle_choice(self, current, spec, root):
+        # Anything but the first option cycles back to it
+        first, second = spec.bounds
+        return second if current == first else first
 
-            # List properties - open list editor
-            elif prop_name in ('items', 'steps', 'events', 'messages', 'models',
-                               'tokens_x', 'before_weights', 'after_weights',
-                               'points', 'vectors', 'comparison_rows'):
-                self._edit_list_property(elem, prop_name, root)
-
-            # Neural network layers
-            elif prop_name == 'layers':
-                layers = elem.get('layers', [3, 5, 5, 2])
-                layers_str = ','.join(map(str, layers))
-                result = simpledialog.askstring("Edit Layers",
-                                               "Layer sizes (comma-separated):\ne.g. 3,5,5,2",
-                                               initialvalue=layers_str, parent=root)
-                if result is not None:
-                    try:
-                        new_layers = [int(x.strip()) for x in result.split(',') if x.strip()]
-                        if new_layers:
-                            elem['layers'] = new_layers
-                            self.unsaved = True
-                    except ValueError:
-                        pass
-
-            root.destroy()
-            self._refresh_all()
-
-        except Exception as e:
-            print(f"Edit error: {e}")
+    def _ask_layers(self, current, spec, root):
+        result = simpledialog.askstring("Edit Layers",
+                                       "Layer sizes (comma-separated):\ne.g. 3,5,5,2",
+                                       initialvalue=','.join(map(str, current)), parent=root)
+        if result is None:
+            return None
+        return _parse_numbers(result, int) or None
 
     def _edit_list_property(self, elem, prop_name, root):
         """Edit list-type properties with appropriate dialog"""
         current = elem.get(prop_name, [])
 
         if prop_name == 'items':
-            # Simple string list
-            if isinstance(current, list) and all(isinstance(x, str) for x in current):
-                items_str = '\n'.join(current)
+            # Simple string list; lists are homogeneous, so the first item tells string
+            # items from the dict items of grid and stacked_boxes
+            if isinstance(current, list) and (not current or isinstance(current[0], str)):
+                items_str = '\n'.join(map(str, current))
             else:
                 items_str = ''
             result = simpledialog.askstring(f"Edit {prop_name}",
                                            "Items (one per line):",
                                            initialvalue=items_str, parent=root)
             if result is not None:
-                elem[prop_name] = [x.strip() for x in result.split('\n') if x.strip()]
-                self.unsaved = True
+                elem[prop_name] = _split_entries(result, _LINES_RE)
 
-        elif prop_name in ('before_weights', 'after_weights'):
+        elif prop_name in _WEIGHT_PROPS:
             # Float list
             weights_str = ','.join(map(str, current)) if current else '0.5,0.3,0.8'
             result = simpledialog.askstring(f"Edit {prop_name}",
                                            "Weights (comma-separated, 0-1):",
                                            initialvalue=weights_str, parent=root)
-            if result is not None:
-                try:
-                    elem[prop_name] = [float(x.strip()) for x in result.split(',') if x.strip()]
-                    self.unsaved = True
-                except ValueError:
-                    pass
+            weights = _parse_numbers(result) if result is not None else None
+            if weights is not None:
+                elem[prop_name] = weights
 
         elif prop_name == 'tokens_x':
             # Token list
@@ -2765,10 +3588,9 @@ class VisualDesigner:
                                            "Tokens (comma-separated):",
                                            initialvalue=tokens_str, parent=root)
             if result is not None:
-                elem[prop_name] = [x.strip() for x in result.split(',') if x.strip()]
+                elem[prop_name] = _split_entries(result, _CSV_RE)
                 # Also update tokens_y to match
                 elem['tokens_y'] = elem[prop_name]
-                self.unsaved = True
 
         elif prop_name == 'points':
             # 3D points - show simplified editor
@@ -2778,16 +3600,12 @@ class VisualDesigner:
                                             initialvalue=pts_count, minvalue=0, maxvalue=50,
                                             parent=root)
             if result is not None and result != pts_count:
-                # Generate sample points
-                import numpy as np
+                # Generate sample points, all coordinates in one draw
+                coords = np.random.uniform(-3, 3, size=(result, 3)).tolist()
                 elem[prop_name] = [
-                    {'x': np.random.uniform(-3, 3),
-                     'y': np.random.uniform(-3, 3),
-                     'z': np.random.uniform(-3, 3),
-                     'label': f'P{i}'}
-                    for i in range(result)
+                    {'x': px, 'y': py, 'z': pz, 'label': f'P{i}'}
+                    for i, (px, py, pz) in enumerate(coords)
                 ]
-                self.unsaved = True
 
         elif prop_name == 'vectors':
             # 3D vectors - show simplified editor
@@ -2797,17 +3615,12 @@ class VisualDesigner:
                                             initialvalue=vecs_count, minvalue=0, maxvalue=20,
                                             parent=root)
             if result is not None and result != vecs_count:
-                import numpy as np
-                colors = ['primary', 'secondary', 'accent', 'warning', 'success']
+                coords = np.random.uniform(-2, 2, size=(result, 3)).tolist()
                 elem[prop_name] = [
-                    {'x': np.random.uniform(-2, 2),
-                     'y': np.random.uniform(-2, 2),
-                     'z': np.random.uniform(-2, 2),
-                     'label': f'V{i}',
-                     'color': colors[i % len(colors)]}
-                    for i in range(result)
+                    {'x': vx, 'y': vy, 'z': vz, 'label': f'V{i}',
+                     'color': _VECTOR_COLORS[i % len(_VECTOR_COLORS)]}
+                    for i, (vx, vy, vz) in enumerate(coords)
                 ]
-                self.unsaved = True
 
         elif prop_name == 'steps':
             # Flow steps
@@ -2816,8 +3629,7 @@ class VisualDesigner:
                                            "Steps (one per line):",
                                            initialvalue=steps_str, parent=root)
             if result is not None:
-                elem[prop_name] = [{'label': x.strip()} for x in result.split('\n') if x.strip()]
-                self.unsaved = True
+                elem[prop_name] = [{'label': x} for x in _split_entries(result, _LINES_RE)]
 
         else:
             # Generic message for complex list types
@@ -2827,41 +3639,33 @@ class VisualDesigner:
                                parent=root)
 
     def _set_phase(self, phase):
-        if self.selected_element is not None:
-            elements = self._get_current_elements()
-            if self.selected_element < len(elements):
-                elements[self.selected_element]['animation_phase'] = phase
-                self.unsaved = True
-                self._draw_right_panel()
-                self.fig.canvas.draw_idle()
+        elem = self._selected_elem
+        if elem is not None:
+            elem['animation_phase'] = phase
+            self.unsaved = True
+            self._schedule_redraw('right')
 
     def _set_easing(self, easing):
-        if self.selected_element is not None:
-            elements = self._get_current_elements()
-            if self.selected_element < len(elements):
-                elements[self.selected_element]['easing'] = easing
-                self.unsaved = True
-                self._draw_right_panel()
-                self.fig.canvas.draw_idle()
+        elem = self._selected_elem
+        if elem is not None:
+            elem['easing'] = easing
+            self.unsaved = True
+            self._schedule_redraw('right')
 
     def _set_effect(self, effect):
-        if self.selected_element is not None:
-            elements = self._get_current_elements()
-            if self.selected_element < len(elements):
-                elements[self.selected_element]['continuous_effect'] = effect
-                self.unsaved = True
-                self._draw_right_panel()
-                self.fig.canvas.draw_idle()
+        elem = self._selected_elem
+        if elem is not None:
+            elem['continuous_effect'] = effect
+            self.unsaved = True
+            self._schedule_redraw('right')
 
     def _set_timing_prop(self, prop_name, value):
         """Set a timing property (duration, delay, speed)"""
-        if self.selected_element is not None:
-            elements = self._get_current_elements()
-            if self.selected_element < len(elements):
-                elements[self.selected_element][prop_name] = value
-                self.unsaved = True
-                self._draw_right_panel()
-                self.fig.canvas.draw_idle()
+        elem = self._selected_elem
+        if elem is not None:
+            elem[prop_name] = value
+            self.unsaved = True
+            self._schedule_redraw('right')
 
     def _edit_property_by_index(self, prop_name, elem_idx):
         """Edit property using element index for persistence"""
@@ -2875,6 +3679,7 @@ class VisualDesigner:
         idx = len(self.schema.steps) + 1
         self.schema.steps.append(Step(name=f"Step {idx}", title=f"New Step {idx}", elements=[]))
         self.current_step = len(self.schema.steps) - 1
+        self._sync_current_elements()
         self.selected_element = None
         self.unsaved = True
         self._refresh_all()
@@ -2885,6 +3690,7 @@ class VisualDesigner:
         del self.schema.steps[self.current_step]
         if self.current_step >= len(self.schema.steps):
             self.current_step = len(self.schema.steps) - 1
+        self._sync_current_elements()
         self.selected_element = None
         self.unsaved = True
         self._refresh_all()
@@ -2892,81 +3698,101 @@ class VisualDesigner:
     def _next_step(self):
         if self.current_step < len(self.schema.steps) - 1:
             self.current_step += 1
+            self._sync_current_elements()
             self.selected_element = None
             self._refresh_all()
 
     def _prev_step(self):
         if self.current_step > 0:
             self.current_step -= 1
+            self._sync_current_elements()
             self.selected_element = None
             self._refresh_all()
 
     # File operations
     def _new_file(self):
-        self.schema = self._create_empty_schema()
-        self.schema_path = "schemas/new_presentation.json"
-        self.current_step = 0
-        self.selected_element = None
-        self.unsaved = False
-        self.undo_stack.clear()
-        self.redo_stack.clear()
-        if not self.schema.steps:
-            self.schema.steps.append(Step(name="Step 1", title="New Step", elements=[]))
-        self._refresh_all()
+        with self._batched():
+            self.schema = self._create_empty_schema()
+            self.schema_path = "schemas/new_presentation.json"
+            self.current_step = 0
+            self.selected_element = None
+            self.unsaved = False
+            self.undo_stack.clear()
+            self.redo_stack.clear()
+            if not self.schema.steps:
+                self.schema.steps.append(Step(name="Step 1", title="New Step", elements=[]))
+            self._sync_current_elements()
+            self._refresh_all()
 
     def _open_file(self):
         try:
-            root = Tk()
-            root.withdraw()
-            root.attributes('-topmost', True)
-
-            path = filedialog.askopenfilename(
-                title="Open Presentation",
-                initialdir="schemas",
-                filetypes=[("JSON", "*.json"), ("All", "*.*")]
-            )
-            root.destroy()
-
-            if path:
-                self.schema = PresentationSchema.from_file(path)
-                self.schema_path = path
-                self.current_step = 0
-                self.selected_element = None
-                self.unsaved = False
-                self.undo_stack.clear()
-                self.redo_stack.clear()
-                if not self.schema.steps:
-                    self.schema.steps.append(Step(name="Step 1", title="New Step", elements=[]))
-                self._refresh_all()
-        except Exception as e:
-            print(f"Open error: {e}")
+            with self._batched():
+                root = self._get_dialog_root()
+
+                path = filedialog.askopenfilename(
+                    title="Open Presentation",
+                    initialdir="schemas",
+                    filetypes=[("JSON", "*.json"), ("All", "*.*")],
+                    parent=root
+                )
+
+                if path:
+                    self.schema = PresentationSchema.from_file(path)
+                    self.schema_path = path
+                    self.current_step = 0
+                    self.selected_element = None
+                    self.unsaved = False
+                    self.undo_stack.clear()
+                    self.redo_stack.clear()
+                    if not self.schema.steps:
+                        self.schema.steps.append(Step(name="Step 1", title="New Step", elements=[]))
+                    self._sync_current_elements()
+                    self._refresh_all()
+        except Exception:
+            log.exception("Open error")
 
     def _save(self):
         try:
-            Path(self.schema_path).parent.mkdir(exist_ok=True)
-            self.schema.to_file(self.schema_path)
+            path = Path(self.schema_path)
+            data = self.schema.to_json()
+            saved = (self.schema_path, hashlib.blake2b(data.encode('utf-8')).digest())
+            # Skip the write when the file already holds exactly this JSON
+            if saved != self._saved_digest or not path.exists():
+                if path.parent not in self._ensured_dirs:
+                    path.parent.mkdir(parents=True, exist_ok=True)
+                    self._ensured_dirs.add(path.parent)
+                path.write_text(data, encoding='utf-8')
+                self._saved_digest = saved
+                log.info("Saved: %s", self.schema_path)
             self.unsaved = False
-            print(f"Saved: {self.schema_path}")
-        except Exception as e:
-            print(f"Save error: {e}")
+        except Exception:
+            # The directory may have been removed behind our back
+            self._ensured_dirs.clear()
+            log.exception("Save error")
 
     def _generate(self):
         try:
             self._save()
-            from tools.generator import PresentationGenerator
             output = Path('presentations') / f"{self.schema.name}_presentation.py"
             PresentationGenerator(self.schema).to_file(str(output))
-            print(f"Generated: {output}")
-        except Exception as e:
-            print(f"Generate error: {e}")
+            log.info("Generated: %s", output)
+        except Exception:
+            log.exception("Generate error")
 
     def _quit(self):
         if self.unsaved:
-            print("Unsaved changes! Press Q again to quit.")
+            log.warning("Unsaved changes! Press Q again to quit.")
             self.unsaved = False
             return
         if self.preview_fig:
+            self._preview_alive = False
             plt.close(self.preview_fig)
+        if self._dialog_root is not None:
+            try:
+                self._dialog_root.destroy()
+            except TclError:
+                pass
+            self._dialog_root = None
         plt.close(self.fig)
 
     def show(self):
@@ -2979,6 +3805,7 @@ def main():
     parser.add_argument('schema', nargs='?', help="JSON schema to edit")
     parser.add_argument('--new', '-n', help="Create new with name")
     args = parser.parse_args()
+    logging.basicConfig(level=logging.INFO, format='%(message)s')
 
     path = f"schemas/{args.new}.json" if args.new else args.schema
     VisualDesigner(path).show()